@@ -1,16 +1,36 @@
 from __future__ import annotations
 
 import argparse
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timezone
+import gzip
+import hashlib
+from itertools import accumulate
 import json
 import os
 from pathlib import Path
 import re
+import subprocess
+import tempfile
 from collections import Counter
-from typing import Any
-
-import torch
-import whisperx
+from typing import Any, Callable, Iterator
+
+try:
+    from meetingctl.transcript_json import (
+        TRANSCRIPT_JSON_FORMATS,
+        TRANSCRIPT_NDJSON_FORMAT,
+        load_transcript_json,
+        transcript_json_suffix,
+    )
+except ImportError:
+    # The sidecar image has no meetingctl install; the Dockerfile copies the shared
+    # transcript_json module next to this script instead.
+    from transcript_json import (  # type: ignore[no-redef]
+        TRANSCRIPT_JSON_FORMATS,
+        TRANSCRIPT_NDJSON_FORMAT,
+        load_transcript_json,
+        transcript_json_suffix,
+    )
 
 
 def _now_utc_iso() -> str:
@@ -68,28 +88,28 @@ def _normalize_speaker(value: Any) -> str:
     return text
 
 
-def _append_token(text: str, token: str) -> str:
+def _token_piece(token: str, *, first: bool) -> str:
+    """Text to append for ``token``: leading-space tokens keep their spacing, punctuation
+    and contractions attach to the previous word, and everything else gets one space."""
     raw = str(token or "")
-    if not raw:
-        return text
     stripped = raw.strip()
     if not stripped:
-        return text
-    if not text:
+        return ""
+    if first:
         return stripped
     if raw.startswith(" "):
-        return f"{text}{raw}"
-    if re.match(r"^[,.;:!?%)}\]]", stripped):
-        return f"{text}{stripped}"
-    if stripped.startswith("'"):
-        return f"{text}{stripped}"
-    return f"{text} {stripped}"
+        return raw
+    if stripped[0] in ",.;:!?%)}]'":
+        return stripped
+    return f" {stripped}"
 
 
-def _build_turn_lines(
-    result: dict[str, Any], *, max_gap_seconds: float, max_turn_duration_seconds: float
-) -> list[str]:
-    items: list[dict[str, Any]] = []
+def _transcript_rows(result: dict[str, Any]) -> Iterator[tuple[str, float, float, str]]:
+    """Yield ``(speaker, start, end, token)`` per timed word, or per segment without words.
+
+    Rows are produced lazily from the transcript dict, so turn building never holds a
+    second copy of the words.
+    """
     for segment in result.get("segments", []) or []:
         if not isinstance(segment, dict):
             continue
@@ -111,68 +131,52 @@ def _build_turn_lines(
                     continue
                 if end is None or end < start:
                     end = start
-                items.append({"speaker": speaker, "start": start, "end": end, "token": token})
+                yield speaker, start, end, token
             continue
 
         text = str(segment.get("text") or "").strip()
         if not text or seg_start is None:
             continue
-        items.append(
-            {
-                "speaker": seg_speaker,
-                "start": seg_start,
-                "end": seg_end if seg_end is not None else seg_start,
-                "token": text,
-            }
-        )
+        yield seg_speaker, seg_start, seg_end if seg_end is not None else seg_start, text
 
-    # Only switch to turn formatting if at least one non-UNKNOWN label exists.
-    if not items or not any(item["speaker"] != "UNKNOWN" for item in items):
-        return []
 
-    turns: list[dict[str, Any]] = []
-    current: dict[str, Any] | None = None
+def _build_turn_lines(
+    result: dict[str, Any], *, max_gap_seconds: float, max_turn_duration_seconds: float
+) -> list[str]:
+    # Turns are [speaker, start, end, pieces] rows; each turn's text is joined once.
+    turns: list[list[Any]] = []
+    current: list[Any] | None = None
+    labelled = False
     max_gap = max(max_gap_seconds, 0.0)
-    for item in items:
-        speaker = str(item["speaker"])
-        start = float(item["start"])
-        end = float(item["end"])
-        token = str(item["token"])
-
-        if current is None:
-            current = {"speaker": speaker, "start": start, "end": end, "text": ""}
-            current["text"] = _append_token(str(current["text"]), token)
-            continue
-
-        gap = start - float(current["end"])
-        speaker_changed = speaker != str(current["speaker"])
-        duration_exceeded = (
-            max_turn_duration_seconds > 0
-            and (end - float(current["start"])) > max_turn_duration_seconds
-        )
-        if speaker_changed or gap > max_gap or duration_exceeded:
-            text = str(current.get("text", "")).strip()
-            if text:
+    for speaker, start, end, token in _transcript_rows(result):
+        labelled = labelled or speaker != "UNKNOWN"
+        if current is not None:
+            gap = start - current[2]
+            speaker_changed = speaker != current[0]
+            duration_exceeded = max_turn_duration_seconds > 0 and (end - current[1]) > max_turn_duration_seconds
+            if speaker_changed or gap > max_gap or duration_exceeded:
                 turns.append(current)
-            current = {"speaker": speaker, "start": start, "end": end, "text": ""}
-
-        current["end"] = max(float(current["end"]), end)
-        current["text"] = _append_token(str(current["text"]), token)
+                current = None
+        if current is None:
+            current = [speaker, start, end, []]
+        elif end > current[2]:
+            current[2] = end
+        piece = _token_piece(token, first=not current[3])
+        if piece:
+            current[3].append(piece)
 
+    # Only switch to turn formatting if at least one non-UNKNOWN label exists.
+    if not labelled:
+        return []
     if current is not None:
-        text = str(current.get("text", "")).strip()
-        if text:
-            turns.append(current)
+        turns.append(current)
 
     lines: list[str] = []
-    for turn in turns:
-        start = _format_seconds(_coerce_float(turn.get("start")))
-        end = _format_seconds(_coerce_float(turn.get("end"), _coerce_float(turn.get("start"))))
-        speaker = _normalize_speaker(turn.get("speaker"))
-        text = str(turn.get("text") or "").strip()
+    for speaker, start, end, pieces in turns:
+        text = "".join(pieces).strip()
         if not text:
             continue
-        lines.append(f"[{start}-{end}] {speaker}: {text}")
+        lines.append(f"[{_format_seconds(start)}-{_format_seconds(end)}] {speaker}: {text}")
     return lines
 
 
@@ -234,6 +238,27 @@ def _build_srt_lines(result: dict[str, Any]) -> list[str]:
     return lines
 
 
+def _write_transcript_json(path: Path, result: dict[str, Any], *, json_format: str, compress: bool) -> None:
+    """Write the transcript as indented JSON, minified JSON, or NDJSON (header line, then
+    one segment per line), optionally gzip-compressed. Callers name the file with
+    ``transcript_json_suffix`` so the suffix matches the bytes."""
+    if json_format == "ndjson":
+        header = {key: value for key, value in result.items() if key != "segments"}
+        header = {"format": TRANSCRIPT_NDJSON_FORMAT, **header}
+        lines = [json.dumps(header, ensure_ascii=False, separators=(",", ":"), default=_json_default)]
+        for segment in result.get("segments", []) or []:
+            lines.append(json.dumps(segment, ensure_ascii=False, separators=(",", ":"), default=_json_default))
+        text = "\n".join(lines) + "\n"
+    elif json_format == "compact":
+        text = json.dumps(result, ensure_ascii=False, separators=(",", ":"), default=_json_default)
+    else:
+        text = json.dumps(result, ensure_ascii=False, indent=2, default=_json_default)
+    data = text.encode("utf-8")
+    if compress:
+        data = gzip.compress(data, compresslevel=6)
+    path.write_bytes(data)
+
+
 def _resolve_token() -> str:
     for name in ("PYANNOTE_AUTH_TOKEN", "HF_TOKEN", "HUGGINGFACE_TOKEN"):
         value = os.environ.get(name, "").strip()
@@ -320,7 +345,14 @@ def _configure_hf_client() -> None:
         pass
 
 
+# Resolved HF snapshot directories per (model, cache roots). Only hits are kept, so a model
+# downloaded mid-run is found on the next lookup.
+_SNAPSHOT_CACHE: dict[tuple[str, tuple[Path, ...]], Path] = {}
+
+
 def _load_align_model(result: dict[str, Any], device: str) -> tuple[Any, dict[str, Any]] | tuple[None, None]:
+    import whisperx
+
     language = str(result.get("language") or "").strip()
     if not language:
         return None, None
@@ -331,6 +363,69 @@ def _load_align_model(result: dict[str, Any], device: str) -> tuple[Any, dict[st
     return model, metadata
 
 
+def _audio_scratch_dir(default: Path | None) -> Path | None:
+    raw = os.environ.get("WHISPERX_AUDIO_SCRATCH_DIR", "").strip()
+    if raw:
+        return Path(raw).expanduser()
+    return default
+
+
+def _load_audio_memmap(input_path: Path, *, sample_rate: int = 16000, scratch_dir: Path | None = None) -> Any:
+    """Decode audio like ``whisperx.load_audio`` but into a float32 file mapped from disk.
+
+    PCM is streamed from ffmpeg in blocks, so decoding never holds more than one block in
+    anonymous memory and the mapped pages can be evicted under memory pressure. The scratch
+    file goes to ``WHISPERX_AUDIO_SCRATCH_DIR`` or ``scratch_dir`` (the job directory), not
+    the system temp dir, which is often a small tmpfs. It is unlinked once mapped, or on
+    failure; the mapping keeps it alive until the array is released.
+    """
+    import numpy as np
+
+    cmd = [
+        "ffmpeg",
+        "-nostdin",
+        "-threads",
+        "0",
+        "-i",
+        str(input_path),
+        "-f",
+        "s16le",
+        "-ac",
+        "1",
+        "-acodec",
+        "pcm_s16le",
+        "-ar",
+        str(sample_rate),
+        "-",
+    ]
+    scratch = _audio_scratch_dir(scratch_dir)
+    if scratch is not None:
+        scratch.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(prefix="diarize_pcm_", suffix=".f32", dir=scratch, delete=False) as sink:
+        pcm_path = Path(sink.name)
+    try:
+        # ffmpeg logs to a temp file so a chatty stderr cannot fill its pipe and stall stdout.
+        with tempfile.TemporaryFile() as stderr, pcm_path.open("wb") as sink:
+            with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr) as proc:
+                pending = b""
+                for block in iter(lambda: proc.stdout.read(1 << 22), b""):
+                    block = pending + block
+                    usable = len(block) - (len(block) % 2)
+                    pending = block[usable:]
+                    samples = np.frombuffer(block[:usable], np.int16).astype(np.float32) / 32768.0
+                    sink.write(samples.tobytes())
+            if proc.returncode != 0:
+                stderr.seek(0)
+                detail = stderr.read().decode("utf-8", errors="replace").strip()[-2000:]
+                raise RuntimeError(f"Failed to load audio: {detail}")
+        if pcm_path.stat().st_size == 0:
+            return np.zeros(0, dtype=np.float32)
+        # Copy-on-write keeps the array writable for torch without touching the file.
+        return np.memmap(pcm_path, dtype=np.float32, mode="c")
+    finally:
+        pcm_path.unlink(missing_ok=True)
+
+
 def _diarization_model_list(raw: str) -> list[str]:
     defaults = "pyannote/speaker-diarization-3.1,pyannote/speaker-diarization"
     value = (raw or defaults).strip()
@@ -350,6 +445,18 @@ def _resolve_cached_model_snapshot(model_name: str) -> Path | None:
         path = Path(model_name).expanduser()
         return path if path.exists() else None
 
+    roots = _hf_cache_roots()
+    key = (model_name, tuple(roots))
+    cached = _SNAPSHOT_CACHE.get(key)
+    if cached is not None:
+        return cached
+    snapshot = _find_cached_model_snapshot(model_name, roots)
+    if snapshot is not None:
+        _SNAPSHOT_CACHE[key] = snapshot
+    return snapshot
+
+
+def _hf_cache_roots() -> list[Path]:
     roots: list[Path] = []
     for env_name in ("HF_HOME", "WHISPERX_DOWNLOAD_ROOT"):
         raw = os.environ.get(env_name, "").strip()
@@ -361,7 +468,10 @@ def _resolve_cached_model_snapshot(model_name: str) -> Path | None:
     default_root = Path.home() / ".cache" / "huggingface"
     if default_root not in roots:
         roots.append(default_root)
+    return roots
+
 
+def _find_cached_model_snapshot(model_name: str, roots: list[Path]) -> Path | None:
     repo_dir_name = f"models--{model_name.replace('/', '--')}"
     for root in roots:
         hub_root = root / "hub" if (root / "hub").exists() else root
@@ -389,6 +499,26 @@ def _resolve_cached_model_snapshot(model_name: str) -> Path | None:
     return None
 
 
+def _cut_linkage_tree(tree: Any, n_clusters: int) -> Any:
+    """Flat labels from a scipy linkage matrix after undoing its last ``n_clusters - 1`` merges."""
+    import numpy as np
+
+    leaves = tree.shape[0] + 1
+    kept_merges = leaves - n_clusters
+    parent = np.arange(2 * leaves - 1, dtype=np.int64)
+    children = tree[:kept_merges, :2].astype(np.int64)
+    parent[children[:, 0]] = leaves + np.arange(kept_merges)
+    parent[children[:, 1]] = leaves + np.arange(kept_merges)
+    # Pointer jumping: each pass doubles how far up the kept merges a node resolves.
+    while True:
+        hopped = parent[parent]
+        if np.array_equal(hopped, parent):
+            break
+        parent = hopped
+    _, labels = np.unique(parent[:leaves], return_inverse=True)
+    return labels
+
+
 def _cluster_embeddings(
     embeddings: Any,
     *,
@@ -397,27 +527,25 @@ def _cluster_embeddings(
     distance_threshold: float,
 ) -> Any:
     import numpy as np
-    from sklearn.cluster import AgglomerativeClustering
+    from scipy.cluster.hierarchy import linkage
+    from scipy.spatial.distance import pdist
     from sklearn.metrics import silhouette_score
+    from sklearn.metrics.pairwise import cosine_distances
 
     sample_count = len(embeddings)
     if sample_count <= 1:
         return [0] * sample_count
 
+    # One average-linkage cosine tree serves every cut below; this is the same tree
+    # AgglomerativeClustering(linkage="average", metric="cosine") builds on each fit.
+    tree = linkage(pdist(embeddings, metric="cosine"), method="average")
+
     def fit_labels(*, n_clusters: int | None = None, threshold: float | None = None) -> Any:
-        kwargs: dict[str, Any] = {"linkage": "average"}
         if n_clusters is None:
-            kwargs["n_clusters"] = None
-            kwargs["distance_threshold"] = max(float(threshold or 0.01), 0.01)
-        else:
-            kwargs["n_clusters"] = max(1, min(int(n_clusters), sample_count))
-
-        try:
-            clusterer = AgglomerativeClustering(metric="cosine", **kwargs)
-        except TypeError:
-            # Older sklearn uses `affinity` instead of `metric`.
-            clusterer = AgglomerativeClustering(affinity="cosine", **kwargs)
-        return clusterer.fit_predict(embeddings)
+            merge_distances = tree[:, 2]
+            n_clusters = int(np.count_nonzero(merge_distances >= max(float(threshold or 0.01), 0.01))) + 1
+        n_clusters = max(1, min(int(n_clusters), sample_count))
+        return _cut_linkage_tree(tree, n_clusters)
 
     fixed_n: int | None = None
     if min_speakers is not None and max_speakers is not None and min_speakers == max_speakers:
@@ -464,6 +592,7 @@ def _cluster_embeddings(
         if sample_count > score_sample_max:
             score_indices = np.linspace(0, sample_count - 1, num=score_sample_max, dtype=int)
             score_embeddings = score_embeddings[score_indices]
+        score_distances = cosine_distances(score_embeddings)
 
         best_labels: Any | None = None
         best_silhouette = -1.0
@@ -481,7 +610,7 @@ def _cluster_embeddings(
             if len(set(int(x) for x in score_labels.tolist())) <= 1:
                 continue
             try:
-                sil = float(silhouette_score(score_embeddings, score_labels, metric="cosine"))
+                sil = float(silhouette_score(score_distances, score_labels, metric="precomputed"))
             except Exception:
                 continue
 
@@ -498,15 +627,289 @@ def _cluster_embeddings(
     return fit_labels(n_clusters=None, threshold=distance_threshold)
 
 
+def _frame_audio(
+    audio_array: Any,
+    *,
+    window_samples: int,
+    hop_samples: int,
+    min_samples: int,
+) -> tuple[Any, Any]:
+    """Return a strided (windows, samples) view over the audio plus window start offsets."""
+    import numpy as np
+
+    frame_length = min(window_samples, audio_array.size)
+    if frame_length < min_samples:
+        return np.empty((0, max(frame_length, 0)), dtype=np.float32), np.empty(0, dtype=np.int64)
+    view = np.lib.stride_tricks.sliding_window_view(audio_array, frame_length)
+    stop = max(audio_array.size - window_samples + 1, 1)
+    # Basic slicing keeps the frames a view; fancy indexing would copy every window.
+    return view[:stop:hop_samples], np.arange(0, stop, hop_samples, dtype=np.int64)
+
+
+def _frame_rms(frames: Any, *, batch_windows: int) -> Any:
+    import numpy as np
+
+    rms = np.empty(frames.shape[0], dtype=np.float64)
+    for offset in range(0, frames.shape[0], batch_windows):
+        batch = frames[offset : offset + batch_windows]
+        rms[offset : offset + batch.shape[0]] = np.sqrt(
+            np.mean(batch**2, axis=1).astype(np.float64) + 1e-12
+        )
+    return rms
+
+
+def _frame_embeddings(
+    frames: Any,
+    frame_rms: Any,
+    indices: Any,
+    *,
+    mfcc: Any,
+    sample_rate: int,
+    batch_windows: int,
+) -> Any:
+    """Compute normalized MFCC + prosody embeddings for the selected windows in bounded batches."""
+    import numpy as np
+    import torch
+
+    freqs = np.fft.rfftfreq(frames.shape[1], d=1.0 / sample_rate)
+    batches: list[Any] = []
+    for offset in range(0, len(indices), batch_windows):
+        batch_indices = indices[offset : offset + batch_windows]
+        chunk = np.ascontiguousarray(frames[batch_indices], dtype=np.float32)
+        # Keep a singleton channel axis so MFCC's top_db clamp stays per window, not per batch.
+        with torch.inference_mode():
+            coeffs = mfcc(torch.from_numpy(chunk).unsqueeze(1)).squeeze(1).detach().cpu().numpy()
+        if coeffs.ndim != 3 or coeffs.shape[2] == 0:
+            continue
+        mean = np.mean(coeffs, axis=2)
+        std = np.std(coeffs, axis=2)
+        delta_1 = np.diff(coeffs, axis=2)
+        delta_2 = np.diff(delta_1, axis=2) if delta_1.shape[2] > 1 else delta_1
+        delta_1_mean = np.mean(np.abs(delta_1), axis=2)
+        delta_2_mean = np.mean(np.abs(delta_2), axis=2)
+
+        zcr = np.mean(np.abs(np.diff(np.sign(chunk), axis=1)), axis=1) / 2.0
+        spectrum = np.abs(np.fft.rfft(chunk, axis=1))
+        centroid = np.sum(freqs * spectrum, axis=1) / np.maximum(np.sum(spectrum, axis=1), 1e-9)
+        centroid_norm = centroid / (sample_rate / 2.0)
+        log_rms = np.log(np.maximum(frame_rms[batch_indices], 1e-8))
+        prosody = np.stack([log_rms, zcr, centroid_norm], axis=1).astype(np.float32)
+
+        emb = np.concatenate([mean, std, delta_1_mean, delta_2_mean, prosody], axis=1)
+        norms = np.linalg.norm(emb, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        batches.append(emb / norms)
+    if not batches:
+        return np.empty((0, 0), dtype=np.float32)
+    return np.vstack(batches)
+
+
+def _speaker_interval_index(windows: list[dict[str, Any]]) -> Callable[[float, float], str]:
+    """Build a bisect-based lookup returning the best-overlapping speaker for an interval.
+
+    Windows must be sorted by start. Ties resolve to the earliest window, and intervals
+    without positive overlap fall back to the window with the nearest center, matching
+    a linear scan over ``windows``.
+    """
+    starts = [float(win["start"]) for win in windows]
+    ends = [float(win["end"]) for win in windows]
+    speakers = [str(win["speaker"]) for win in windows]
+    # Running max keeps the end column bisectable even if a window is nested in its predecessor.
+    reach = list(accumulate(ends, max))
+    centers = [(start + end) / 2.0 for start, end in zip(starts, ends)]
+    centers_sorted = all(centers[idx] <= centers[idx + 1] for idx in range(len(centers) - 1))
+
+    def nearest_by_center(center: float) -> str:
+        if not centers_sorted:
+            nearest = min(range(len(centers)), key=lambda idx: abs(center - centers[idx]))
+            return speakers[nearest]
+        pos = bisect_left(centers, center)
+        best_idx = -1
+        best_distance = float("inf")
+        if pos > 0:
+            best_idx = bisect_left(centers, centers[pos - 1])
+            best_distance = abs(center - centers[best_idx])
+        if pos < len(centers) and abs(center - centers[pos]) < best_distance:
+            best_idx = pos
+        return speakers[best_idx]
+
+    def speaker_for_interval(start: float, end: float) -> str:
+        best_overlap = 0.0
+        best_speaker = "UNKNOWN"
+        for idx in range(bisect_right(reach, start), bisect_left(starts, end)):
+            overlap = min(end, ends[idx]) - max(start, starts[idx])
+            if overlap > best_overlap:
+                best_overlap = overlap
+                best_speaker = speakers[idx]
+        if best_overlap > 0:
+            return best_speaker
+        return nearest_by_center((start + end) / 2.0)
+
+    return speaker_for_interval
+
+
+def _smooth_labels(labels: list[int], span: int) -> list[int]:
+    """Sliding mode filter over window labels.
+
+    Each label becomes the most common label within ``span // 2`` positions. The original
+    label wins ties; otherwise the tied label seen first in the window wins.
+    """
+    import numpy as np
+
+    if span <= 1 or len(labels) < span:
+        return labels
+    radius = span // 2
+    values = np.asarray(labels, dtype=np.int64)
+    pad = int(values.min()) - 1
+    padded = np.concatenate([np.full(radius, pad), values, np.full(radius, pad)])
+    windows = np.lib.stride_tricks.sliding_window_view(padded, 2 * radius + 1)
+    counts = np.sum(windows[:, :, None] == windows[:, None, :], axis=2)
+    counts[windows == pad] = 0
+    best_counts = counts.max(axis=1)
+    first_best = windows[np.arange(values.size), np.argmax(counts == best_counts[:, None], axis=1)]
+    keep_raw = counts[:, radius] == best_counts
+    return np.where(keep_raw, values, first_best).tolist()
+
+
+def _reassign_sparse_speakers(
+    segments: list[dict[str, Any]],
+    *,
+    min_segments_per_speaker: int,
+    min_segment_fraction: float,
+) -> None:
+    """Relabel segments of rarely seen speakers with the nearest dominant-speaker segment."""
+    if min_segments_per_speaker <= 1 or not segments:
+        return
+    speaker_counts = Counter(
+        _normalize_speaker(segment.get("speaker"))
+        for segment in segments
+        if _normalize_speaker(segment.get("speaker")) != "UNKNOWN"
+    )
+    total_labeled_segments = sum(speaker_counts.values())
+    if total_labeled_segments <= 0 or len(speaker_counts) <= 1:
+        return
+    sparse_speakers = {
+        speaker
+        for speaker, count in speaker_counts.items()
+        if count < min_segments_per_speaker or (float(count) / float(total_labeled_segments)) < min_segment_fraction
+    }
+    dominant_speakers = {speaker for speaker in speaker_counts if speaker not in sparse_speakers}
+    if not sparse_speakers or not dominant_speakers:
+        return
+
+    segment_centers: list[float] = []
+    segment_speakers: list[str] = []
+    for segment in segments:
+        seg_start = _coerce_float(segment.get("start"), 0.0) or 0.0
+        seg_end = _coerce_float(segment.get("end"), seg_start) or seg_start
+        if seg_end < seg_start:
+            seg_end = seg_start
+        segment_centers.append((seg_start + seg_end) / 2.0)
+        segment_speakers.append(_normalize_speaker(segment.get("speaker")))
+
+    # Equal distances resolve to the lowest segment index, as the former linear scan did.
+    dominant = sorted(
+        (segment_centers[idx], idx)
+        for idx, speaker in enumerate(segment_speakers)
+        if speaker in dominant_speakers
+    )
+    dominant_centers = [center for center, _ in dominant]
+    fallback_speaker = min(
+        dominant_speakers,
+        key=lambda speaker: (speaker_counts.get(speaker, 0) * -1, speaker),
+    )
+
+    for idx, segment in enumerate(segments):
+        if segment_speakers[idx] not in sparse_speakers:
+            continue
+        center = segment_centers[idx]
+        pos = bisect_left(dominant_centers, center)
+        best_idx: int | None = None
+        best_distance = float("inf")
+        for step, stop in ((-1, -1), (1, len(dominant))):
+            cursor = pos - 1 if step < 0 else pos
+            while cursor != stop:
+                distance = abs(center - dominant_centers[cursor])
+                if distance > best_distance:
+                    break
+                other_idx = dominant[cursor][1]
+                if distance < best_distance or best_idx is None or other_idx < best_idx:
+                    best_distance = distance
+                    best_idx = other_idx
+                cursor += step
+        best_speaker = segment_speakers[best_idx] if best_idx is not None else fallback_speaker
+
+        segment["speaker"] = best_speaker
+        words = segment.get("words")
+        if isinstance(words, list):
+            for word in words:
+                if isinstance(word, dict):
+                    word["speaker"] = best_speaker
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for block in iter(lambda: handle.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _load_feature_cache(path: Path, cache_key: str) -> tuple[Any, Any, Any] | None:
+    """Return cached (embeddings, window starts, window ends) when the key still matches."""
+    import numpy as np
+
+    if not path.is_file():
+        return None
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            if str(data["cache_key"]) != cache_key:
+                return None
+            return data["embeddings"], data["window_starts"], data["window_ends"]
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+def _save_feature_cache(
+    path: Path,
+    cache_key: str,
+    *,
+    embeddings: Any,
+    window_starts: Any,
+    window_ends: Any,
+    window_rms: Any,
+) -> None:
+    import numpy as np
+
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    with tmp_path.open("wb") as handle:
+        np.savez_compressed(
+            handle,
+            cache_key=np.asarray(cache_key),
+            embeddings=np.asarray(embeddings, dtype=np.float32),
+            window_starts=np.asarray(window_starts, dtype=np.float64),
+            window_ends=np.asarray(window_ends, dtype=np.float64),
+            window_rms=np.asarray(window_rms, dtype=np.float64),
+        )
+    os.replace(tmp_path, path)
+
+
 def _assign_segment_speakers_from_embeddings(
     *,
     audio: Any,
     result: dict[str, Any],
     min_speakers: int | None,
     max_speakers: int | None,
+    audio_path: Path | None = None,
+    feature_cache_path: Path | None = None,
 ) -> dict[str, Any]:
+    """Label transcript segments by clustering MFCC window embeddings.
+
+    With ``feature_cache_path`` set, window embeddings are reused from (or saved to) an
+    ``.npz`` keyed by the audio file hash and feature parameters. ``audio`` may then be
+    ``None``; it is only decoded from ``audio_path`` when the cache misses.
+    """
     import numpy as np
-    import torchaudio
 
     segments = result.get("segments", []) or []
     if not isinstance(segments, list) or not segments:
@@ -516,22 +919,7 @@ def _assign_segment_speakers_from_embeddings(
     if distance_threshold is None:
         distance_threshold = 0.08
 
-    mfcc = torchaudio.transforms.MFCC(
-        sample_rate=16000,
-        n_mfcc=24,
-        melkwargs={
-            "n_fft": 400,
-            "hop_length": 160,
-            "n_mels": 48,
-            "center": False,
-        },
-    )
-
     sample_rate = 16000
-    audio_array = np.asarray(audio, dtype=np.float32)
-    if audio_array.size == 0:
-        raise RuntimeError("Empty audio array for fallback diarization")
-
     window_seconds = _coerce_float(os.environ.get("WHISPERX_DIARIZATION_WINDOW_SECONDS"), 1.6) or 1.6
     hop_seconds = _coerce_float(os.environ.get("WHISPERX_DIARIZATION_HOP_SECONDS"), 0.8) or 0.8
     smoothing_span = _coerce_int(os.environ.get("WHISPERX_DIARIZATION_LABEL_SMOOTH_SPAN"), 5) or 5
@@ -543,67 +931,97 @@ def _assign_segment_speakers_from_embeddings(
     hop_samples = max(int(hop_seconds * sample_rate), int(0.4 * sample_rate))
     energy_quantile = _coerce_float(os.environ.get("WHISPERX_DIARIZATION_ENERGY_QUANTILE"), 0.35) or 0.35
     energy_floor = _coerce_float(os.environ.get("WHISPERX_DIARIZATION_ENERGY_FLOOR"), 0.004) or 0.004
+    melkwargs = {
+        "n_fft": 400,
+        "hop_length": 160,
+        "n_mels": 48,
+        "center": False,
+    }
 
-    candidate_windows: list[dict[str, Any]] = []
-    rms_values: list[float] = []
-    for start_idx in range(0, max(audio_array.size - window_samples + 1, 1), hop_samples):
-        end_idx = min(start_idx + window_samples, audio_array.size)
-        if end_idx <= start_idx:
-            continue
-        chunk = audio_array[start_idx:end_idx]
-        if chunk.size < int(0.4 * sample_rate):
-            continue
-        rms = float(np.sqrt(np.mean(chunk**2) + 1e-12))
-        candidate_windows.append(
+    cache_key = ""
+    cached = None
+    if feature_cache_path is not None and audio_path is not None:
+        cache_key = json.dumps(
             {
-                "start": start_idx / sample_rate,
-                "end": end_idx / sample_rate,
-                "chunk": chunk,
-                "rms": rms,
-            }
+                "audio_sha256": _file_sha256(audio_path),
+                "sample_rate": sample_rate,
+                "window_samples": window_samples,
+                "hop_samples": hop_samples,
+                "energy_quantile": energy_quantile,
+                "energy_floor": energy_floor,
+                "n_mfcc": 24,
+                "melkwargs": melkwargs,
+            },
+            sort_keys=True,
         )
-        rms_values.append(rms)
-
-    if not candidate_windows:
-        raise RuntimeError("No candidate windows extracted for fallback diarization")
-
-    dynamic_threshold = float(np.quantile(np.asarray(rms_values, dtype=np.float32), min(max(energy_quantile, 0.0), 1.0)))
-    threshold = max(dynamic_threshold, energy_floor)
-    active_windows = [win for win in candidate_windows if float(win["rms"]) >= threshold]
-    if len(active_windows) < 2:
-        active_windows = sorted(candidate_windows, key=lambda x: float(x["rms"]), reverse=True)[: max(2, len(candidate_windows))]
-
-    embeddings: list[np.ndarray] = []
-    for win in active_windows:
-        waveform = torch.tensor(win["chunk"], dtype=torch.float32).unsqueeze(0)
-        coeffs = mfcc(waveform).squeeze(0).detach().cpu().numpy()
-        if coeffs.ndim != 2 or coeffs.shape[1] == 0:
-            continue
-        mean = np.mean(coeffs, axis=1)
-        std = np.std(coeffs, axis=1)
-        delta_1 = np.diff(coeffs, axis=1)
-        delta_2 = np.diff(delta_1, axis=1) if delta_1.shape[1] > 1 else delta_1
-        delta_1_mean = np.mean(np.abs(delta_1), axis=1)
-        delta_2_mean = np.mean(np.abs(delta_2), axis=1)
-
-        chunk = np.asarray(win["chunk"], dtype=np.float32)
-        zcr = float(np.mean(np.abs(np.diff(np.sign(chunk)))) / 2.0)
-        spectrum = np.abs(np.fft.rfft(chunk))
-        freqs = np.fft.rfftfreq(chunk.size, d=1.0 / sample_rate)
-        centroid = float(np.sum(freqs * spectrum) / max(np.sum(spectrum), 1e-9))
-        centroid_norm = centroid / (sample_rate / 2.0)
-        prosody = np.asarray([np.log(max(float(win["rms"]), 1e-8)), zcr, centroid_norm], dtype=np.float32)
+        cached = _load_feature_cache(feature_cache_path, cache_key)
+
+    if cached is not None:
+        embeddings, window_starts, window_ends = cached
+    else:
+        import torchaudio
+
+        if audio is None:
+            if audio_path is None:
+                raise RuntimeError("No audio available for fallback diarization")
+            audio = _load_audio_memmap(
+                audio_path, scratch_dir=feature_cache_path.parent if feature_cache_path is not None else None
+            )
 
-        emb = np.concatenate([mean, std, delta_1_mean, delta_2_mean, prosody], axis=0)
-        norm = float(np.linalg.norm(emb))
-        if norm > 0:
-            emb = emb / norm
-        embeddings.append(emb)
+        mfcc = torchaudio.transforms.MFCC(sample_rate=sample_rate, n_mfcc=24, melkwargs=melkwargs)
+        audio_array = np.asarray(audio, dtype=np.float32)
+        if audio_array.size == 0:
+            raise RuntimeError("Empty audio array for fallback diarization")
 
-    if len(embeddings) == 0:
-        raise RuntimeError("Unable to extract MFCC embeddings for fallback diarization")
+        feature_batch_windows = (
+            _coerce_int(os.environ.get("WHISPERX_DIARIZATION_FEATURE_BATCH_WINDOWS"), 256) or 256
+        )
+        feature_batch_windows = max(feature_batch_windows, 1)
+
+        frames, frame_starts = _frame_audio(
+            audio_array,
+            window_samples=window_samples,
+            hop_samples=hop_samples,
+            min_samples=int(0.4 * sample_rate),
+        )
+        if frames.shape[0] == 0:
+            raise RuntimeError("No candidate windows extracted for fallback diarization")
+        frame_rms = _frame_rms(frames, batch_windows=feature_batch_windows)
+        frame_length = frames.shape[1]
+
+        dynamic_threshold = float(np.quantile(frame_rms.astype(np.float32), min(max(energy_quantile, 0.0), 1.0)))
+        threshold = max(dynamic_threshold, energy_floor)
+        active_indices = np.flatnonzero(frame_rms >= threshold)
+        if active_indices.size < 2:
+            active_indices = np.argsort(-frame_rms, kind="stable")[: max(2, frame_rms.size)]
+
+        embeddings = _frame_embeddings(
+            frames,
+            frame_rms,
+            active_indices,
+            mfcc=mfcc,
+            sample_rate=sample_rate,
+            batch_windows=feature_batch_windows,
+        )
+        if len(embeddings) == 0:
+            raise RuntimeError("Unable to extract MFCC embeddings for fallback diarization")
+        window_starts = frame_starts[active_indices] / sample_rate
+        window_ends = (frame_starts[active_indices] + frame_length) / sample_rate
+        if cache_key and feature_cache_path is not None:
+            _save_feature_cache(
+                feature_cache_path,
+                cache_key,
+                embeddings=embeddings,
+                window_starts=window_starts,
+                window_ends=window_ends,
+                window_rms=frame_rms[active_indices],
+            )
+
+    active_windows = [
+        {"start": start, "end": end} for start, end in zip(window_starts.tolist(), window_ends.tolist())
+    ]
 
-    emb_matrix = np.vstack(embeddings)
+    emb_matrix = embeddings
     labels = _cluster_embeddings(
         emb_matrix,
         min_speakers=min_speakers,
@@ -612,26 +1030,7 @@ def _assign_segment_speakers_from_embeddings(
     )
     labels = [int(x) for x in list(labels)]
 
-    if smoothing_span > 1 and len(labels) >= smoothing_span:
-        radius = smoothing_span // 2
-        smoothed_labels: list[int] = []
-        for idx, raw_label in enumerate(labels):
-            start = max(0, idx - radius)
-            end = min(len(labels), idx + radius + 1)
-            window = labels[start:end]
-            counts: dict[int, int] = {}
-            for item in window:
-                counts[item] = counts.get(item, 0) + 1
-            best_label = raw_label
-            best_count = -1
-            for item, count in counts.items():
-                if count > best_count:
-                    best_label = item
-                    best_count = count
-                elif count == best_count and item == raw_label:
-                    best_label = item
-            smoothed_labels.append(best_label)
-        labels = smoothed_labels
+    labels = _smooth_labels(labels, smoothing_span)
 
     label_map: dict[Any, str] = {}
     for raw_label in labels:
@@ -661,19 +1060,7 @@ def _assign_segment_speakers_from_embeddings(
         else:
             merged_windows.append(win.copy())
 
-    def speaker_for_interval(start: float, end: float) -> str:
-        best_overlap = 0.0
-        best_speaker = "UNKNOWN"
-        for win in merged_windows:
-            overlap = min(end, float(win["end"])) - max(start, float(win["start"]))
-            if overlap > best_overlap:
-                best_overlap = overlap
-                best_speaker = str(win["speaker"])
-        if best_overlap > 0:
-            return best_speaker
-        center = (start + end) / 2.0
-        nearest = min(merged_windows, key=lambda x: abs(center - ((float(x["start"]) + float(x["end"])) / 2.0)))
-        return str(nearest["speaker"])
+    speaker_for_interval = _speaker_interval_index(merged_windows)
 
     segments_for_cleanup: list[dict[str, Any]] = []
     for segment in segments:
@@ -700,58 +1087,11 @@ def _assign_segment_speakers_from_embeddings(
     min_segment_fraction = (
         _coerce_float(os.environ.get("WHISPERX_DIARIZATION_MIN_SEGMENT_SPEAKER_FRACTION"), 0.03) or 0.03
     )
-    if min_segments_per_speaker > 1 and segments_for_cleanup:
-        speaker_counts = Counter(
-            _normalize_speaker(segment.get("speaker"))
-            for segment in segments_for_cleanup
-            if _normalize_speaker(segment.get("speaker")) != "UNKNOWN"
-        )
-        total_labeled_segments = sum(speaker_counts.values())
-        if total_labeled_segments > 0 and len(speaker_counts) > 1:
-            sparse_speakers = {
-                speaker
-                for speaker, count in speaker_counts.items()
-                if count < min_segments_per_speaker or (float(count) / float(total_labeled_segments)) < min_segment_fraction
-            }
-            dominant_speakers = {speaker for speaker in speaker_counts if speaker not in sparse_speakers}
-            if sparse_speakers and dominant_speakers:
-                segment_centers: list[float] = []
-                segment_speakers: list[str] = []
-                for segment in segments_for_cleanup:
-                    seg_start = _coerce_float(segment.get("start"), 0.0) or 0.0
-                    seg_end = _coerce_float(segment.get("end"), seg_start) or seg_start
-                    if seg_end < seg_start:
-                        seg_end = seg_start
-                    segment_centers.append((seg_start + seg_end) / 2.0)
-                    segment_speakers.append(_normalize_speaker(segment.get("speaker")))
-
-                for idx, segment in enumerate(segments_for_cleanup):
-                    current_speaker = _normalize_speaker(segment.get("speaker"))
-                    if current_speaker not in sparse_speakers:
-                        continue
-
-                    center = segment_centers[idx]
-                    best_speaker = None
-                    best_distance = float("inf")
-                    for other_idx, other_speaker in enumerate(segment_speakers):
-                        if other_idx == idx or other_speaker not in dominant_speakers:
-                            continue
-                        distance = abs(center - segment_centers[other_idx])
-                        if distance < best_distance:
-                            best_distance = distance
-                            best_speaker = other_speaker
-                    if best_speaker is None:
-                        best_speaker = min(
-                            dominant_speakers,
-                            key=lambda speaker: (speaker_counts.get(speaker, 0) * -1, speaker),
-                        )
-
-                    segment["speaker"] = best_speaker
-                    words = segment.get("words")
-                    if isinstance(words, list):
-                        for word in words:
-                            if isinstance(word, dict):
-                                word["speaker"] = best_speaker
+    _reassign_sparse_speakers(
+        segments_for_cleanup,
+        min_segments_per_speaker=min_segments_per_speaker,
+        min_segment_fraction=min_segment_fraction,
+    )
 
     return result
 
@@ -768,7 +1108,10 @@ def _diarize(
     max_speakers: int | None,
     allow_embedding_fallback: bool,
     require_pyannote: bool,
+    feature_cache_path: Path | None = None,
 ) -> tuple[dict[str, Any], str, list[str]]:
+    import whisperx
+
     errors: list[str] = []
     kwargs: dict[str, Any] = {}
     if min_speakers is not None:
@@ -812,6 +1155,8 @@ def _diarize(
                 result=result,
                 min_speakers=min_speakers,
                 max_speakers=max_speakers,
+                audio_path=audio_path,
+                feature_cache_path=feature_cache_path,
             )
             return assigned, "segment-embedding", errors
         except Exception as exc:
@@ -821,7 +1166,23 @@ def _diarize(
     raise RuntimeError(detail)
 
 
+def _limit_cpu_threads(threads: int) -> None:
+    # OpenMP/BLAS read these when their pools start, so set them before torch/numpy load.
+    for name in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS"):
+        os.environ[name] = str(threads)
+    import torch
+
+    torch.set_num_threads(threads)
+
+
 def run(args: argparse.Namespace) -> int:
+    cpu_threads = max(args.threads, 0)
+    if cpu_threads:
+        _limit_cpu_threads(cpu_threads)
+
+    import torch
+    import whisperx
+
     offline_mode = args.offline or _env_truthy("WHISPERX_OFFLINE_MODE")
     _configure_offline_mode(offline_mode)
     _configure_hf_client()
@@ -834,6 +1195,8 @@ def run(args: argparse.Namespace) -> int:
     output_root.mkdir(parents=True, exist_ok=True)
 
     job_id = args.job_id.strip()
+    if args.recluster_only and not job_id:
+        raise RuntimeError("--recluster-only requires --job-id of an existing sidecar job")
     if not job_id:
         stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         base = _sanitize(args.meeting_id.strip() or input_path.stem)
@@ -848,16 +1211,45 @@ def run(args: argparse.Namespace) -> int:
     if device == "cpu" and compute_type == "float16":
         compute_type = "int8"
 
-    audio = whisperx.load_audio(str(input_path))
+    feature_cache_raw = os.environ.get("WHISPERX_DIARIZATION_FEATURE_CACHE", "1").strip().lower()
+    feature_cache_path: Path | None = None
+    if feature_cache_raw not in {"0", "false", "no", "off"}:
+        feature_cache_path = job_dir / "embeddings.npz"
+
+    transcript_json_arg = args.transcript_json
+    if args.recluster_only:
+        if feature_cache_path is None:
+            raise RuntimeError("--recluster-only requires WHISPERX_DIARIZATION_FEATURE_CACHE to be enabled")
+        if args.no_diarization or args.require_pyannote:
+            raise RuntimeError("--recluster-only only reruns embedding-fallback diarization")
+        if not transcript_json_arg:
+            previous = [
+                job_dir / f"transcript_diarized{transcript_json_suffix(json_format, compress=compress)}"
+                for json_format in ("pretty", "ndjson")
+                for compress in (False, True)
+            ]
+            transcript_json_arg = str(next((path for path in previous if path.exists()), previous[0]))
+
+    stream_audio_raw = os.environ.get("WHISPERX_STREAM_AUDIO", "1").strip().lower()
+    stream_audio = stream_audio_raw not in {"0", "false", "no", "off"}
+
+    # Re-clustering decodes audio only if the embedding cache misses.
+    audio: Any = None
+    if not args.recluster_only:
+        if stream_audio:
+            audio = _load_audio_memmap(input_path, scratch_dir=job_dir)
+        else:
+            audio = whisperx.load_audio(str(input_path))
     transcript_source = "sidecar_asr"
     transcript_json_input_path = ""
-    if args.transcript_json:
-        transcript_json_path = Path(args.transcript_json).expanduser().resolve()
+    if transcript_json_arg:
+        transcript_json_path = Path(transcript_json_arg).expanduser().resolve()
         if not transcript_json_path.exists():
             raise FileNotFoundError(f"Input transcript JSON does not exist: {transcript_json_path}")
-        payload = json.loads(transcript_json_path.read_text(encoding="utf-8"))
-        if not isinstance(payload, dict):
-            raise RuntimeError(f"Transcript JSON root must be an object: {transcript_json_path}")
+        try:
+            payload = load_transcript_json(transcript_json_path)
+        except ValueError as exc:
+            raise RuntimeError(str(exc)) from exc
         segments = payload.get("segments")
         if not isinstance(segments, list) or not segments:
             raise RuntimeError(f"Transcript JSON has no segments: {transcript_json_path}")
@@ -866,6 +1258,9 @@ def run(args: argparse.Namespace) -> int:
         transcript_json_input_path = str(transcript_json_path)
     else:
         download_root = os.environ.get("WHISPERX_DOWNLOAD_ROOT", "").strip() or os.environ.get("HF_HOME", "").strip() or None
+        model_kwargs: dict[str, Any] = {}
+        if cpu_threads:
+            model_kwargs["threads"] = cpu_threads
         model = whisperx.load_model(
             args.model,
             device=device,
@@ -873,6 +1268,7 @@ def run(args: argparse.Namespace) -> int:
             language=args.language.strip() or None,
             download_root=download_root,
             local_files_only=offline_mode,
+            **model_kwargs,
         )
 
         result = model.transcribe(
@@ -887,7 +1283,7 @@ def run(args: argparse.Namespace) -> int:
         if isinstance(words, list) and words:
             has_word_timestamps = True
             break
-    if not has_word_timestamps:
+    if not has_word_timestamps and not args.recluster_only:
         if args.language.strip() and not str(result.get("language") or "").strip():
             result["language"] = args.language.strip()
         align_model, metadata = _load_align_model(result, device)
@@ -911,7 +1307,22 @@ def run(args: argparse.Namespace) -> int:
     require_pyannote = args.require_pyannote or _env_truthy("WHISPERX_DIARIZATION_REQUIRE_PYANNOTE")
     allow_embedding_fallback = embedding_fallback_default and not args.no_embedding_fallback and not require_pyannote
 
-    if diarization_enabled:
+    if diarization_enabled and args.recluster_only:
+        try:
+            result = _assign_segment_speakers_from_embeddings(
+                audio=audio,
+                result=result,
+                min_speakers=args.min_speakers,
+                max_speakers=args.max_speakers,
+                audio_path=input_path,
+                feature_cache_path=feature_cache_path,
+            )
+            diarization_backend = "segment-embedding"
+        except Exception as exc:
+            diarization_error = str(exc)
+            if not args.allow_transcript_without_diarization:
+                raise
+    elif diarization_enabled:
         try:
             result, diarization_backend, diarization_attempt_errors = _diarize(
                 audio=audio,
@@ -924,6 +1335,7 @@ def run(args: argparse.Namespace) -> int:
                 max_speakers=args.max_speakers,
                 allow_embedding_fallback=allow_embedding_fallback,
                 require_pyannote=require_pyannote,
+                feature_cache_path=feature_cache_path,
             )
         except Exception as exc:
             diarization_error = str(exc)
@@ -932,7 +1344,7 @@ def run(args: argparse.Namespace) -> int:
 
     txt_path = job_dir / "transcript_diarized.txt"
     srt_path = job_dir / "transcript_diarized.srt"
-    json_path = job_dir / "transcript_diarized.json"
+    json_path = job_dir / f"transcript_diarized{transcript_json_suffix(args.json_format, compress=args.json_gzip)}"
     manifest_path = job_dir / "manifest.json"
 
     turn_max_gap = _coerce_float(args.turn_max_gap_seconds, 1.5) or 1.5
@@ -950,7 +1362,7 @@ def run(args: argparse.Namespace) -> int:
 
     txt_path.write_text("\n".join(txt_lines).strip() + "\n", encoding="utf-8")
     srt_path.write_text("\n".join(_build_srt_lines(result)).strip() + "\n", encoding="utf-8")
-    json_path.write_text(json.dumps(result, ensure_ascii=False, indent=2, default=_json_default), encoding="utf-8")
+    _write_transcript_json(json_path, result, json_format=args.json_format, compress=args.json_gzip)
 
     manifest = {
         "job_id": job_id,
@@ -960,6 +1372,8 @@ def run(args: argparse.Namespace) -> int:
         "transcript_txt": str(txt_path),
         "transcript_srt": str(srt_path),
         "transcript_json": str(json_path),
+        "transcript_json_format": args.json_format,
+        "transcript_json_gzip": bool(args.json_gzip),
         "created_at": _now_utc_iso(),
         "device": device,
         "model": args.model,
@@ -975,6 +1389,9 @@ def run(args: argparse.Namespace) -> int:
         "diarization_models": diarization_models,
         "require_pyannote": require_pyannote,
         "embedding_fallback_enabled": allow_embedding_fallback,
+        "recluster_only": bool(args.recluster_only),
+        "cpu_threads": cpu_threads,
+        "feature_cache": str(feature_cache_path) if feature_cache_path is not None and feature_cache_path.exists() else "",
     }
     manifest_path.write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8")
 
@@ -1001,6 +1418,12 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--compute-type", default=os.environ.get("WHISPERX_COMPUTE_TYPE", "int8"))
     parser.add_argument("--batch-size", type=int, default=int(os.environ.get("WHISPERX_BATCH_SIZE", "8")))
     parser.add_argument("--language", default=os.environ.get("WHISPERX_LANGUAGE", ""))
+    parser.add_argument(
+        "--threads",
+        type=int,
+        default=int(os.environ.get("WHISPERX_CPU_THREADS", "0") or "0"),
+        help="Cap torch/OpenMP/CTranslate2 CPU threads for this job (0 = library defaults)",
+    )
     parser.add_argument(
         "--offline",
         action="store_true",
@@ -1038,7 +1461,24 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Require pyannote backend; fail diarization instead of falling back to segment embeddings",
     )
+    parser.add_argument(
+        "--json-format",
+        choices=TRANSCRIPT_JSON_FORMATS,
+        default=os.environ.get("WHISPERX_TRANSCRIPT_JSON_FORMAT", "pretty").strip().lower() or "pretty",
+        help="Transcript JSON layout: indented, minified, or NDJSON (one segment per line, written as .ndjson)",
+    )
+    parser.add_argument(
+        "--json-gzip",
+        action="store_true",
+        default=_env_truthy("WHISPERX_TRANSCRIPT_JSON_GZIP"),
+        help="Gzip the transcript JSON (written as .json.gz/.ndjson.gz; the vault copy is plain JSON)",
+    )
     parser.add_argument("--no-diarization", action="store_true")
+    parser.add_argument(
+        "--recluster-only",
+        action="store_true",
+        help="Rerun fallback clustering/assignment for --job-id from its cached embeddings and transcript JSON",
+    )
     parser.add_argument(
         "--allow-transcript-without-diarization",
         action="store_true",
@@ -3,16 +3,17 @@ from __future__ import annotations
 
 import argparse
 from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import UTC, datetime
 import json
 import os
 from pathlib import Path
 import re
-import shutil
 import subprocess
 from typing import Any
 
 from meetingctl.note.service import create_backfill_note_for_recording
+from meetingctl.transcription import load_transcript_json, promote_artifact, promote_transcript_json
 
 ROOT = Path(__file__).resolve().parents[1]
 _AUDIO_TIMESTAMP_PATTERNS = (
@@ -62,6 +63,54 @@ def _now_stamp() -> str:
     return datetime.now(UTC).strftime("%Y%m%dT%H%M%SZ")
 
 
+def _now_iso() -> str:
+    return datetime.now(UTC).isoformat()
+
+
+def _append_progress(progress_path: Path, record: dict[str, Any]) -> None:
+    # One open/append per record so a crash or Ctrl-C keeps every finished item on disk.
+    with progress_path.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps(record) + "\n")
+
+
+def _read_progress_items(progress_path: Path) -> list[dict[str, Any]]:
+    items: list[dict[str, Any]] = []
+    for line in progress_path.read_text(encoding="utf-8").splitlines():
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            # A run killed mid-write can leave a truncated final line.
+            continue
+        if isinstance(record, dict) and record.get("event") == "item" and isinstance(record.get("item"), dict):
+            items.append(record["item"])
+    return items
+
+
+_RETRYABLE_SKIP_ERRORS = frozenset({"missing existing transcript JSON"})
+
+
+def _load_resume_items(report_path: Path) -> dict[str, dict[str, Any]]:
+    if not report_path.exists():
+        raise ValueError(f"Resume report does not exist: {report_path}")
+    if report_path.suffix == ".ndjson":
+        rows = _read_progress_items(report_path)
+    else:
+        rows = json.loads(report_path.read_text(encoding="utf-8")).get("results", [])
+    finished: dict[str, dict[str, Any]] = {}
+    for row in rows:
+        if not isinstance(row, dict):
+            continue
+        audio_path = str(row.get("audio_path", ""))
+        # Failed sidecar runs, dry-run placeholders and skips that a later run can clear (the
+        # transcript JSON may exist by now) are retried; other skips and real runs are final.
+        retry_skip = row.get("error") in _RETRYABLE_SKIP_ERRORS
+        if (row.get("skipped") and not retry_skip) or isinstance(row.get("manifest"), dict):
+            finished[audio_path] = row
+        else:
+            finished.pop(audio_path, None)
+    return finished
+
+
 def _collapse_recording_variants(paths: list[Path]) -> list[Path]:
     families: dict[str, list[Path]] = {}
     for path in paths:
@@ -311,8 +360,14 @@ def _resolve_existing_transcript_json(vault_path: Path, meeting_id: str) -> Path
         artifact_dir / f"{meeting_id}.basic.json",
     ]
     for candidate in candidates:
-        if candidate.exists():
-            return candidate.resolve()
+        if not candidate.exists():
+            continue
+        # Pretty, minified, NDJSON and gzip transcripts are all accepted; skip unreadable files.
+        try:
+            load_transcript_json(candidate)
+        except (OSError, ValueError):
+            continue
+        return candidate.resolve()
     return None
 
 
@@ -357,8 +412,7 @@ def _promote_diarized_to_active(*, vault_path: Path, meeting_id: str) -> bool:
 def _copy_if_exists(source: Path, target: Path) -> bool:
     if not source.exists():
         return False
-    target.parent.mkdir(parents=True, exist_ok=True)
-    shutil.copyfile(source, target)
+    promote_artifact(source, target)
     return True
 
 
@@ -426,6 +480,23 @@ def _audio_duration_seconds(audio_path: Path) -> float | None:
         return None
 
 
+def _run_sidecar_command(cmd: list[str]) -> tuple[int, str]:
+    completed = subprocess.run(cmd, check=False, capture_output=True, text=True)
+    merged_output = "\n".join(
+        part for part in [completed.stdout.strip(), completed.stderr.strip()] if part
+    )
+    return completed.returncode, merged_output
+
+
+def _threads_per_job(*, jobs: int, requested: int) -> int:
+    if requested > 0:
+        return requested
+    if jobs <= 1:
+        return 0
+    # Split cores evenly so concurrent sidecars do not each size torch/OpenMP pools to the host.
+    return max((os.cpu_count() or 1) // jobs, 1)
+
+
 def run(args: argparse.Namespace) -> dict[str, Any]:
     recordings_root = Path(args.recordings_root).expanduser().resolve()
     vault_path = Path(args.vault_path).expanduser().resolve()
@@ -439,7 +510,34 @@ def run(args: argparse.Namespace) -> dict[str, Any]:
     if args.max_files > 0:
         files = files[: args.max_files]
 
+    resume_from = Path(args.resume).expanduser().resolve() if args.resume.strip() else None
+    resumed_items = _load_resume_items(resume_from) if resume_from is not None else {}
+
+    manifests_dir = (ROOT / "shared_data" / "diarization" / "manifests").resolve()
+    manifests_dir.mkdir(parents=True, exist_ok=True)
+    stamp = _now_stamp()
+    report_path = manifests_dir / f"catchup_{stamp}.json"
+    attempt = 1
+    # Runs started within the same second must not append to each other's progress log.
+    while report_path.exists() or report_path.with_suffix(".ndjson").exists():
+        attempt += 1
+        report_path = manifests_dir / f"catchup_{stamp}_{attempt}.json"
+    progress_path = report_path.with_suffix(".ndjson")
+    _append_progress(
+        progress_path,
+        {
+            "event": "start",
+            "at": _now_iso(),
+            "report_path": str(report_path),
+            "resume_from": str(resume_from) if resume_from is not None else "",
+            "dry_run": args.dry_run,
+            "files": [str(path) for path in files],
+        },
+    )
+
     note_audio_index, notes_by_start = _build_note_lookup(vault_path)
+    jobs = max(args.jobs, 1)
+    threads_per_job = _threads_per_job(jobs=jobs, requested=args.threads_per_job)
     results: list[dict[str, Any]] = []
     failed = 0
     skipped = 0
@@ -448,120 +546,19 @@ def run(args: argparse.Namespace) -> dict[str, Any]:
     stopped_early = False
     stop_reason = ""
     stop_action = ""
+    resumed = 0
+    pending: dict[Future[tuple[int, str]], dict[str, Any]] = {}
 
-    for audio_path in files:
-        meeting_id = _find_meeting_id_from_done_marker(audio_path)
-        if not meeting_id:
-            meeting_id = note_audio_index.get(str(audio_path.resolve()), "")
-        if not meeting_id:
-            meeting_id = _find_meeting_id_by_note_start(audio_path, notes_by_start)
-        duration_seconds = _audio_duration_seconds(audio_path)
-        if args.min_duration_seconds > 0 and duration_seconds is not None and duration_seconds < args.min_duration_seconds:
-            item = {
-                "audio_path": str(audio_path),
-                "meeting_id": meeting_id,
-                "audio_duration_seconds": duration_seconds,
-                "command": [],
-                "ok": False,
-                "skipped": True,
-                "copied_to_artifacts": False,
-                "replaced_active": False,
-                "error": f"recording shorter than minimum duration ({duration_seconds:.3f}s < {args.min_duration_seconds}s)",
-            }
-            issue = _classify_issue(error_text=str(item["error"]), skipped=True)
-            item["issue_code"] = issue["code"]
-            item["issue_summary"] = issue["summary"]
-            item["issue_action"] = issue["action"]
-            item["issue_stop_run"] = issue["stop_run"]
-            item["issue_systemic"] = issue["systemic"]
-            skipped += 1
-            results.append(item)
-            continue
-
-        note_path = ""
-        meeting_id, note_path = _ensure_note_for_audio(
-            vault_path=vault_path,
-            audio_path=audio_path,
-            meeting_id=meeting_id,
-        )
-
-        cmd = ["bash", str((ROOT / "scripts" / "diarize_sidecar.sh").resolve()), str(audio_path)]
-        if meeting_id:
-            cmd.extend(["--meeting-id", meeting_id])
-        transcript_json = None
-        if args.prefer_existing_transcript_json:
-            transcript_json = _resolve_existing_transcript_json(vault_path, meeting_id)
-            if transcript_json is not None:
-                cmd.extend(["--transcript-json", str(transcript_json)])
-        if args.require_existing_transcript_json and transcript_json is None:
-            item: dict[str, Any] = {
-                "audio_path": str(audio_path),
-                "meeting_id": meeting_id,
-                "command": cmd,
-                "ok": False,
-                "skipped": True,
-                "copied_to_artifacts": False,
-                "replaced_active": False,
-                "error": "missing existing transcript JSON",
-            }
-            issue = _classify_issue(error_text=str(item["error"]), skipped=True)
-            item["issue_code"] = issue["code"]
-            item["issue_summary"] = issue["summary"]
-            item["issue_action"] = issue["action"]
-            item["issue_stop_run"] = issue["stop_run"]
-            item["issue_systemic"] = issue["systemic"]
-            skipped += 1
-            results.append(item)
-            continue
-        if args.require_pyannote:
-            cmd.append("--require-pyannote")
-        if args.allow_transcript_without_diarization:
-            cmd.append("--allow-transcript-without-diarization")
-
-        item: dict[str, Any] = {
-            "audio_path": str(audio_path),
-            "meeting_id": meeting_id,
-            "note_path": note_path,
-            "audio_duration_seconds": duration_seconds,
-            "transcript_json_used": str(transcript_json) if transcript_json is not None else "",
-            "command": cmd,
-            "ok": False,
-            "skipped": False,
-            "copied_to_artifacts": False,
-            "replaced_active": False,
-            "error": "",
-        }
-
-        existing_diarized = _resolve_existing_diarized_artifacts(vault_path, meeting_id)
-        if existing_diarized is not None:
-            item["ok"] = True
-            item["skipped"] = True
-            item["error"] = "existing diarized artifacts present"
-            issue = _classify_issue(error_text=str(item["error"]), skipped=True)
-            item["issue_code"] = issue["code"]
-            item["issue_summary"] = issue["summary"]
-            item["issue_action"] = issue["action"]
-            item["issue_stop_run"] = issue["stop_run"]
-            item["issue_systemic"] = issue["systemic"]
-            if args.replace_active and meeting_id and _promote_diarized_to_active(vault_path=vault_path, meeting_id=meeting_id):
-                item["replaced_active"] = True
-                replaced += 1
-            skipped += 1
-            results.append(item)
-            continue
-
-        if args.dry_run:
-            item["ok"] = True
-            results.append(item)
-            continue
+    def _record(item: dict[str, Any]) -> None:
+        results.append(item)
+        _append_progress(progress_path, {"event": "item", "at": _now_iso(), "item": item})
 
-        completed = subprocess.run(cmd, check=False, capture_output=True, text=True)
-        merged_output = "\n".join(
-            part for part in [completed.stdout.strip(), completed.stderr.strip()] if part
-        )
+    def _finish(item: dict[str, Any], returncode: int, merged_output: str) -> None:
+        nonlocal failed, copied, replaced, stopped_early, stop_reason, stop_action
+        meeting_id = str(item["meeting_id"])
         manifest = _extract_manifest_from_output(merged_output)
 
-        if completed.returncode != 0 or manifest is None:
+        if returncode != 0 or manifest is None:
             failed += 1
             item["error"] = _match_known_error_snippet(merged_output) or "sidecar run failed"
             issue = _classify_issue(error_text=merged_output or str(item["error"]), skipped=False)
@@ -570,13 +567,11 @@ def run(args: argparse.Namespace) -> dict[str, Any]:
             item["issue_action"] = issue["action"]
             item["issue_stop_run"] = issue["stop_run"]
             item["issue_systemic"] = issue["systemic"]
-            results.append(item)
-            if args.stop_on_systemic_error and issue["stop_run"]:
+            if args.stop_on_systemic_error and issue["stop_run"] and not stopped_early:
                 stopped_early = True
                 stop_reason = issue["summary"]
                 stop_action = issue["action"]
-                break
-            continue
+            return
 
         item["ok"] = True
         item["manifest"] = manifest
@@ -590,7 +585,10 @@ def run(args: argparse.Namespace) -> dict[str, Any]:
 
             copied_txt = _copy_if_exists(transcript_txt, artifact_dir / f"{meeting_id}.diarized.txt")
             copied_srt = _copy_if_exists(transcript_srt, artifact_dir / f"{meeting_id}.diarized.srt")
-            copied_json = _copy_if_exists(transcript_json, artifact_dir / f"{meeting_id}.diarized.json")
+            # NDJSON/gzip job copies are decoded so the vault artifact stays plain JSON.
+            copied_json = transcript_json.exists()
+            if copied_json:
+                promote_transcript_json(transcript_json, artifact_dir / f"{meeting_id}.diarized.json")
             if copied_txt or copied_srt or copied_json:
                 item["copied_to_artifacts"] = True
                 copied += 1
@@ -599,11 +597,152 @@ def run(args: argparse.Namespace) -> dict[str, Any]:
                 item["replaced_active"] = True
                 replaced += 1
 
-        results.append(item)
+    def _collect(*, block: bool) -> None:
+        # Results are applied on the calling thread so counters, note/artifact writes and the
+        # stop decision stay single-threaded; workers only wait on the sidecar subprocess.
+        if not pending:
+            return
+        done, _ = wait(list(pending), timeout=None if block else 0, return_when=FIRST_COMPLETED)
+        for future in done:
+            item = pending.pop(future)
+            returncode, merged_output = future.result()
+            _finish(item, returncode, merged_output)
+            _append_progress(progress_path, {"event": "item", "at": _now_iso(), "item": item})
+
+    executor = ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="diarize-catchup")
+    try:
+        for audio_path in files:
+            _collect(block=False)
+            while len(pending) >= jobs:
+                _collect(block=True)
+            if stopped_early:
+                break
+            previous = resumed_items.get(str(audio_path))
+            if previous is not None:
+                _record({**previous, "resumed": True})
+                resumed += 1
+                if previous.get("skipped"):
+                    skipped += 1
+                if previous.get("copied_to_artifacts"):
+                    copied += 1
+                if previous.get("replaced_active"):
+                    replaced += 1
+                continue
+            meeting_id = _find_meeting_id_from_done_marker(audio_path)
+            if not meeting_id:
+                meeting_id = note_audio_index.get(str(audio_path.resolve()), "")
+            if not meeting_id:
+                meeting_id = _find_meeting_id_by_note_start(audio_path, notes_by_start)
+            duration_seconds = _audio_duration_seconds(audio_path)
+            if args.min_duration_seconds > 0 and duration_seconds is not None and duration_seconds < args.min_duration_seconds:
+                item = {
+                    "audio_path": str(audio_path),
+                    "meeting_id": meeting_id,
+                    "audio_duration_seconds": duration_seconds,
+                    "command": [],
+                    "ok": False,
+                    "skipped": True,
+                    "copied_to_artifacts": False,
+                    "replaced_active": False,
+                    "error": f"recording shorter than minimum duration ({duration_seconds:.3f}s < {args.min_duration_seconds}s)",
+                }
+                issue = _classify_issue(error_text=str(item["error"]), skipped=True)
+                item["issue_code"] = issue["code"]
+                item["issue_summary"] = issue["summary"]
+                item["issue_action"] = issue["action"]
+                item["issue_stop_run"] = issue["stop_run"]
+                item["issue_systemic"] = issue["systemic"]
+                skipped += 1
+                _record(item)
+                continue
+
+            note_path = ""
+            meeting_id, note_path = _ensure_note_for_audio(
+                vault_path=vault_path,
+                audio_path=audio_path,
+                meeting_id=meeting_id,
+            )
+
+            cmd = ["bash", str((ROOT / "scripts" / "diarize_sidecar.sh").resolve()), str(audio_path)]
+            if meeting_id:
+                cmd.extend(["--meeting-id", meeting_id])
+            transcript_json = None
+            if args.prefer_existing_transcript_json:
+                transcript_json = _resolve_existing_transcript_json(vault_path, meeting_id)
+                if transcript_json is not None:
+                    cmd.extend(["--transcript-json", str(transcript_json)])
+            if args.require_existing_transcript_json and transcript_json is None:
+                item: dict[str, Any] = {
+                    "audio_path": str(audio_path),
+                    "meeting_id": meeting_id,
+                    "command": cmd,
+                    "ok": False,
+                    "skipped": True,
+                    "copied_to_artifacts": False,
+                    "replaced_active": False,
+                    "error": "missing existing transcript JSON",
+                }
+                issue = _classify_issue(error_text=str(item["error"]), skipped=True)
+                item["issue_code"] = issue["code"]
+                item["issue_summary"] = issue["summary"]
+                item["issue_action"] = issue["action"]
+                item["issue_stop_run"] = issue["stop_run"]
+                item["issue_systemic"] = issue["systemic"]
+                skipped += 1
+                _record(item)
+                continue
+            if args.require_pyannote:
+                cmd.append("--require-pyannote")
+            if args.allow_transcript_without_diarization:
+                cmd.append("--allow-transcript-without-diarization")
+            if threads_per_job > 0:
+                cmd.extend(["--threads", str(threads_per_job)])
+
+            item: dict[str, Any] = {
+                "audio_path": str(audio_path),
+                "meeting_id": meeting_id,
+                "note_path": note_path,
+                "audio_duration_seconds": duration_seconds,
+                "transcript_json_used": str(transcript_json) if transcript_json is not None else "",
+                "command": cmd,
+                "ok": False,
+                "skipped": False,
+                "copied_to_artifacts": False,
+                "replaced_active": False,
+                "error": "",
+            }
+
+            existing_diarized = _resolve_existing_diarized_artifacts(vault_path, meeting_id)
+            if existing_diarized is not None:
+                item["ok"] = True
+                item["skipped"] = True
+                item["error"] = "existing diarized artifacts present"
+                issue = _classify_issue(error_text=str(item["error"]), skipped=True)
+                item["issue_code"] = issue["code"]
+                item["issue_summary"] = issue["summary"]
+                item["issue_action"] = issue["action"]
+                item["issue_stop_run"] = issue["stop_run"]
+                item["issue_systemic"] = issue["systemic"]
+                if args.replace_active and meeting_id and _promote_diarized_to_active(vault_path=vault_path, meeting_id=meeting_id):
+                    item["replaced_active"] = True
+                    replaced += 1
+                skipped += 1
+                _record(item)
+                continue
+
+            if args.dry_run:
+                item["ok"] = True
+                _record(item)
+                continue
+
+            results.append(item)
+            pending[executor.submit(_run_sidecar_command, cmd)] = item
+
+        while pending:
+            _collect(block=True)
+    finally:
+        executor.shutdown(wait=True)
 
-    manifests_dir = (ROOT / "shared_data" / "diarization" / "manifests").resolve()
-    manifests_dir.mkdir(parents=True, exist_ok=True)
-    report_path = manifests_dir / f"catchup_{_now_stamp()}.json"
     issue_summary = _build_issue_summary(results)
     payload = {
         "recordings_root": str(recordings_root),
@@ -620,16 +759,32 @@ def run(args: argparse.Namespace) -> dict[str, Any]:
         "require_existing_transcript_json": args.require_existing_transcript_json,
         "require_pyannote": args.require_pyannote,
         "stop_on_systemic_error": args.stop_on_systemic_error,
+        "jobs": jobs,
+        "threads_per_job": threads_per_job,
         "stopped_early": stopped_early,
         "remaining_files": max(len(files) - len(results), 0),
         "stop_reason": stop_reason,
         "stop_action": stop_action,
         "dry_run": args.dry_run,
         "report_path": str(report_path),
+        "progress_log": str(progress_path),
+        "resume_from": str(resume_from) if resume_from is not None else "",
+        "resumed": resumed,
         "issue_summary": issue_summary,
         "results": results,
     }
     report_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    _append_progress(
+        progress_path,
+        {
+            "event": "end",
+            "at": _now_iso(),
+            "processed": len(results),
+            "failed": failed,
+            "stopped_early": stopped_early,
+            "stop_reason": stop_reason,
+        },
+    )
     return payload
 
 
@@ -651,6 +806,23 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--allow-transcript-without-diarization", action="store_true")
     parser.add_argument("--stop-on-systemic-error", action="store_true", default=True)
     parser.add_argument("--no-stop-on-systemic-error", action="store_false", dest="stop_on_systemic_error")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of sidecar runs to execute concurrently",
+    )
+    parser.add_argument(
+        "--threads-per-job",
+        type=int,
+        default=0,
+        help="CPU threads per sidecar run (default: cores split evenly across --jobs when > 1)",
+    )
+    parser.add_argument(
+        "--resume",
+        default="",
+        help="Previous catchup_<stamp>.json report or .ndjson progress log; finished items are carried over",
+    )
     parser.add_argument("--dry-run", action="store_true")
     parser.add_argument("--json", action="store_true")
     return parser
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 from datetime import UTC, datetime
 import json
 import os
@@ -33,6 +34,16 @@ def _find_note_for_meeting_id(vault_path: Path, meeting_id: str) -> Path | None:
     return sorted(candidates)[0]
 
 
+def _default_max_concurrency() -> int:
+    raw = os.environ.get("MEETINGCTL_MINUTES_REFRESH_CONCURRENCY", "").strip()
+    if not raw:
+        return 4
+    try:
+        return max(int(raw), 1)
+    except ValueError:
+        return 4
+
+
 def _resolve_meeting_ids(vault_path: Path, meeting_ids: list[str], max_items: int) -> list[str]:
     if meeting_ids:
         resolved = []
@@ -61,7 +72,8 @@ def _resolve_meeting_ids(vault_path: Path, meeting_ids: list[str], max_items: in
 def run(args: argparse.Namespace) -> dict[str, Any]:
     try:
         from meetingctl.note.patcher import patch_note_file
-        from meetingctl.summary_client import generate_summary
+        from meetingctl.summary_cache import default_summary_cache, summary_cache_key
+        from meetingctl.summary_client import agenerate_summary, summary_rate_limiter
         from meetingctl.summary_parser import summary_to_patch_regions
     except ModuleNotFoundError as exc:
         raise RuntimeError(
@@ -72,6 +84,38 @@ def run(args: argparse.Namespace) -> dict[str, Any]:
     artifacts_root = os.environ.get("MEETINGCTL_ARTIFACTS_ROOT", "Meetings/_artifacts").strip() or "Meetings/_artifacts"
     artifacts_base = (vault_path / artifacts_root).resolve()
     api_key = os.environ.get("ANTHROPIC_API_KEY", "")
+    summary_cache = default_summary_cache()
+    max_concurrency = max(args.max_concurrency, 1)
+
+    async def _summarize_pairs(pairs: list[tuple[Path, Path]]) -> list[list[Any]]:
+        # Baseline and diarized summaries for every meeting share one limiter that caps API calls
+        # in flight, map-reduce chunk requests included; identical transcripts in the run are
+        # summarized once and unchanged ones come from the cache.
+        limiter = summary_rate_limiter(max_in_flight=max_concurrency)
+        inflight: dict[str, asyncio.Task[dict[str, Any]]] = {}
+
+        async def _generate(transcript: str, key: str) -> dict[str, Any]:
+            summary = await agenerate_summary(transcript, api_key=api_key, limiter=limiter)
+            if summary_cache is not None:
+                summary_cache.put(key, summary)
+            return summary
+
+        async def _summarize(path: Path) -> dict[str, Any]:
+            transcript = path.read_text(encoding="utf-8", errors="replace")
+            key = summary_cache_key(transcript)
+            cached = summary_cache.get(key) if summary_cache is not None else None
+            if cached is not None:
+                return {**cached, "reused": True}
+            if key not in inflight:
+                inflight[key] = asyncio.ensure_future(_generate(transcript, key))
+            return await inflight[key]
+
+        return await asyncio.gather(
+            *(
+                asyncio.gather(_summarize(baseline), _summarize(diarized), return_exceptions=True)
+                for baseline, diarized in pairs
+            )
+        )
 
     meeting_ids = _resolve_meeting_ids(vault_path, args.meeting_id, args.max_items)
     results: list[dict[str, Any]] = []
@@ -88,12 +132,10 @@ def run(args: argparse.Namespace) -> dict[str, Any]:
         "",
     ]
 
+    candidates: list[tuple[dict[str, Any], Path, Path, Path | None, bool]] = []
     for meeting_id in meeting_ids:
         artifact_dir = artifacts_base / meeting_id
-        baseline_path = artifact_dir / f"{meeting_id}.txt"
-        diarized_path = artifact_dir / f"{meeting_id}.diarized.txt"
         note_path = _find_note_for_meeting_id(vault_path, meeting_id)
-
         item: dict[str, Any] = {
             "meeting_id": meeting_id,
             "artifact_dir": str(artifact_dir),
@@ -102,18 +144,26 @@ def run(args: argparse.Namespace) -> dict[str, Any]:
             "applied": False,
             "error": "",
         }
+        baseline_path = artifact_dir / f"{meeting_id}.txt"
+        diarized_path = artifact_dir / f"{meeting_id}.diarized.txt"
+        ready = baseline_path.exists() and diarized_path.exists() and note_path is not None
+        candidates.append((item, baseline_path, diarized_path, note_path, ready))
+
+    pairs = [(baseline_path, diarized_path) for _, baseline_path, diarized_path, _, ready in candidates if ready]
+    summaries = iter(asyncio.run(_summarize_pairs(pairs)) if pairs else [])
 
-        if not diarized_path.exists() or not baseline_path.exists() or note_path is None:
+    for item, baseline_path, diarized_path, note_path, ready in candidates:
+        meeting_id = item["meeting_id"]
+        if not ready:
             item["error"] = "missing baseline/diarized transcript or note"
             failed += 1
             results.append(item)
             continue
 
-        try:
-            baseline_summary = generate_summary(baseline_path.read_text(encoding="utf-8", errors="replace"), api_key=api_key)
-            diarized_summary = generate_summary(diarized_path.read_text(encoding="utf-8", errors="replace"), api_key=api_key)
-        except Exception as exc:
-            item["error"] = str(exc)
+        baseline_summary, diarized_summary = next(summaries)
+        errors = [str(value) for value in (baseline_summary, diarized_summary) if isinstance(value, BaseException)]
+        if errors:
+            item["error"] = "; ".join(errors)
             failed += 1
             results.append(item)
             continue
@@ -124,6 +174,8 @@ def run(args: argparse.Namespace) -> dict[str, Any]:
         item["diarized_decisions"] = len(diarized_summary.get("decisions", []))
         item["baseline_action_items"] = len(baseline_summary.get("action_items", []))
         item["diarized_action_items"] = len(diarized_summary.get("action_items", []))
+        item["baseline_summary_reused"] = bool(baseline_summary.get("reused", False))
+        item["diarized_summary_reused"] = bool(diarized_summary.get("reused", False))
 
         markdown_lines.append(f"## {meeting_id}")
         markdown_lines.append("")
@@ -188,6 +240,7 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--meeting-id", action="append", default=[])
     parser.add_argument("--max-items", type=int, default=0)
     parser.add_argument("--apply-diarized", action="store_true")
+    parser.add_argument("--max-concurrency", type=int, default=_default_max_concurrency())
     parser.add_argument("--json", action="store_true")
     return parser
 
@@ -13,12 +13,13 @@ fi
 if [[ $# -lt 1 ]]; then
   cat <<USAGE
 Usage: $0 <audio-file> [--meeting-id <id>] [--job-id <job>] [--min-speakers N] [--max-speakers N] [--allow-transcript-without-diarization] [--no-diarization]
-            [--transcript-json <json>]
+            [--transcript-json <json>] [--recluster-only] [--json-format pretty|compact|ndjson] [--json-gzip] [--threads N]
 
 Examples:
   $0 ~/Notes/audio/20260303-0959_Audio.wav --meeting-id m-abc123
   $0 ~/Notes/audio/20260303-0959_Audio.m4a --job-id test_run --allow-transcript-without-diarization
   $0 ~/Notes/audio/20260303-0959_Audio.m4a --transcript-json /path/to/transcript.json
+  $0 ~/Notes/audio/20260303-0959_Audio.m4a --job-id test_run --recluster-only
 USAGE
   exit 2
 fi
@@ -53,17 +53,101 @@ def _status_for_target(*, vault_path: Path, meeting_id: str) -> dict[str, Any]:
     }
 
 
+def _read_progress_records(progress_path: Path, offset: int) -> tuple[list[dict[str, Any]], int]:
+    """Read complete NDJSON records appended after ``offset``; returns them and the new offset."""
+    with progress_path.open("rb") as handle:
+        handle.seek(offset)
+        chunk = handle.read()
+    # Leave a partially written trailing line for the next poll.
+    end = chunk.rfind(b"\n") + 1
+    records: list[dict[str, Any]] = []
+    for line in chunk[:end].splitlines():
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(record, dict):
+            records.append(record)
+    return records, offset + end
+
+
+def _progress_status(row: dict[str, Any] | None) -> str:
+    if row is None:
+        return "pending"
+    if row.get("skipped"):
+        return "skipped"
+    return "completed" if row.get("ok") else "failed"
+
+
 def _write_snapshot(*, snapshot_path: Path, payload: dict[str, Any]) -> None:
     snapshot_path.parent.mkdir(parents=True, exist_ok=True)
     snapshot_path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
 
 
+def _tail_progress_log(*, args: argparse.Namespace, progress_path: Path, output_path: Path) -> int:
+    started_at = _now_iso()
+    offset = 0
+    files: list[str] = []
+    rows: dict[str, dict[str, Any]] = {}
+    run_ended = False
+
+    while True:
+        records, offset = _read_progress_records(progress_path, offset)
+        for record in records:
+            event = record.get("event")
+            if event == "start":
+                files = [str(path) for path in record.get("files", [])]
+            elif event == "item" and isinstance(record.get("item"), dict):
+                rows[str(record["item"].get("audio_path", ""))] = record["item"]
+            elif event == "end":
+                run_ended = True
+
+        targets = files[: args.max_items] if args.max_items > 0 else files
+        items: list[dict[str, Any]] = []
+        for index, audio_path in enumerate(targets, start=1):
+            row = rows.get(audio_path)
+            items.append(
+                {
+                    "index": index,
+                    "audio_path": audio_path,
+                    "meeting_id": str(row.get("meeting_id", "")) if row else "",
+                    "status": _progress_status(row),
+                    "error": str(row.get("error", "")) if row else "",
+                }
+            )
+        completed = sum(1 for item in items if item["status"] != "pending")
+        pending_items = [item for item in items if item["status"] == "pending"]
+        payload = {
+            "started_at": started_at,
+            "polled_at": _now_iso(),
+            "report_path": str(progress_path),
+            "progress_log": str(progress_path),
+            "max_items": args.max_items,
+            "completed": completed,
+            "failed": sum(1 for item in items if item["status"] == "failed"),
+            "total": len(items),
+            "remaining": len(items) - completed,
+            "percent_complete": round((completed / len(items)) * 100, 1) if items else 100.0,
+            "run_ended": run_ended,
+            "next_pending": pending_items[0] if pending_items else {},
+            "items": items,
+        }
+        _write_snapshot(snapshot_path=output_path, payload=payload)
+        if run_ended or (files and completed >= len(items)):
+            break
+        time.sleep(max(args.interval_seconds, 1))
+    return 0
+
+
 def run(args: argparse.Namespace) -> int:
     report_path = Path(args.report_path).expanduser().resolve()
     if not report_path.exists():
         raise FileNotFoundError(f"Report path does not exist: {report_path}")
     vault_path = Path(args.vault_path).expanduser().resolve()
     output_path = Path(args.output_path).expanduser().resolve()
+    if report_path.suffix == ".ndjson":
+        # Catch-up progress logs record each result as it lands; no artifact probing needed.
+        return _tail_progress_log(args=args, progress_path=report_path, output_path=output_path)
     targets = _load_targets(report_path, args.max_items)
     started_at = _now_iso()
 
@@ -101,7 +185,11 @@ def run(args: argparse.Namespace) -> int:
 
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Poll diarization batch progress and write snapshots.")
-    parser.add_argument("--report-path", required=True)
+    parser.add_argument(
+        "--report-path",
+        required=True,
+        help="catchup_<stamp>.json report to poll artifacts for, or catchup_<stamp>.ndjson progress log to tail",
+    )
     parser.add_argument("--vault-path", default=os.environ.get("VAULT_PATH", "~/Notes/notes-vault"))
     parser.add_argument("--max-items", type=int, default=10)
     parser.add_argument("--interval-seconds", type=int, default=900)
@@ -25,7 +25,7 @@ from meetingctl.calendar.service import (
 )
 from meetingctl.config import load_config
 from meetingctl.doctor import run_doctor
-from meetingctl.note.patcher import patch_note_file
+from meetingctl.note.patcher import PatchingError, patch_note_file
 from meetingctl.note.service import (
     create_adhoc_note,
     create_backfill_note_for_recording,
@@ -39,7 +39,15 @@ from meetingctl.process import ProcessContext, run_processing
 from meetingctl.queue_worker import QueueLockError, process_queue_jobs
 from meetingctl.recording import AudioHijackRecorder
 from meetingctl.runtime_state import RuntimeStateStore
-from meetingctl.summary_client import generate_summary
+from meetingctl.summary_batch import (
+    SummaryBatchItem,
+    record_pending_summary,
+    run_summary_batch,
+    summary_batch_poll_seconds,
+    summary_batch_state_file,
+)
+from meetingctl.summary_cache import default_summary_cache, summarize_with_cache, summary_cache_key
+from meetingctl.summary_client import generate_draft_summary, generate_summary, stream_summary
 from meetingctl.summary_parser import SummaryParseError, parse_summary_json, summary_to_patch_regions
 from meetingctl.transcription import TranscriptionRunner, create_transcription_runner
 
@@ -144,6 +152,20 @@ def build_parser() -> argparse.ArgumentParser:
         default=_env_int("MEETINGCTL_MATCH_WINDOW_MINUTES", 30),
     )
     backfill_parser.add_argument("--rename", action="store_true")
+    backfill_parser.add_argument(
+        "--summary-mode",
+        choices=["sync", "batch"],
+        default=_env_str("MEETINGCTL_BACKFILL_SUMMARY_MODE", "sync"),
+        help=(
+            "With --process-now: summarize each recording as it is processed (sync), or submit "
+            "all summaries as one Anthropic Message Batch after transcription (batch)."
+        ),
+    )
+    backfill_parser.add_argument(
+        "--batch-state-file",
+        default="",
+        help="Where batch mode records the in-flight batch so an interrupted run can reattach.",
+    )
     backfill_parser.add_argument("--dry-run", action="store_true")
     backfill_parser.add_argument(
         "--progress",
@@ -521,7 +543,150 @@ def _summary_from_transcript(transcript_path: Path) -> dict[str, object]:
     if fixture:
         return parse_summary_json(fixture)
     api_key = os.environ.get("ANTHROPIC_API_KEY", "")
-    return generate_summary(transcript_path.read_text(), api_key=api_key)
+    usage: dict[str, int] = {}
+    summary = summarize_with_cache(
+        transcript_path.read_text(),
+        generate=lambda transcript: generate_summary(transcript, api_key=api_key, usage=usage),
+        cache=default_summary_cache(),
+    )
+    return {**summary, "usage": usage}
+
+
+def _summary_draft_enabled() -> bool:
+    value = os.environ.get("MEETINGCTL_SUMMARY_DRAFT", "0").strip().lower()
+    return value not in {"", "0", "false", "no"}
+
+
+def _draft_summary_from_transcript(transcript_path: Path) -> dict[str, object]:
+    """Full summary when one is cached, otherwise a quick draft marked for upgrade.
+
+    Falls back to :func:`_summary_from_transcript` (no upgrade needed) if the draft fails.
+    """
+    fixture = os.environ.get("MEETINGCTL_PROCESSING_SUMMARY_JSON")
+    if fixture:
+        return parse_summary_json(fixture)
+    transcript = transcript_path.read_text()
+    cache = default_summary_cache()
+    cached = cache.get(summary_cache_key(transcript)) if cache is not None else None
+    if cached is not None:
+        return {**cached, "reused": True}
+    usage: dict[str, int] = {}
+    try:
+        summary = generate_draft_summary(transcript, api_key=os.environ.get("ANTHROPIC_API_KEY", ""), usage=usage)
+    except Exception:
+        # A missing or rate-limited draft model must not cost the job its summary.
+        return _summary_from_transcript(transcript_path)
+    return {**summary, "draft": True, "usage": usage}
+
+
+def _summary_stream_enabled() -> bool:
+    value = os.environ.get("MEETINGCTL_SUMMARY_STREAM", "0").strip().lower()
+    return value not in {"", "0", "false", "no"}
+
+
+def _summary_stream_patch_seconds() -> float:
+    raw = os.environ.get("MEETINGCTL_SUMMARY_STREAM_PATCH_SECONDS", "").strip()
+    if not raw:
+        return 5.0
+    try:
+        return max(float(raw), 0.0)
+    except ValueError:
+        return 5.0
+
+
+def _streamed_summary_from_transcript(transcript_path: Path, note_path: Path) -> dict[str, object]:
+    """Stream the summary, writing partial minutes into the note at most every few seconds.
+
+    Falls back to :func:`_summary_from_transcript` if the stream fails.
+    """
+    fixture = os.environ.get("MEETINGCTL_PROCESSING_SUMMARY_JSON")
+    if fixture:
+        return parse_summary_json(fixture)
+    interval = _summary_stream_patch_seconds()
+    last_patch: float | None = None
+
+    def _patch_minutes(minutes: str) -> None:
+        nonlocal last_patch
+        now = time.monotonic()
+        # Each patch rewrites the note, so Obsidian sees at most one change per interval.
+        if last_patch is not None and now - last_patch < interval:
+            return
+        last_patch = now
+        try:
+            patch_note_file(
+                note_path=note_path,
+                updates={"minutes": f"{minutes}\n\n> _Summary in progress..._"},
+                dry_run=False,
+            )
+        except (OSError, PatchingError):
+            # Progress writes are best effort; the final patch reports note problems.
+            return
+
+    api_key = os.environ.get("ANTHROPIC_API_KEY", "")
+    usage: dict[str, int] = {}
+    try:
+        summary = summarize_with_cache(
+            transcript_path.read_text(),
+            generate=lambda transcript: stream_summary(
+                transcript, api_key=api_key, on_minutes=_patch_minutes, usage=usage
+            ),
+            cache=default_summary_cache(),
+        )
+    except Exception:
+        return _summary_from_transcript(transcript_path)
+    return {**summary, "usage": usage}
+
+
+def _summary_patch_regions(summary_payload: dict[str, object]) -> dict[str, str]:
+    regions = summary_to_patch_regions(summary_payload)
+    if summary_payload.get("draft"):
+        regions["minutes"] = f"> _Draft summary; full minutes will replace it shortly._\n\n{regions['minutes']}"
+    return regions
+
+
+def _schedule_summary_upgrade(context: ProcessContext) -> None:
+    _queue_process_trigger()(
+        {
+            "meeting_id": context.meeting_id,
+            "note_path": str(context.note_path),
+            "transcript_path": str(context.transcript_path),
+            "summary_upgrade": True,
+        }
+    )
+
+
+def _append_processed_job(processed_payload: dict[str, object]) -> None:
+    log_file = _processed_jobs_log_file()
+    log_file.parent.mkdir(parents=True, exist_ok=True)
+    with log_file.open("a", encoding="utf-8") as fh:
+        fh.write(json.dumps(processed_payload))
+        fh.write("\n")
+
+
+def _upgrade_summary_job(payload: dict[str, object]) -> None:
+    """Replace a draft summary with the full one; queued by two-tier processing."""
+    cfg = load_config()
+    meeting_id = _require_payload_str(payload, "meeting_id")
+    note_path = _resolve_note_path(
+        note_path=_require_payload_str(payload, "note_path"),
+        vault_path=cfg.vault_path,
+    )
+    transcript_path = Path(_require_payload_str(payload, "transcript_path")).expanduser()
+    if not note_path.exists() or not transcript_path.exists():
+        # Note or transcript moved since the draft; skip to unblock remaining jobs.
+        return
+    summary = _summary_from_transcript(transcript_path)
+    patch_note_file(note_path=note_path, updates=_summary_patch_regions(summary), dry_run=False)
+    _append_processed_job(
+        {
+            "meeting_id": meeting_id,
+            "note_path": str(note_path),
+            "transcript_path": str(transcript_path),
+            "summary_upgrade": True,
+            "reused_summary": bool(summary.get("reused", False)),
+            "summary_usage": summary.get("usage") or {},
+        }
+    )
 
 
 def _transcribe_for_processing(
@@ -587,7 +752,14 @@ def _references_region(transcript_path: Path, audio_path: Path) -> str:
     return "\n".join(lines)
 
 
-def _default_queue_handler(payload: dict[str, object]) -> None:
+def _default_queue_handler(
+    payload: dict[str, object],
+    *,
+    defer_summary: Callable[[SummaryBatchItem], None] | None = None,
+) -> None:
+    if payload.get("summary_upgrade"):
+        _upgrade_summary_job(payload)
+        return
     try:
         context = _process_context_from_payload(payload)
     except ValueError as exc:
@@ -645,16 +817,44 @@ def _default_queue_handler(payload: dict[str, object]) -> None:
                 transcript_path,
             )
 
+    summary_usage: dict[str, int] = {}
+
+    def _summarize(transcript_path: Path) -> dict[str, object]:
+        if defer_summary is None:
+            if _summary_draft_enabled():
+                summary = _draft_summary_from_transcript(transcript_path)
+            elif _summary_stream_enabled():
+                summary = _streamed_summary_from_transcript(transcript_path, context.note_path)
+            else:
+                summary = _summary_from_transcript(transcript_path)
+            summary_usage.update(summary.get("usage") or {})
+            return summary
+        # Batch backfills summarize every transcript together once the loop finishes.
+        defer_summary(
+            SummaryBatchItem(
+                meeting_id=context.meeting_id,
+                note_path=context.note_path,
+                transcript_path=transcript_path,
+            )
+        )
+        return {"deferred": True}
+
+    def _patch_summary(note_path: Path, summary_payload: dict[str, object]) -> None:
+        if summary_payload.get("deferred"):
+            return
+        patch_note_file(
+            note_path=note_path,
+            updates=_summary_patch_regions(summary_payload),
+            dry_run=False,
+        )
+
     result = run_processing(
         context=context,
         transcribe=_transcribe_with_fallback,
-        summarize=_summary_from_transcript,
-        patch_note=lambda note_path, summary_payload: patch_note_file(
-            note_path=note_path,
-            updates=summary_to_patch_regions(summary_payload),
-            dry_run=False,
-        ),
+        summarize=_summarize,
+        patch_note=_patch_summary,
         convert_audio=lambda wav_path, mp3_path: _convert_for_processing(active_recording_path, mp3_path),
+        schedule_upgrade=_schedule_summary_upgrade,
     )
     note_text = result.note_path.read_text(encoding="utf-8", errors="replace")
     has_references_region = "<!-- REFERENCES_START -->" in note_text and "<!-- REFERENCES_END -->" in note_text
@@ -679,8 +879,6 @@ def _default_queue_handler(payload: dict[str, object]) -> None:
         note_path=result.note_path,
     )
 
-    log_file = _processed_jobs_log_file()
-    log_file.parent.mkdir(parents=True, exist_ok=True)
     processed_payload = {
         "meeting_id": result.meeting_id,
         "note_path": str(result.note_path),
@@ -690,10 +888,10 @@ def _default_queue_handler(payload: dict[str, object]) -> None:
         "mp3_path": str(result.mp3_path),
         "reused_transcript": result.reused_transcript,
         "reused_summary": result.reused_summary,
+        "summary_tier": result.summary_tier,
+        "summary_usage": summary_usage,
     }
-    with log_file.open("a", encoding="utf-8") as fh:
-        fh.write(json.dumps(processed_payload))
-        fh.write("\n")
+    _append_processed_job(processed_payload)
 
 
 def _assert_transcription_backend_ready() -> None:
@@ -1003,7 +1201,11 @@ def _backfill_recordings(
     dry_run: bool,
     progress: bool,
     verbose: bool,
+    summary_mode: str = "sync",
+    batch_state_file: str = "",
 ) -> dict[str, object]:
+    if summary_mode == "batch" and not process_now:
+        raise ValueError("--summary-mode batch requires --process-now.")
     if process_now and not dry_run:
         _assert_transcription_backend_ready()
     if review_calendar and not sys.stdin.isatty():
@@ -1053,6 +1255,16 @@ def _backfill_recordings(
     errors: list[dict[str, str]] = []
     plans: list[dict[str, object]] = []
     unmatched_recordings: list[str] = []
+    batch_state_path = (
+        Path(batch_state_file).expanduser() if batch_state_file.strip() else summary_batch_state_file()
+    )
+
+    def _defer_summary(item: SummaryBatchItem) -> None:
+        # Persisted before the recording is logged as ingested, so an interrupted run
+        # resubmits the item instead of skipping the recording on the rerun.
+        record_pending_summary(batch_state_path, item)
+
+    defer_summary = _defer_summary if summary_mode == "batch" else None
     total = len(files)
 
     def _emit(message: str) -> None:
@@ -1270,7 +1482,7 @@ def _backfill_recordings(
                 )
             else:
                 if process_now:
-                    _default_queue_handler(payload)
+                    _default_queue_handler(payload, defer_summary=defer_summary)
                     processed_jobs += 1
                 else:
                     _queue_job_payload(payload)
@@ -1291,6 +1503,25 @@ def _backfill_recordings(
                     f"(processed={processed_jobs} failed={failed_jobs} skipped={skipped_existing + skipped_already_ingested + skipped_manual})"
                 )
 
+    summary_batch: dict[str, object] | None = None
+    if defer_summary is not None and not dry_run:
+        # Items deferred above are read back from the state file along with any left pending
+        # or in flight by an interrupted run.
+        summary_batch = run_summary_batch(
+            [],
+            api_key=os.environ.get("ANTHROPIC_API_KEY", ""),
+            apply=lambda item, summary: patch_note_file(
+                note_path=item.note_path,
+                updates=summary_to_patch_regions(summary),
+                dry_run=False,
+            ),
+            fallback=_summary_from_transcript,
+            state_path=batch_state_path,
+            cache=default_summary_cache(),
+            poll_seconds=summary_batch_poll_seconds(),
+            emit=_emit if progress or verbose else None,
+        )
+
     exported_unmatched_manifest = ""
     if export_unmatched_manifest.strip():
         manifest_path = Path(export_unmatched_manifest).expanduser().resolve()
@@ -1306,6 +1537,8 @@ def _backfill_recordings(
         "skipped_already_ingested": skipped_already_ingested,
         "skipped_existing": skipped_existing,
         "process_now": process_now,
+        "summary_mode": summary_mode,
+        "summary_batch": summary_batch,
         "match_calendar": match_calendar,
         "matched_calendar": matched_calendar,
         "unmatched_calendar": unmatched_calendar,
@@ -1493,6 +1726,8 @@ def main() -> int:
                 dry_run=args.dry_run,
                 progress=args.progress,
                 verbose=args.verbose,
+                summary_mode=args.summary_mode,
+                batch_state_file=args.batch_state_file,
             )
         except Exception as exc:
             _print_payload({"error": str(exc)}, args.json)
@@ -24,6 +24,7 @@ class ProcessResult:
     note_path: Path
     reused_transcript: bool
     reused_summary: bool
+    summary_tier: str = "full"
 
 
 def run_processing(
@@ -33,7 +34,15 @@ def run_processing(
     summarize: Callable[[Path], dict[str, object]],
     patch_note: Callable[[Path, dict[str, object]], None],
     convert_audio: Callable[[Path, Path], Path] | None = None,
+    schedule_upgrade: Callable[[ProcessContext], None] | None = None,
 ) -> ProcessResult:
+    """Transcribe (unless a transcript exists), summarize into the note, then convert audio.
+
+    ``summarize`` may return a quick draft marked ``draft: True``; the note is patched with
+    it right away and ``schedule_upgrade`` is called to replace it with the full summary later.
+    The result reports the draft tier either way, so a draft with no upgrade is not mistaken
+    for a full summary.
+    """
     reused_transcript = context.transcript_path.exists()
     if not reused_transcript:
         transcribe(context.wav_path, context.transcript_path)
@@ -41,6 +50,9 @@ def run_processing(
     summary_payload = summarize(context.transcript_path)
     reused_summary = bool(summary_payload.get("reused", False))
     patch_note(context.note_path, summary_payload)
+    summary_tier = "draft" if summary_payload.get("draft") else "full"
+    if summary_tier == "draft" and schedule_upgrade is not None:
+        schedule_upgrade(context)
     converter = convert_audio or (lambda wav, mp3: convert_wav_to_mp3(wav_path=wav, mp3_path=mp3))
     mp3_path = converter(context.wav_path, context.mp3_path)
 
@@ -51,4 +63,5 @@ def run_processing(
         note_path=context.note_path,
         reused_transcript=reused_transcript,
         reused_summary=reused_summary,
+        summary_tier=summary_tier,
     )
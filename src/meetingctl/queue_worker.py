@@ -95,6 +95,13 @@ def process_queue_jobs(
         if failure_mode == "stop" and failed > 0:
             # Put unprocessed lines back including failed line at head.
             remaining_lines = raw_lines[processed:]
+        # Writers only append, so lines past the snapshot were queued while jobs ran
+        # (e.g. summary upgrades) and must survive the rewrite.
+        try:
+            current_lines = [line.strip() for line in queue_file.read_text().splitlines() if line.strip()]
+        except FileNotFoundError:
+            current_lines = []
+        remaining_lines = remaining_lines + current_lines[len(raw_lines) :]
         if remaining_lines:
             _atomic_write_lines(queue_file, remaining_lines)
         else:
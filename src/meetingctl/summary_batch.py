@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import UTC, datetime
+import json
+import os
+from pathlib import Path
+import tempfile
+import time
+from typing import Callable
+
+from meetingctl.summary_cache import SummaryCache, summary_cache_key
+from meetingctl.summary_client import (
+    create_summary_batch,
+    summary_batch_results,
+    summary_batch_status,
+    summary_needs_chunking,
+    summary_request_signature,
+)
+
+
+DEFAULT_SUMMARY_BATCH_STATE_FILE = "~/.local/state/meetingctl/summary_batch.json"
+DEFAULT_SUMMARY_BATCH_POLL_SECONDS = 30.0
+
+
+@dataclass(frozen=True)
+class SummaryBatchItem:
+    meeting_id: str
+    note_path: Path
+    transcript_path: Path
+
+
+def summary_batch_state_file() -> Path:
+    raw = os.environ.get("MEETINGCTL_SUMMARY_BATCH_STATE_FILE", "").strip()
+    return Path(raw or DEFAULT_SUMMARY_BATCH_STATE_FILE).expanduser()
+
+
+def summary_batch_poll_seconds() -> float:
+    raw = os.environ.get("MEETINGCTL_SUMMARY_BATCH_POLL_SECONDS", "").strip()
+    if not raw:
+        return DEFAULT_SUMMARY_BATCH_POLL_SECONDS
+    try:
+        return max(float(raw), 1.0)
+    except ValueError:
+        return DEFAULT_SUMMARY_BATCH_POLL_SECONDS
+
+
+def _write_state(path: Path, state: dict[str, object]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        mode="w", encoding="utf-8", delete=False, dir=path.parent, suffix=".tmp"
+    ) as tmp:
+        json.dump(state, tmp, indent=2)
+        tmp_path = Path(tmp.name)
+    tmp_path.replace(path)
+
+
+def _read_state(path: Path) -> dict[str, object]:
+    try:
+        state = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return state if isinstance(state, dict) else {}
+
+
+def _in_flight_batch(state: dict[str, object]) -> dict[str, object] | None:
+    if not state.get("batch_id") or not isinstance(state.get("items"), dict):
+        return None
+    return state
+
+
+def _pending_entries(state: dict[str, object]) -> list[dict[str, str]]:
+    pending = state.get("pending")
+    if not isinstance(pending, list):
+        return []
+    return [entry for entry in pending if isinstance(entry, dict)]
+
+
+def _item_to_state(item: SummaryBatchItem) -> dict[str, str]:
+    return {
+        "meeting_id": item.meeting_id,
+        "note_path": str(item.note_path),
+        "transcript_path": str(item.transcript_path),
+    }
+
+
+def _item_from_state(entry: dict[str, str]) -> SummaryBatchItem:
+    return SummaryBatchItem(
+        meeting_id=entry["meeting_id"],
+        note_path=Path(entry["note_path"]),
+        transcript_path=Path(entry["transcript_path"]),
+    )
+
+
+def record_pending_summary(state_path: Path, item: SummaryBatchItem) -> None:
+    """Persist ``item`` as waiting for the next batch so an interrupted run can resubmit it.
+
+    Call before the recording is logged as ingested; :func:`run_summary_batch` picks pending
+    items up on its next call, even when the caller passes no new ones.
+    """
+    state = _read_state(state_path)
+    pending = _pending_entries(state)
+    entry = _item_to_state(item)
+    if entry not in pending:
+        pending.append(entry)
+    _write_state(state_path, {**state, "pending": pending})
+
+
+def _store_state(path: Path, state: dict[str, object]) -> None:
+    if state:
+        _write_state(path, state)
+    else:
+        path.unlink(missing_ok=True)
+
+
+def run_summary_batch(
+    items: list[SummaryBatchItem],
+    *,
+    api_key: str,
+    apply: Callable[[SummaryBatchItem, dict[str, object]], None],
+    fallback: Callable[[Path], dict[str, object]],
+    state_path: Path,
+    cache: SummaryCache | None,
+    poll_seconds: float = DEFAULT_SUMMARY_BATCH_POLL_SECONDS,
+    sleep: Callable[[float], None] = time.sleep,
+    emit: Callable[[str], None] | None = None,
+) -> dict[str, object]:
+    """Summarize ``items`` through one Message Batch and hand each summary to ``apply``.
+
+    The batch ID and its items are written to ``state_path`` before polling starts, so an
+    interrupted run reattaches to the in-flight batch on the next call instead of paying for
+    it twice. Items recorded with :func:`record_pending_summary` but never submitted are
+    added to ``items``. Cached transcripts skip the batch; transcripts long enough for
+    map-reduce and requests that do not succeed go through ``fallback``.
+    """
+    counts = {"submitted": 0, "applied": 0, "cached": 0, "fallback": 0}
+    batch_ids: list[str] = []
+    reattached_batch_id = ""
+    errors: list[dict[str, str]] = []
+    usage: dict[str, int] = {}
+
+    def _emit(message: str) -> None:
+        if emit is not None:
+            emit(message)
+
+    def _apply(item: SummaryBatchItem, summary: dict[str, object]) -> None:
+        try:
+            apply(item, summary)
+        except Exception as exc:
+            errors.append({"meeting_id": item.meeting_id, "error": str(exc)})
+            return
+        counts["applied"] += 1
+
+    def _fall_back(item: SummaryBatchItem, reason: str) -> None:
+        counts["fallback"] += 1
+        _emit(f"summary batch fallback: {item.meeting_id} ({reason})")
+        try:
+            summary = fallback(item.transcript_path)
+        except Exception as exc:
+            errors.append({"meeting_id": item.meeting_id, "error": str(exc)})
+            return
+        _apply(item, summary)
+
+    def _finish(batch_id: str, state_items: dict[str, dict[str, str]]) -> None:
+        while (status := summary_batch_status(batch_id, api_key=api_key)) != "ended":
+            _emit(f"summary batch {batch_id}: {status}")
+            sleep(poll_seconds)
+        pending = dict(state_items)
+        for custom_id, summary, result_type in summary_batch_results(batch_id, api_key=api_key, usage=usage):
+            entry = pending.pop(custom_id, None)
+            if entry is None:
+                continue
+            item = _item_from_state(entry)
+            if summary is None:
+                _fall_back(item, result_type)
+                continue
+            if cache is not None:
+                cache.put(entry["cache_key"], summary)
+            _apply(item, summary)
+        for entry in pending.values():
+            _fall_back(_item_from_state(entry), "missing from batch results")
+        # Keep only items deferred since this batch was submitted.
+        remaining = _pending_entries(_read_state(state_path))
+        _store_state(state_path, {"pending": remaining} if remaining else {})
+
+    in_flight = _in_flight_batch(_read_state(state_path))
+    if in_flight is not None:
+        reattached_batch_id = str(in_flight["batch_id"])
+        batch_ids.append(reattached_batch_id)
+        _emit(f"summary batch reattach: {reattached_batch_id}")
+        _finish(reattached_batch_id, in_flight["items"])  # type: ignore[arg-type]
+
+    pending_entries = _pending_entries(_read_state(state_path))
+    queued = [_item_from_state(entry) for entry in pending_entries]
+    for item in items:
+        if item not in queued:
+            queued.append(item)
+
+    transcripts: dict[str, str] = {}
+    state_items: dict[str, dict[str, str]] = {}
+    for item in queued:
+        try:
+            transcript = item.transcript_path.read_text(encoding="utf-8")
+        except OSError as exc:
+            errors.append({"meeting_id": item.meeting_id, "error": str(exc)})
+            continue
+        key = summary_cache_key(transcript)
+        cached = cache.get(key) if cache is not None else None
+        if cached is not None:
+            counts["cached"] += 1
+            _apply(item, {**cached, "reused": True})
+            continue
+        if summary_needs_chunking(transcript):
+            _fall_back(item, "transcript exceeds chunk budget")
+            continue
+        custom_id = f"item-{len(transcripts) + 1:05d}"
+        transcripts[custom_id] = transcript
+        state_items[custom_id] = {**_item_to_state(item), "cache_key": key}
+    if not transcripts:
+        if pending_entries:
+            # Every pending item was served from the cache or the fallback.
+            _store_state(state_path, {})
+    else:
+        batch_id = create_summary_batch(transcripts, api_key=api_key, usage=usage)
+        # One write moves the pending items into the in-flight batch.
+        _write_state(
+            state_path,
+            {
+                "batch_id": batch_id,
+                "created_at": datetime.now(UTC).isoformat(),
+                "request_signature": summary_request_signature(),
+                "items": state_items,
+            },
+        )
+        counts["submitted"] = len(transcripts)
+        batch_ids.append(batch_id)
+        _emit(f"summary batch submitted: {batch_id} ({len(transcripts)} requests)")
+        _finish(batch_id, state_items)
+
+    return {
+        "state_file": str(state_path),
+        "reattached_batch_id": reattached_batch_id,
+        "batch_ids": batch_ids,
+        **counts,
+        "usage": usage,
+        "errors": errors,
+    }
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+import hashlib
+import json
+import os
+from pathlib import Path
+import tempfile
+from typing import Callable
+
+from meetingctl.summary_client import summary_request_signature
+
+
+DEFAULT_SUMMARY_CACHE_DIR = "~/.local/state/meetingctl/summary-cache"
+DEFAULT_SUMMARY_CACHE_MAX_MB = 64.0
+
+
+def summary_cache_key(transcript: str) -> str:
+    """Content key for a summary: transcript bytes plus prompt template, models and max_tokens."""
+    material = {
+        "transcript_sha256": hashlib.sha256(transcript.encode("utf-8")).hexdigest(),
+        **summary_request_signature(),
+    }
+    return hashlib.sha256(json.dumps(material, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class SummaryCache:
+    """On-disk summary cache, one JSON file per key, evicted least-recently-used by total size."""
+
+    def __init__(self, root: Path, *, max_bytes: int) -> None:
+        self.root = root
+        self.max_bytes = max_bytes
+
+    def _entry_path(self, key: str) -> Path:
+        return self.root / f"{key}.json"
+
+    def get(self, key: str) -> dict[str, object] | None:
+        path = self._entry_path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+        summary = entry.get("summary") if isinstance(entry, dict) else None
+        if not isinstance(summary, dict):
+            return None
+        try:
+            # Hits refresh mtime so eviction drops the least recently used entries first.
+            os.utime(path)
+        except OSError:
+            pass
+        return summary
+
+    def put(self, key: str, summary: dict[str, object]) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "created_at": datetime.now(UTC).isoformat(),
+            "summary": {name: value for name, value in summary.items() if name != "reused"},
+        }
+        with tempfile.NamedTemporaryFile(
+            mode="w", encoding="utf-8", delete=False, dir=self.root, suffix=".tmp"
+        ) as tmp:
+            json.dump(entry, tmp)
+            tmp_path = Path(tmp.name)
+        tmp_path.replace(self._entry_path(key))
+        self.evict()
+
+    def evict(self) -> int:
+        entries: list[tuple[float, int, Path]] = []
+        for path in self.root.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        return removed
+
+
+def default_summary_cache() -> SummaryCache | None:
+    enabled = os.environ.get("MEETINGCTL_SUMMARY_CACHE", "1").strip().lower()
+    if enabled in {"0", "false", "no", "off"}:
+        return None
+    root = os.environ.get("MEETINGCTL_SUMMARY_CACHE_DIR", "").strip() or DEFAULT_SUMMARY_CACHE_DIR
+    try:
+        max_mb = float(os.environ.get("MEETINGCTL_SUMMARY_CACHE_MAX_MB", "").strip() or DEFAULT_SUMMARY_CACHE_MAX_MB)
+    except ValueError:
+        max_mb = DEFAULT_SUMMARY_CACHE_MAX_MB
+    return SummaryCache(Path(root).expanduser(), max_bytes=max(int(max_mb * 1024 * 1024), 0))
+
+
+def summarize_with_cache(
+    transcript: str,
+    *,
+    generate: Callable[[str], dict[str, object]],
+    cache: SummaryCache | None,
+) -> dict[str, object]:
+    """Return a cached summary marked ``reused: True``, or generate and store a new one."""
+    if cache is None:
+        return generate(transcript)
+    key = summary_cache_key(transcript)
+    cached = cache.get(key)
+    if cached is not None:
+        return {**cached, "reused": True}
+    summary = generate(transcript)
+    cache.put(key, summary)
+    return summary
@@ -1,21 +1,224 @@
 from __future__ import annotations
 
+import asyncio
+from collections.abc import AsyncIterator, Callable, Iterator, Mapping
+from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+import email.utils
+import hashlib
 import json
 import os
+from pathlib import Path
 import re
 import ssl
 import subprocess
+import tempfile
+import threading
 import time
+from typing import NamedTuple
+import weakref
 
 import anthropic
 
 from meetingctl.summary_parser import SummaryParseError, parse_summary_json
+from meetingctl.transcript_compaction import COMPACTION_VERSION, compact_transcript
+
+
+_SUMMARY_RESPONSE_FORMAT = """Respond with ONLY a JSON object in this exact format:
+{
+  "minutes": "Markdown text with sectioned bullets and sub-bullets",
+  "decisions": ["Decision 1", "Decision 2"],
+  "action_items": ["Owner: <name or Unknown>; Task: <action>; Due: <date or TBD>"]
+}
+
+Formatting rules:
+- `minutes` must be detailed and use markdown bullets/sub-bullets with clear sections in this order:
+  1) Meeting Details (title/date/time if inferable, including UTC and US Central when available)
+  2) Attendees (participants and inferred roles if available)
+  3) Agenda
+  4) Key Themes & Pain Points
+  5) Minutes & Decisions (discussion narrative in structured bullets)
+- Keep `minutes` concise but thorough; prefer nested bullets for readability.
+- `decisions` must be a list of concise, stand-alone decision statements.
+- `action_items` must be a list where each item follows:
+  "Owner: <name or Unknown>; Task: <action>; Due: <date or TBD>"
+- If no decisions or action items exist, use empty arrays.
+- Do not include markdown code fences.
+"""
+
+_SUMMARY_INSTRUCTIONS = (
+    "You are a meeting assistant. Given a meeting transcript, generate a structured summary.\n\n"
+    + _SUMMARY_RESPONSE_FORMAT
+)
+
+_DRAFT_INSTRUCTIONS = (
+    _SUMMARY_INSTRUCTIONS
+    + """
+Draft rules:
+- This is a quick first draft that a full summary replaces later.
+- Keep `minutes` to the Agenda and Minutes & Decisions sections, at most 10 short bullets in total.
+"""
+)
+
+_SUMMARY_PROMPT_TEMPLATE = """Transcript:
+{transcript}
+"""
+
+_MAP_INSTRUCTIONS = """You are a meeting assistant. You will receive one part of a long meeting transcript, split at speaker-turn boundaries. Summarize only what that part contains; a later pass merges all parts.
+
+Respond with ONLY a JSON object in this exact format:
+{
+  "minutes": "Markdown bullets covering the topics, discussion and participants in this part",
+  "decisions": ["Decision 1", "Decision 2"],
+  "action_items": ["Owner: <name or Unknown>; Task: <action>; Due: <date or TBD>"]
+}
+
+Rules:
+- Keep names, speaker labels and dates needed to attribute decisions and action items.
+- If no decisions or action items exist in this part, use empty arrays.
+- Do not include markdown code fences.
+"""
+
+_MAP_PROMPT_TEMPLATE = """This is part {part} of {parts} of the meeting.
+
+Transcript part:
+{transcript}
+"""
+
+_REDUCE_INSTRUCTIONS = (
+    "You are a meeting assistant. A long meeting transcript was summarized in consecutive parts. "
+    "Merge the partial summaries you receive into one structured summary of the whole meeting. "
+    "Remove duplicate decisions and action items that appear in more than one part and keep them "
+    "in meeting order.\n\n" + _SUMMARY_RESPONSE_FORMAT
+)
+
+_REDUCE_PROMPT_TEMPLATE = """The meeting was summarized in {parts} consecutive parts.
+
+Partial summaries (JSON, in meeting order):
+{partials}
+"""
+
+_REPAIR_INSTRUCTIONS = """Convert the assistant output you receive into valid JSON.
+
+Requirements:
+- Output ONLY valid JSON (no prose, no markdown fences).
+- Include exactly these keys:
+  - "minutes" (string)
+  - "decisions" (array of strings)
+  - "action_items" (array of strings)
+- Keep all useful detail from the source when possible.
+- If a field is missing/unknown, use empty string for minutes or empty arrays for lists.
+"""
+
+_REPAIR_PROMPT_TEMPLATE = """Source output:
+{malformed_text}
+"""
+
+_REPAIR_FOLLOWUP = """Your reply above was not valid JSON. Reply again with ONLY a valid JSON object with exactly the keys "minutes" (string), "decisions" (array of strings) and "action_items" (array of strings). Keep all useful detail from your reply; no prose and no markdown fences.
+"""
+
+_SUMMARY_TOOL_NAME = "record_meeting_summary"
+_SUMMARY_TOOL = {
+    "name": _SUMMARY_TOOL_NAME,
+    "description": "Record the structured meeting summary.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "minutes": {
+                "type": "string",
+                "description": "Markdown minutes with sectioned bullets and sub-bullets",
+            },
+            "decisions": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Concise, stand-alone decision statements",
+            },
+            "action_items": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Each item as 'Owner: <name or Unknown>; Task: <action>; Due: <date or TBD>'",
+            },
+        },
+        "required": ["minutes", "decisions", "action_items"],
+    },
+}
+SUMMARY_OUTPUT_MODES = ("tool", "text")
+DEFAULT_SUMMARY_MODEL_STATE_FILE = "~/.local/state/meetingctl/summary_model.json"
+
+_USAGE_FIELDS = (
+    "input_tokens",
+    "output_tokens",
+    "cache_creation_input_tokens",
+    "cache_read_input_tokens",
+)
+
+_RATE_LIMIT_BUCKETS = ("requests", "tokens", "input-tokens", "output-tokens")
+
+# Rough English average for Claude tokenization; only used to size chunks.
+_CHARS_PER_TOKEN = 4
+_TURN_PREFIX_RE = re.compile(r"^((?:\[[^\]]+\]\s+)?[^:\s\[]+:)\s")
+
+# Process-lifetime state: one client (and its keep-alive connection pool) per key/TLS config,
+# and 1Password secrets held in memory for MEETINGCTL_SUMMARY_SECRET_TTL_SECONDS.
+_CLIENT_LOCK = threading.Lock()
+_CLIENTS: dict[tuple[object, ...], anthropic.Anthropic] = {}
+_SECRET_CACHE: dict[str, tuple[float, str]] = {}
+# Async clients bind their connection pool to the event loop that first used them.
+_ASYNC_CLIENTS: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[tuple[object, ...], anthropic.AsyncAnthropic]
+] = weakref.WeakKeyDictionary()
+_DEFAULT_RATE_LIMITER: SummaryRateLimiter | None = None
+_USAGE_LOCK = threading.Lock()
+# (API key fingerprint, model) pairs that returned not_found; skipped until the process exits.
+_UNAVAILABLE_MODELS: set[tuple[str, str]] = set()
+# Serializes read-modify-write of the model-memory state file across worker threads.
+_MODEL_STATE_LOCK = threading.Lock()
+
+
+class _SummaryPrompt(NamedTuple):
+    # Static per-kind instructions go in the system block; content is per request and, when
+    # ``cache`` is set, ends the prompt-cached prefix. ``followup`` is an (assistant output,
+    # user request) pair appended after the content, used to repair output in place.
+    instructions: str
+    content: str
+    followup: tuple[str, str] | None = None
+    cache: bool = True
+
+
+def _summary_prompt(transcript: str) -> _SummaryPrompt:
+    return _SummaryPrompt(_SUMMARY_INSTRUCTIONS, _SUMMARY_PROMPT_TEMPLATE.format(transcript=transcript))
+
+
+def _draft_prompt(transcript: str) -> _SummaryPrompt:
+    return _SummaryPrompt(_DRAFT_INSTRUCTIONS, _SUMMARY_PROMPT_TEMPLATE.format(transcript=transcript))
+
+
+def _map_prompt(part: int, parts: int, chunk: str) -> _SummaryPrompt:
+    return _SummaryPrompt(
+        _MAP_INSTRUCTIONS, _MAP_PROMPT_TEMPLATE.format(part=part, parts=parts, transcript=chunk)
+    )
+
+
+def _repair_prompt(malformed_text: str, source: _SummaryPrompt | None = None) -> _SummaryPrompt:
+    if source is not None and malformed_text.strip():
+        # Continue the original conversation so the cached transcript prefix is reused.
+        return source._replace(followup=(malformed_text, _REPAIR_FOLLOWUP))
+    return _SummaryPrompt(
+        _REPAIR_INSTRUCTIONS, _REPAIR_PROMPT_TEMPLATE.format(malformed_text=malformed_text), cache=False
+    )
 
 
 def _extract_text_content(response: object) -> str:
     content = getattr(response, "content", None)
     if not isinstance(content, list) or not content:
         raise RuntimeError("LLM response had no content blocks.")
+    for block in content:
+        # Tool-mode responses carry the summary as schema-validated tool input.
+        if getattr(block, "type", None) == "tool_use" and getattr(block, "name", None) == _SUMMARY_TOOL_NAME:
+            tool_input = getattr(block, "input", None)
+            if isinstance(tool_input, dict):
+                return json.dumps(tool_input, ensure_ascii=False)
     for block in content:
         text = getattr(block, "text", None)
         if isinstance(text, str) and text.strip():
@@ -33,6 +236,13 @@ def _summary_model_candidates() -> list[str]:
     ]
 
 
+def _summary_draft_models() -> list[str]:
+    raw = os.environ.get("MEETINGCTL_SUMMARY_DRAFT_MODEL", "").strip()
+    if raw:
+        return [part.strip() for part in raw.split(",") if part.strip()]
+    return ["claude-3-5-haiku-latest"]
+
+
 def _is_model_not_found_error(exc: Exception) -> bool:
     text = str(exc).lower()
     return "not_found_error" in text and "model:" in text
@@ -269,6 +479,16 @@ def _summary_max_tokens() -> int:
         return 4096
 
 
+def _summary_draft_max_tokens() -> int:
+    raw = os.environ.get("MEETINGCTL_SUMMARY_DRAFT_MAX_TOKENS", "").strip()
+    if not raw:
+        return 1024
+    try:
+        return max(int(raw), 256)
+    except ValueError:
+        return 1024
+
+
 def _repair_max_tokens() -> int:
     raw = os.environ.get("MEETINGCTL_SUMMARY_REPAIR_MAX_TOKENS", "").strip()
     if not raw:
@@ -279,6 +499,27 @@ def _repair_max_tokens() -> int:
         return 1536
 
 
+def _summary_chunk_tokens() -> int:
+    raw = os.environ.get("MEETINGCTL_SUMMARY_CHUNK_TOKENS", "").strip()
+    if not raw:
+        return 12000
+    try:
+        value = int(raw)
+    except ValueError:
+        return 12000
+    return 0 if value <= 0 else max(value, 1000)
+
+
+def _summary_max_concurrency() -> int:
+    raw = os.environ.get("MEETINGCTL_SUMMARY_MAX_CONCURRENCY", "").strip()
+    if not raw:
+        return 4
+    try:
+        return max(min(int(raw), 16), 1)
+    except ValueError:
+        return 4
+
+
 def _summary_timeout_seconds() -> float:
     raw = os.environ.get("MEETINGCTL_SUMMARY_TIMEOUT_SECONDS", "").strip()
     if not raw:
@@ -309,24 +550,132 @@ def _summary_retry_base_seconds() -> float:
         return 2.0
 
 
+def _summary_requests_per_minute() -> float:
+    raw = os.environ.get("MEETINGCTL_SUMMARY_REQUESTS_PER_MINUTE", "").strip()
+    if not raw:
+        return 50.0
+    try:
+        return max(float(raw), 1.0)
+    except ValueError:
+        return 50.0
+
+
+def summary_model_state_file() -> Path:
+    raw = os.environ.get("MEETINGCTL_SUMMARY_MODEL_STATE_FILE", "").strip()
+    return Path(raw or DEFAULT_SUMMARY_MODEL_STATE_FILE).expanduser()
+
+
+def _summary_model_memory_ttl_seconds() -> float:
+    raw = os.environ.get("MEETINGCTL_SUMMARY_MODEL_MEMORY_TTL_SECONDS", "").strip()
+    if not raw:
+        return 86400.0
+    try:
+        return max(float(raw), 0.0)
+    except ValueError:
+        return 86400.0
+
+
 def _truthy_env(name: str, default: str = "0") -> bool:
     raw = os.environ.get(name, default).strip().lower()
     return raw not in {"", "0", "false", "no", "off"}
 
 
-def _summary_http_client() -> object | None:
+def _summary_compaction_enabled() -> bool:
+    return _truthy_env("MEETINGCTL_SUMMARY_COMPACT_TRANSCRIPT", "1")
+
+
+def _summary_transcript(transcript: str, usage: dict[str, int] | None = None) -> str:
+    """Transcript text as sent to the model, compacted unless disabled.
+
+    Before/after token estimates are added to ``usage`` so each job reports the savings.
+    """
+    compacted = compact_transcript(transcript) if _summary_compaction_enabled() else transcript
+    if usage is not None:
+        before, after = _estimate_tokens(transcript), _estimate_tokens(compacted)
+        with _USAGE_LOCK:
+            usage["transcript_tokens_estimate"] = usage.get("transcript_tokens_estimate", 0) + before
+            usage["compacted_tokens_estimate"] = usage.get("compacted_tokens_estimate", 0) + after
+    return compacted
+
+
+def _summary_output_mode() -> str:
+    raw = os.environ.get("MEETINGCTL_SUMMARY_OUTPUT_MODE", "").strip().lower()
+    return raw if raw in SUMMARY_OUTPUT_MODES else "tool"
+
+
+def _summary_prompt_cache_enabled() -> bool:
+    return _truthy_env("MEETINGCTL_SUMMARY_PROMPT_CACHE", "1")
+
+
+def _summary_message_params(*, prompt: _SummaryPrompt, max_tokens: int) -> dict[str, object]:
+    system_block: dict[str, object] = {"type": "text", "text": prompt.instructions}
+    content: object = prompt.content
+    if prompt.cache and _summary_prompt_cache_enabled():
+        # The breakpoint follows the transcript, so tools + instructions + transcript form the
+        # cached prefix; repair continuations and retries of the same request read it back.
+        # Prefixes below the model's minimum cacheable length are simply not cached.
+        content = [{"type": "text", "text": prompt.content, "cache_control": {"type": "ephemeral"}}]
+    messages: list[dict[str, object]] = [{"role": "user", "content": content}]
+    if prompt.followup is not None:
+        previous_output, request = prompt.followup
+        messages.append({"role": "assistant", "content": previous_output})
+        messages.append({"role": "user", "content": request})
+    params: dict[str, object] = {
+        "max_tokens": max_tokens,
+        "temperature": 0,
+        "system": [system_block],
+        "messages": messages,
+    }
+    if _summary_output_mode() == "tool":
+        # Forced tool use makes the API return the summary as JSON matching the schema.
+        params["tools"] = [_SUMMARY_TOOL]
+        params["tool_choice"] = {"type": "tool", "name": _SUMMARY_TOOL_NAME}
+    return params
+
+
+def _record_usage(usage: dict[str, int] | None, response: object) -> None:
+    if usage is None:
+        return
+    reported = getattr(response, "usage", None)
+    with _USAGE_LOCK:
+        usage["requests"] = usage.get("requests", 0) + 1
+        for field in _USAGE_FIELDS:
+            value = getattr(reported, field, None)
+            if isinstance(value, int):
+                usage[field] = usage.get(field, 0) + value
+
+
+def _summary_secret_ttl_seconds() -> float:
+    raw = os.environ.get("MEETINGCTL_SUMMARY_SECRET_TTL_SECONDS", "").strip()
+    if not raw:
+        return 3600.0
+    try:
+        return max(float(raw), 0.0)
+    except ValueError:
+        return 3600.0
+
+
+def _summary_http_client_signature() -> tuple[str, bool]:
+    ca_bundle = os.environ.get("MEETINGCTL_SSL_CA_BUNDLE", "").strip()
+    if not ca_bundle:
+        ca_bundle = os.environ.get("SSL_CERT_FILE", "").strip()
+    return ca_bundle, _truthy_env("MEETINGCTL_SUMMARY_USE_SYSTEM_TRUST", "1")
+
+
+def _summary_http_client(*, asynchronous: bool = False) -> object | None:
+    factory = anthropic.DefaultAsyncHttpxClient if asynchronous else anthropic.DefaultHttpxClient
     ca_bundle = os.environ.get("MEETINGCTL_SSL_CA_BUNDLE", "").strip()
     if not ca_bundle:
         ca_bundle = os.environ.get("SSL_CERT_FILE", "").strip()
     if ca_bundle:
-        return anthropic.DefaultHttpxClient(verify=ca_bundle)
+        return factory(verify=ca_bundle)
 
     if _truthy_env("MEETINGCTL_SUMMARY_USE_SYSTEM_TRUST", "1"):
         try:
             import truststore  # type: ignore[import-not-found]
 
             context = truststore.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
-            return anthropic.DefaultHttpxClient(verify=context)
+            return factory(verify=context)
         except Exception:
             # Optional dependency; fall back to default httpx client behavior.
             return None
@@ -355,6 +704,20 @@ def _read_onepassword_secret(ref: str) -> str:
     return value
 
 
+def _read_onepassword_secret_cached(ref: str) -> str:
+    now = time.monotonic()
+    with _CLIENT_LOCK:
+        cached = _SECRET_CACHE.get(ref)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+    value = _read_onepassword_secret(ref)
+    ttl = _summary_secret_ttl_seconds()
+    if ttl > 0:
+        with _CLIENT_LOCK:
+            _SECRET_CACHE[ref] = (now + ttl, value)
+    return value
+
+
 def _read_api_key_from_file() -> str:
     candidates = [
         os.environ.get("MEETINGCTL_ANTHROPIC_API_KEY_FILE", "").strip(),
@@ -384,46 +747,347 @@ def _resolve_api_key(api_key: str) -> str:
     file_value = _read_api_key_from_file()
 
     if direct.startswith("op://"):
-        return _read_onepassword_secret(direct)
+        return _read_onepassword_secret_cached(direct)
     if direct:
         return direct
     if file_value:
         return file_value
     if ref_from_env.startswith("op://"):
-        return _read_onepassword_secret(ref_from_env)
+        return _read_onepassword_secret_cached(ref_from_env)
     if ref_from_env:
         # secure_exec/op-run may already resolve this env var to a plaintext key.
         return ref_from_env
     return ""
 
 
+def summary_request_signature() -> dict[str, object]:
+    """Inputs besides the transcript that determine a summary response.
+
+    Cached summaries are only valid while the prompt templates, model fallback order and
+    token budgets match; callers fold this into their cache key.
+    """
+    templates = "".join(
+        (
+            _SUMMARY_INSTRUCTIONS,
+            _SUMMARY_PROMPT_TEMPLATE,
+            _MAP_INSTRUCTIONS,
+            _MAP_PROMPT_TEMPLATE,
+            _REDUCE_INSTRUCTIONS,
+            _REDUCE_PROMPT_TEMPLATE,
+        )
+    )
+    return {
+        "prompt_sha256": hashlib.sha256(templates.encode("utf-8")).hexdigest(),
+        "models": _summary_model_candidates(),
+        "max_tokens": _summary_max_tokens(),
+        "chunk_tokens": _summary_chunk_tokens(),
+        "compaction": COMPACTION_VERSION if _summary_compaction_enabled() else 0,
+        "output_mode": _summary_output_mode(),
+    }
+
+
+def _summary_client(api_key: str) -> anthropic.Anthropic:
+    key = (
+        hashlib.sha256(api_key.encode("utf-8")).hexdigest(),
+        _summary_timeout_seconds(),
+        _summary_http_client_signature(),
+    )
+    with _CLIENT_LOCK:
+        client = _CLIENTS.get(key)
+        if client is None:
+            client_kwargs: dict[str, object] = {
+                "api_key": api_key,
+                "timeout": _summary_timeout_seconds(),
+            }
+            http_client = _summary_http_client()
+            if http_client is not None:
+                client_kwargs["http_client"] = http_client
+            client = anthropic.Anthropic(**client_kwargs)
+            _CLIENTS[key] = client
+    return client
+
+
+def _async_summary_client(api_key: str) -> anthropic.AsyncAnthropic:
+    loop = asyncio.get_running_loop()
+    key = (
+        hashlib.sha256(api_key.encode("utf-8")).hexdigest(),
+        _summary_timeout_seconds(),
+        _summary_http_client_signature(),
+    )
+    with _CLIENT_LOCK:
+        clients = _ASYNC_CLIENTS.setdefault(loop, {})
+        client = clients.get(key)
+        if client is None:
+            client_kwargs: dict[str, object] = {
+                "api_key": api_key,
+                "timeout": _summary_timeout_seconds(),
+            }
+            http_client = _summary_http_client(asynchronous=True)
+            if http_client is not None:
+                client_kwargs["http_client"] = http_client
+            client = anthropic.AsyncAnthropic(**client_kwargs)
+            clients[key] = client
+    return client
+
+
+def reset_summary_clients() -> None:
+    """Drop pooled clients, cached secrets, skipped models and the shared rate limiter.
+
+    Call after key rotation, and between tests.
+    """
+    global _DEFAULT_RATE_LIMITER
+    with _CLIENT_LOCK:
+        _CLIENTS.clear()
+        _ASYNC_CLIENTS.clear()
+        _SECRET_CACHE.clear()
+        _UNAVAILABLE_MODELS.clear()
+        _DEFAULT_RATE_LIMITER = None
+
+
+def _retry_after_seconds(headers: Mapping[str, str] | None) -> float | None:
+    if not headers:
+        return None
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return max(float(retry_after_ms) / 1000.0, 0.0)
+        except ValueError:
+            pass
+    retry_after = headers.get("retry-after")
+    if not retry_after:
+        return None
+    try:
+        return max(float(retry_after), 0.0)
+    except ValueError:
+        pass
+    try:
+        moment = email.utils.parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+    return max((moment - datetime.now(UTC)).total_seconds(), 0.0)
+
+
+def _seconds_until(reset: str) -> float | None:
+    try:
+        moment = datetime.fromisoformat(reset.strip().replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=UTC)
+    return max((moment - datetime.now(UTC)).total_seconds(), 0.0)
+
+
+class SummaryRateLimiter:
+    """Token bucket shared by concurrent summary requests.
+
+    Each request reserves one token and waits until the bucket refills. Server signals
+    (``retry-after`` on 429/529, or an ``anthropic-ratelimit-*-remaining: 0`` header)
+    block every later reservation until the advertised reset. With ``max_in_flight``, at
+    most that many requests are outstanding at once, including map-reduce chunk requests.
+    """
+
+    def __init__(
+        self,
+        *,
+        requests_per_minute: float,
+        burst: int | None = None,
+        max_in_flight: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.rate = max(requests_per_minute, 1.0) / 60.0
+        self.capacity = float(burst if burst is not None else max(int(requests_per_minute // 10), 1))
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._blocked_until = 0.0
+        self._in_flight = asyncio.Semaphore(max(max_in_flight, 1)) if max_in_flight else None
+
+    def reserve(self) -> float:
+        """Take a token and return how many seconds the caller must wait before using it."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1.0
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, self._blocked_until - now, 0.0)
+
+    async def acquire(self) -> None:
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    @asynccontextmanager
+    async def request(self) -> AsyncIterator[None]:
+        """Hold a request slot for the duration of one API call."""
+        if self._in_flight is None:
+            await self.acquire()
+            yield
+            return
+        async with self._in_flight:
+            await self.acquire()
+            yield
+
+    def block_for(self, seconds: float) -> None:
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, self._clock() + max(seconds, 0.0))
+
+    def observe_headers(self, headers: Mapping[str, str] | None) -> None:
+        if not headers:
+            return
+        retry_after = _retry_after_seconds(headers)
+        if retry_after is not None:
+            self.block_for(retry_after)
+        for bucket in _RATE_LIMIT_BUCKETS:
+            remaining = headers.get(f"anthropic-ratelimit-{bucket}-remaining")
+            reset = headers.get(f"anthropic-ratelimit-{bucket}-reset")
+            if remaining is None or not reset:
+                continue
+            try:
+                exhausted = int(remaining) <= 0
+            except ValueError:
+                continue
+            seconds = _seconds_until(reset) if exhausted else None
+            if seconds is not None:
+                self.block_for(seconds)
+
+
+def summary_rate_limiter(*, max_in_flight: int | None = None) -> SummaryRateLimiter:
+    """Process-wide limiter sized by MEETINGCTL_SUMMARY_REQUESTS_PER_MINUTE.
+
+    With ``max_in_flight``, returns a new limiter with the same request budget that also caps
+    concurrent API calls, for a caller that owns one event loop (e.g. a batch script).
+    """
+    global _DEFAULT_RATE_LIMITER
+    if max_in_flight is not None:
+        return SummaryRateLimiter(
+            requests_per_minute=_summary_requests_per_minute(), max_in_flight=max_in_flight
+        )
+    with _CLIENT_LOCK:
+        if _DEFAULT_RATE_LIMITER is None:
+            _DEFAULT_RATE_LIMITER = SummaryRateLimiter(
+                requests_per_minute=_summary_requests_per_minute()
+            )
+        return _DEFAULT_RATE_LIMITER
+
+
+def _api_key_fingerprint(client: object) -> str:
+    api_key = getattr(client, "api_key", None)
+    if not isinstance(api_key, str):
+        return ""
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+
+
+def _load_model_state(path: Path) -> dict[str, object]:
+    try:
+        state = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return state if isinstance(state, dict) else {}
+
+
+def _remembered_model(fingerprint: str) -> str | None:
+    ttl = _summary_model_memory_ttl_seconds()
+    if ttl <= 0:
+        return None
+    entry = _load_model_state(summary_model_state_file()).get(fingerprint)
+    if not isinstance(entry, dict) or not isinstance(entry.get("model"), str):
+        return None
+    saved_at = entry.get("saved_at")
+    if not isinstance(saved_at, (int, float)) or time.time() - saved_at > ttl:
+        return None
+    return entry["model"]
+
+
+def _remember_model(fingerprint: str, model: str) -> None:
+    if _summary_model_memory_ttl_seconds() <= 0:
+        return
+    with _MODEL_STATE_LOCK:
+        if _remembered_model(fingerprint) == model:
+            return
+        path = summary_model_state_file()
+        state = _load_model_state(path)
+        state[fingerprint] = {"model": model, "saved_at": time.time()}
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                mode="w", encoding="utf-8", delete=False, dir=path.parent, suffix=".tmp"
+            ) as tmp:
+                json.dump(state, tmp, indent=2)
+                tmp_path = Path(tmp.name)
+            tmp_path.replace(path)
+        except OSError:
+            # Remembering the model only saves a round trip; never fail a summary over it.
+            return
+
+
+def _mark_model_unavailable(fingerprint: str, model: str) -> None:
+    with _CLIENT_LOCK:
+        _UNAVAILABLE_MODELS.add((fingerprint, model))
+
+
+def _ordered_model_candidates(fingerprint: str, models: list[str] | None = None) -> list[str]:
+    """Configured models minus known-missing ones, with the last model that worked first.
+
+    The remembered model is only promoted while it is still configured, so editing
+    MEETINGCTL_SUMMARY_MODEL takes effect immediately. An explicit ``models`` list (the draft
+    tier) is tried in the given order.
+    """
+    with _CLIENT_LOCK:
+        candidates = [
+            model
+            for model in (models if models is not None else _summary_model_candidates())
+            if (fingerprint, model) not in _UNAVAILABLE_MODELS
+        ]
+    if models is not None:
+        return candidates
+    remembered = _remembered_model(fingerprint)
+    if remembered in candidates:
+        candidates.remove(remembered)
+        candidates.insert(0, remembered)
+    return candidates
+
+
+def _no_summary_model_error(
+    last_exc: Exception | None, models: list[str] | None = None
+) -> RuntimeError:
+    candidate_list = ", ".join(models if models is not None else _summary_model_candidates())
+    if candidate_list:
+        return RuntimeError(
+            f"No configured summary model was available ({candidate_list}). "
+            "Set MEETINGCTL_SUMMARY_MODEL to a model your Anthropic account can access."
+        )
+    return RuntimeError(
+        "No summary model candidates configured. "
+        "Set MEETINGCTL_SUMMARY_MODEL to a valid Anthropic model."
+    )
+
+
 def _request_text_with_model_fallback(
     *,
     client: anthropic.Anthropic,
-    prompt: str,
+    prompt: _SummaryPrompt,
     max_tokens: int,
+    usage: dict[str, int] | None = None,
+    models: list[str] | None = None,
 ) -> str:
     last_exc: Exception | None = None
     response = None
-    for model in _summary_model_candidates():
+    fingerprint = _api_key_fingerprint(client)
+    for model in _ordered_model_candidates(fingerprint, models):
         retries = _summary_request_retries()
         attempt = 0
         while attempt <= retries:
             try:
                 response = client.messages.create(
                     model=model,
-                    max_tokens=max_tokens,
-                    temperature=0,
-                    messages=[
-                        {
-                            "role": "user",
-                            "content": prompt,
-                        }
-                    ],
+                    **_summary_message_params(prompt=prompt, max_tokens=max_tokens),
                 )
                 break
             except Exception as exc:
                 if _is_model_not_found_error(exc):
+                    _mark_model_unavailable(fingerprint, model)
                     last_exc = exc
                     break
                 if _is_transient_summary_error(exc) and attempt < retries:
@@ -433,19 +1097,196 @@ def _request_text_with_model_fallback(
                     continue
                 raise
         if response is not None:
+            if models is None:
+                _remember_model(fingerprint, model)
             break
 
     if response is None:
-        candidate_list = ", ".join(_summary_model_candidates())
-        if last_exc is not None:
-            raise RuntimeError(
-                f"No configured summary model was available ({candidate_list}). "
-                "Set MEETINGCTL_SUMMARY_MODEL to a model your Anthropic account can access."
-            ) from last_exc
-        raise RuntimeError(
-            "No summary model candidates configured. "
-            "Set MEETINGCTL_SUMMARY_MODEL to a valid Anthropic model."
-        )
+        raise _no_summary_model_error(last_exc, models) from last_exc
+    _record_usage(usage, response)
+    return _extract_text_content(response)
+
+
+async def _arequest_text_with_model_fallback(
+    *,
+    client: anthropic.AsyncAnthropic,
+    prompt: _SummaryPrompt,
+    max_tokens: int,
+    limiter: SummaryRateLimiter,
+    usage: dict[str, int] | None = None,
+) -> str:
+    last_exc: Exception | None = None
+    fingerprint = _api_key_fingerprint(client)
+    # The model-memory state file is read and written off the event loop.
+    for model in await asyncio.to_thread(_ordered_model_candidates, fingerprint):
+        retries = _summary_request_retries()
+        attempt = 0
+        while True:
+            try:
+                async with limiter.request():
+                    # Raw response so successful calls also report the rate-limit headers.
+                    raw = await client.messages.with_raw_response.create(
+                        model=model,
+                        **_summary_message_params(prompt=prompt, max_tokens=max_tokens),
+                    )
+            except Exception as exc:
+                if _is_model_not_found_error(exc):
+                    _mark_model_unavailable(fingerprint, model)
+                    last_exc = exc
+                    break
+                if not _is_transient_summary_error(exc) or attempt >= retries:
+                    raise
+                headers = getattr(getattr(exc, "response", None), "headers", None)
+                if _retry_after_seconds(headers) is not None:
+                    # Server-advertised backoff applies to every request sharing the limiter.
+                    limiter.observe_headers(headers)
+                else:
+                    await asyncio.sleep(_summary_retry_base_seconds() * (2**attempt))
+                attempt += 1
+                continue
+            limiter.observe_headers(raw.headers)
+            response = raw.parse()
+            await asyncio.to_thread(_remember_model, fingerprint, model)
+            _record_usage(usage, response)
+            return _extract_text_content(response)
+    raise _no_summary_model_error(last_exc) from last_exc
+
+
+def _stream_delta_text(event: object) -> str:
+    if getattr(event, "type", None) != "content_block_delta":
+        return ""
+    delta = getattr(event, "delta", None)
+    # Tool mode streams the tool input as JSON fragments; text mode streams plain text.
+    for field in ("partial_json", "text"):
+        value = getattr(delta, field, None)
+        if isinstance(value, str):
+            return value
+    return ""
+
+
+class _PartialMinutesDecoder:
+    """Decode the ``minutes`` JSON string from streamed fragments as they arrive.
+
+    Only text not yet consumed is scanned, so the cost stays linear in the response length.
+    Escape sequences split across fragments are held back until complete and then decoded by
+    :mod:`json`.
+    """
+
+    _KEY_RE = re.compile(r'"minutes"\s*:\s*"')
+    _KEY_TAIL_CHARS = 64
+    _DECODER = json.JSONDecoder(strict=False)
+
+    def __init__(self) -> None:
+        self._pending = ""
+        self._started = False
+        self._closed = False
+        self.minutes = ""
+
+    def feed(self, fragment: str) -> bool:
+        """Consume ``fragment`` and return whether the decoded minutes grew."""
+        if self._closed:
+            return False
+        self._pending += fragment
+        if not self._started:
+            match = self._KEY_RE.search(self._pending)
+            if match is None:
+                # The key itself may be split across fragments.
+                self._pending = self._pending[-self._KEY_TAIL_CHARS :]
+                return False
+            self._started = True
+            self._pending = self._pending[match.end() :]
+        safe, self._closed = self._complete_prefix(self._pending)
+        segment = self._pending[:safe]
+        self._pending = self._pending[safe + 1 :] if self._closed else self._pending[safe:]
+        if not segment:
+            return False
+        try:
+            self.minutes += self._DECODER.decode(f'"{segment}"')
+        except ValueError:
+            self.minutes += segment
+        return True
+
+    @staticmethod
+    def _complete_prefix(text: str) -> tuple[int, bool]:
+        # Length of the leading run without a partial escape, and whether the string closed.
+        index = 0
+        while index < len(text):
+            char = text[index]
+            if char == '"':
+                return index, True
+            if char != "\\":
+                index += 1
+                continue
+            if index + 1 >= len(text):
+                break
+            if text[index + 1] != "u":
+                index += 2
+                continue
+            if index + 6 > len(text):
+                break
+            try:
+                code = int(text[index + 2 : index + 6], 16)
+            except ValueError:
+                index += 2
+                continue
+            # A high surrogate is only decodable together with the escape that follows it.
+            width = 12 if 0xD800 <= code <= 0xDBFF else 6
+            if index + width > len(text):
+                break
+            index += width
+        return index, False
+
+
+def _stream_text_with_model_fallback(
+    *,
+    client: anthropic.Anthropic,
+    prompt: _SummaryPrompt,
+    max_tokens: int,
+    on_minutes: Callable[[str], None],
+    usage: dict[str, int] | None = None,
+) -> str:
+    last_exc: Exception | None = None
+    response = None
+    fingerprint = _api_key_fingerprint(client)
+    for model in _ordered_model_candidates(fingerprint):
+        retries = _summary_request_retries()
+        attempt = 0
+        while attempt <= retries:
+            received = False
+            try:
+                with client.messages.stream(
+                    model=model,
+                    **_summary_message_params(prompt=prompt, max_tokens=max_tokens),
+                ) as stream:
+                    # A retried stream starts over; each callback carries the full minutes so far.
+                    decoder = _PartialMinutesDecoder()
+                    for event in stream:
+                        delta = _stream_delta_text(event)
+                        if not delta:
+                            continue
+                        received = True
+                        if decoder.feed(delta) and decoder.minutes.strip():
+                            on_minutes(decoder.minutes.strip())
+                    response = stream.get_final_message()
+                break
+            except Exception as exc:
+                if _is_model_not_found_error(exc) and not received:
+                    _mark_model_unavailable(fingerprint, model)
+                    last_exc = exc
+                    break
+                if _is_transient_summary_error(exc) and attempt < retries:
+                    delay = _summary_retry_base_seconds() * (2**attempt)
+                    time.sleep(delay)
+                    attempt += 1
+                    continue
+                raise
+        if response is not None:
+            _remember_model(fingerprint, model)
+            break
+
+    if response is None:
+        raise _no_summary_model_error(last_exc) from last_exc
+    _record_usage(usage, response)
     return _extract_text_content(response)
 
 
@@ -461,29 +1302,28 @@ def _parse_summary_payload(raw_text: str) -> dict[str, object]:
         raise
 
 
+def _count_repair(usage: dict[str, int] | None) -> None:
+    if usage is None:
+        return
+    with _USAGE_LOCK:
+        usage["repairs"] = usage.get("repairs", 0) + 1
+
+
 def _repair_summary_json(
     *,
     client: anthropic.Anthropic,
     malformed_text: str,
+    usage: dict[str, int] | None = None,
+    models: list[str] | None = None,
+    source: _SummaryPrompt | None = None,
 ) -> dict[str, object]:
-    repair_prompt = f"""Convert the following assistant output into valid JSON.
-
-Requirements:
-- Output ONLY valid JSON (no prose, no markdown fences).
-- Include exactly these keys:
-  - "minutes" (string)
-  - "decisions" (array of strings)
-  - "action_items" (array of strings)
-- Keep all useful detail from the source when possible.
-- If a field is missing/unknown, use empty string for minutes or empty arrays for lists.
-
-Source output:
-{malformed_text}
-"""
+    _count_repair(usage)
     repaired_text = _request_text_with_model_fallback(
         client=client,
-        prompt=repair_prompt,
+        prompt=_repair_prompt(malformed_text, source),
         max_tokens=_repair_max_tokens(),
+        usage=usage,
+        models=models,
     )
     try:
         return _parse_summary_payload(repaired_text)
@@ -491,12 +1331,252 @@ Source output:
         return _coerce_summary_payload(repaired_text or malformed_text)
 
 
-def generate_summary(transcript: str, *, api_key: str) -> dict[str, object]:
+def _estimate_tokens(text: str) -> int:
+    return len(text) // _CHARS_PER_TOKEN + 1
+
+
+def _split_long_turn(line: str, budget_chars: int) -> list[str]:
+    if len(line) <= budget_chars:
+        return [line]
+    # Continuation pieces keep the "[start-end] SPEAKER:" prefix so attribution survives.
+    match = _TURN_PREFIX_RE.match(line)
+    prefix = match.group(1) if match else ""
+    body = line[match.end() :] if match else line
+    pieces: list[str] = []
+    current: list[str] = []
+    size = len(prefix)
+    for word in body.split():
+        if current and size + len(word) + 1 > budget_chars:
+            pieces.append(" ".join([prefix, *current]).strip())
+            current = []
+            size = len(prefix)
+        current.append(word)
+        size += len(word) + 1
+    if current:
+        pieces.append(" ".join([prefix, *current]).strip())
+    return pieces
+
+
+def _chunk_transcript(transcript: str, max_tokens: int) -> list[str]:
+    """Split a transcript into chunks of at most ``max_tokens`` (estimated) between lines.
+
+    Diarized transcripts carry one speaker turn per line, so turns are only split when a
+    single turn exceeds the budget on its own.
+    """
+    budget_chars = max(max_tokens * _CHARS_PER_TOKEN, 1)
+    chunks: list[str] = []
+    current: list[str] = []
+    size = 0
+    for line in transcript.splitlines():
+        if not line.strip():
+            continue
+        for piece in _split_long_turn(line.strip(), budget_chars):
+            if current and size + len(piece) + 1 > budget_chars:
+                chunks.append("\n".join(current))
+                current = []
+                size = 0
+            current.append(piece)
+            size += len(piece) + 1
+    if current:
+        chunks.append("\n".join(current))
+    return chunks
+
+
+def _complete_summary(
+    *,
+    client: anthropic.Anthropic,
+    prompt: _SummaryPrompt,
+    max_tokens: int,
+    usage: dict[str, int] | None = None,
+    models: list[str] | None = None,
+) -> dict[str, object]:
+    response_text = _request_text_with_model_fallback(
+        client=client,
+        prompt=prompt,
+        max_tokens=max_tokens,
+        usage=usage,
+        models=models,
+    )
+
+    # Parse and validate response, then attempt one repair pass if malformed.
+    try:
+        return _parse_summary_payload(response_text)
+    except SummaryParseError:
+        return _repair_summary_json(
+            client=client, malformed_text=response_text, usage=usage, models=models, source=prompt
+        )
+
+
+def _complete_summaries_concurrently(
+    *,
+    client: anthropic.Anthropic,
+    prompts: list[_SummaryPrompt],
+    max_tokens: int,
+    usage: dict[str, int] | None = None,
+) -> list[dict[str, object]]:
+    workers = min(_summary_max_concurrency(), len(prompts))
+
+    def _complete(prompt: _SummaryPrompt) -> dict[str, object]:
+        return _complete_summary(client=client, prompt=prompt, max_tokens=max_tokens, usage=usage)
+
+    if workers <= 1:
+        return [_complete(prompt) for prompt in prompts]
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="summary-chunk") as executor:
+        return list(executor.map(_complete, prompts))
+
+
+def _reduce_prompt(partials: list[dict[str, object]]) -> _SummaryPrompt:
+    return _SummaryPrompt(
+        _REDUCE_INSTRUCTIONS,
+        _REDUCE_PROMPT_TEMPLATE.format(
+            parts=len(partials),
+            partials=json.dumps(partials, indent=2, ensure_ascii=False),
+        ),
+    )
+
+
+def _group_partials(partials: list[dict[str, object]], max_tokens: int) -> list[list[dict[str, object]]]:
+    groups: list[list[dict[str, object]]] = []
+    current: list[dict[str, object]] = []
+    size = 0
+    for partial in partials:
+        tokens = _estimate_tokens(json.dumps(partial, ensure_ascii=False))
+        if current and size + tokens > max_tokens:
+            groups.append(current)
+            current = []
+            size = 0
+        current.append(partial)
+        size += tokens
+    if current:
+        groups.append(current)
+    return groups
+
+
+def _map_reduce_summary(
+    *,
+    client: anthropic.Anthropic,
+    transcript: str,
+    chunk_tokens: int,
+    usage: dict[str, int] | None = None,
+) -> dict[str, object]:
+    chunks = _chunk_transcript(transcript, chunk_tokens)
+    partial_max_tokens = max(_summary_max_tokens() // 2, 512)
+    partials = _complete_summaries_concurrently(
+        client=client,
+        prompts=[_map_prompt(index, len(chunks), chunk) for index, chunk in enumerate(chunks, start=1)],
+        max_tokens=partial_max_tokens,
+        usage=usage,
+    )
+    # Very long meetings can produce more partial minutes than fit in one reduce prompt;
+    # merge them in concurrent rounds until they do (or grouping stops making progress).
+    groups = _group_partials(partials, chunk_tokens)
+    while 1 < len(groups) < len(partials):
+        partials = _complete_summaries_concurrently(
+            client=client,
+            prompts=[_reduce_prompt(group) for group in groups],
+            max_tokens=partial_max_tokens,
+            usage=usage,
+        )
+        groups = _group_partials(partials, chunk_tokens)
+    return _complete_summary(
+        client=client,
+        prompt=_reduce_prompt(partials),
+        max_tokens=_summary_max_tokens(),
+        usage=usage,
+    )
+
+
+def summary_needs_chunking(transcript: str) -> bool:
+    """Whether ``transcript`` is long enough, after compaction, to be summarized with map-reduce."""
+    chunk_tokens = _summary_chunk_tokens()
+    return bool(chunk_tokens) and _estimate_tokens(_summary_transcript(transcript)) > chunk_tokens
+
+
+def _batch_client(api_key: str) -> anthropic.Anthropic:
+    resolved_api_key = _resolve_api_key(api_key)
+    if not resolved_api_key:
+        raise ValueError("API key is required")
+    return _summary_client(resolved_api_key)
+
+
+def create_summary_batch(
+    transcripts: Mapping[str, str],
+    *,
+    api_key: str,
+    usage: dict[str, int] | None = None,
+) -> str:
+    """Submit one summary request per ``custom_id`` as a Message Batch and return its ID.
+
+    Batches run a single model: the last model that worked for this key, else the first
+    MEETINGCTL_SUMMARY_MODEL candidate. Callers fall back to :func:`generate_summary` for
+    requests that do not succeed.
+    """
+    client = _batch_client(api_key)
+    candidates = _ordered_model_candidates(_api_key_fingerprint(client))
+    if not candidates:
+        raise _no_summary_model_error(None)
+    batch = client.messages.batches.create(
+        requests=[
+            {
+                "custom_id": custom_id,
+                "params": {
+                    "model": candidates[0],
+                    **_summary_message_params(
+                        prompt=_summary_prompt(_summary_transcript(transcript, usage)),
+                        max_tokens=_summary_max_tokens(),
+                    ),
+                },
+            }
+            for custom_id, transcript in transcripts.items()
+        ]
+    )
+    return str(batch.id)
+
+
+def summary_batch_status(batch_id: str, *, api_key: str) -> str:
+    batch = _batch_client(api_key).messages.batches.retrieve(batch_id)
+    return str(batch.processing_status)
+
+
+def summary_batch_results(
+    batch_id: str,
+    *,
+    api_key: str,
+    usage: dict[str, int] | None = None,
+) -> Iterator[tuple[str, dict[str, object] | None, str]]:
+    """Yield ``(custom_id, summary, result_type)`` for an ended batch.
+
+    ``summary`` is None unless the request succeeded; malformed JSON gets the usual repair pass.
+    Token usage, including prompt-cache reads and writes, is added to ``usage`` when given.
+    """
+    client = _batch_client(api_key)
+    for entry in client.messages.batches.results(batch_id):
+        result_type = str(entry.result.type)
+        if result_type != "succeeded":
+            yield entry.custom_id, None, result_type
+            continue
+        _record_usage(usage, entry.result.message)
+        response_text = _extract_text_content(entry.result.message)
+        try:
+            summary = _parse_summary_payload(response_text)
+        except SummaryParseError:
+            summary = _repair_summary_json(client=client, malformed_text=response_text, usage=usage)
+        yield entry.custom_id, summary, result_type
+
+
+def generate_summary(
+    transcript: str,
+    *,
+    api_key: str,
+    usage: dict[str, int] | None = None,
+) -> dict[str, object]:
     """Generate meeting summary from transcript using LLM API.
 
     Args:
         transcript: Meeting transcript text
         api_key: Anthropic API key
+        usage: Optional dict that accumulates request count and token usage, including
+            ``cache_read_input_tokens`` (prompt-cache hits) and ``cache_creation_input_tokens``
 
     Returns:
         Parsed summary dictionary with minutes, decisions, and action_items
@@ -509,50 +1589,211 @@ def generate_summary(transcript: str, *, api_key: str) -> dict[str, object]:
     if not resolved_api_key:
         raise ValueError("API key is required")
 
-    client_kwargs: dict[str, object] = {
-        "api_key": resolved_api_key,
-        "timeout": _summary_timeout_seconds(),
-    }
-    http_client = _summary_http_client()
-    if http_client is not None:
-        client_kwargs["http_client"] = http_client
-    client = anthropic.Anthropic(**client_kwargs)
+    client = _summary_client(resolved_api_key)
+    transcript = _summary_transcript(transcript, usage)
 
-    prompt = f"""You are a meeting assistant. Given the following meeting transcript, generate a structured summary.
+    chunk_tokens = _summary_chunk_tokens()
+    if chunk_tokens and _estimate_tokens(transcript) > chunk_tokens:
+        return _map_reduce_summary(
+            client=client, transcript=transcript, chunk_tokens=chunk_tokens, usage=usage
+        )
 
-Transcript:
-{transcript}
+    return _complete_summary(
+        client=client,
+        prompt=_summary_prompt(transcript),
+        max_tokens=_summary_max_tokens(),
+        usage=usage,
+    )
 
-Respond with ONLY a JSON object in this exact format:
-{{
-  "minutes": "Markdown text with sectioned bullets and sub-bullets",
-  "decisions": ["Decision 1", "Decision 2"],
-  "action_items": ["Owner: <name or Unknown>; Task: <action>; Due: <date or TBD>"]
-}}
 
-Formatting rules:
-- `minutes` must be detailed and use markdown bullets/sub-bullets with clear sections in this order:
-  1) Meeting Details (title/date/time if inferable, including UTC and US Central when available)
-  2) Attendees (participants and inferred roles if available)
-  3) Agenda
-  4) Key Themes & Pain Points
-  5) Minutes & Decisions (discussion narrative in structured bullets)
-- Keep `minutes` concise but thorough; prefer nested bullets for readability.
-- `decisions` must be a list of concise, stand-alone decision statements.
-- `action_items` must be a list where each item follows:
-  "Owner: <name or Unknown>; Task: <action>; Due: <date or TBD>"
-- If no decisions or action items exist, use empty arrays.
-- Do not include markdown code fences.
-"""
+def stream_summary(
+    transcript: str,
+    *,
+    api_key: str,
+    on_minutes: Callable[[str], None],
+    usage: dict[str, int] | None = None,
+) -> dict[str, object]:
+    """Streaming variant of :func:`generate_summary` that reports minutes as they arrive.
 
-    response_text = _request_text_with_model_fallback(
+    ``on_minutes`` receives the minutes decoded so far each time they grow; decisions and
+    action items are only available in the returned summary. Output that does not parse gets
+    the usual repair pass, and transcripts that need map-reduce are summarized without streaming.
+    """
+    resolved_api_key = _resolve_api_key(api_key)
+    if not resolved_api_key:
+        raise ValueError("API key is required")
+
+    client = _summary_client(resolved_api_key)
+    transcript = _summary_transcript(transcript, usage)
+
+    chunk_tokens = _summary_chunk_tokens()
+    if chunk_tokens and _estimate_tokens(transcript) > chunk_tokens:
+        return _map_reduce_summary(
+            client=client, transcript=transcript, chunk_tokens=chunk_tokens, usage=usage
+        )
+
+    prompt = _summary_prompt(transcript)
+    response_text = _stream_text_with_model_fallback(
         client=client,
         prompt=prompt,
         max_tokens=_summary_max_tokens(),
+        on_minutes=on_minutes,
+        usage=usage,
     )
+    try:
+        return _parse_summary_payload(response_text)
+    except SummaryParseError:
+        return _repair_summary_json(client=client, malformed_text=response_text, usage=usage, source=prompt)
 
-    # Parse and validate response, then attempt one repair pass if malformed.
+
+def generate_draft_summary(
+    transcript: str,
+    *,
+    api_key: str,
+    usage: dict[str, int] | None = None,
+) -> dict[str, object]:
+    """Generate a short first-pass summary with the draft model and token cap.
+
+    Meant to fill the note quickly before :func:`generate_summary` replaces it. Long
+    transcripts go out as one request instead of map-reduce, trading detail for latency.
+    """
+    resolved_api_key = _resolve_api_key(api_key)
+    if not resolved_api_key:
+        raise ValueError("API key is required")
+
+    client = _summary_client(resolved_api_key)
+    return _complete_summary(
+        client=client,
+        prompt=_draft_prompt(_summary_transcript(transcript, usage)),
+        max_tokens=_summary_draft_max_tokens(),
+        usage=usage,
+        models=_summary_draft_models(),
+    )
+
+
+async def _acomplete_summary(
+    *,
+    client: anthropic.AsyncAnthropic,
+    prompt: _SummaryPrompt,
+    max_tokens: int,
+    limiter: SummaryRateLimiter,
+    usage: dict[str, int] | None = None,
+) -> dict[str, object]:
+    response_text = await _arequest_text_with_model_fallback(
+        client=client,
+        prompt=prompt,
+        max_tokens=max_tokens,
+        limiter=limiter,
+        usage=usage,
+    )
     try:
         return _parse_summary_payload(response_text)
     except SummaryParseError:
-        return _repair_summary_json(client=client, malformed_text=response_text)
+        pass
+    _count_repair(usage)
+    repaired_text = await _arequest_text_with_model_fallback(
+        client=client,
+        prompt=_repair_prompt(response_text, prompt),
+        max_tokens=_repair_max_tokens(),
+        limiter=limiter,
+        usage=usage,
+    )
+    try:
+        return _parse_summary_payload(repaired_text)
+    except SummaryParseError:
+        return _coerce_summary_payload(repaired_text or response_text)
+
+
+async def _acomplete_summaries_concurrently(
+    *,
+    client: anthropic.AsyncAnthropic,
+    prompts: list[_SummaryPrompt],
+    max_tokens: int,
+    limiter: SummaryRateLimiter,
+    usage: dict[str, int] | None = None,
+) -> list[dict[str, object]]:
+    semaphore = asyncio.Semaphore(_summary_max_concurrency())
+
+    async def _bounded(prompt: _SummaryPrompt) -> dict[str, object]:
+        async with semaphore:
+            return await _acomplete_summary(
+                client=client, prompt=prompt, max_tokens=max_tokens, limiter=limiter, usage=usage
+            )
+
+    return list(await asyncio.gather(*(_bounded(prompt) for prompt in prompts)))
+
+
+async def _amap_reduce_summary(
+    *,
+    client: anthropic.AsyncAnthropic,
+    transcript: str,
+    chunk_tokens: int,
+    limiter: SummaryRateLimiter,
+    usage: dict[str, int] | None = None,
+) -> dict[str, object]:
+    chunks = _chunk_transcript(transcript, chunk_tokens)
+    partial_max_tokens = max(_summary_max_tokens() // 2, 512)
+    partials = await _acomplete_summaries_concurrently(
+        client=client,
+        prompts=[_map_prompt(index, len(chunks), chunk) for index, chunk in enumerate(chunks, start=1)],
+        max_tokens=partial_max_tokens,
+        limiter=limiter,
+        usage=usage,
+    )
+    groups = _group_partials(partials, chunk_tokens)
+    while 1 < len(groups) < len(partials):
+        partials = await _acomplete_summaries_concurrently(
+            client=client,
+            prompts=[_reduce_prompt(group) for group in groups],
+            max_tokens=partial_max_tokens,
+            limiter=limiter,
+            usage=usage,
+        )
+        groups = _group_partials(partials, chunk_tokens)
+    return await _acomplete_summary(
+        client=client,
+        prompt=_reduce_prompt(partials),
+        max_tokens=_summary_max_tokens(),
+        limiter=limiter,
+        usage=usage,
+    )
+
+
+async def agenerate_summary(
+    transcript: str,
+    *,
+    api_key: str,
+    limiter: SummaryRateLimiter | None = None,
+    usage: dict[str, int] | None = None,
+) -> dict[str, object]:
+    """Async counterpart of :func:`generate_summary` for summarizing many meetings at once.
+
+    All calls share ``limiter`` (the process-wide :func:`summary_rate_limiter` by default),
+    so ``asyncio.gather`` over many transcripts stays inside the account's request budget
+    and backs off together when the API returns ``retry-after``.
+    """
+    resolved_api_key = await asyncio.to_thread(_resolve_api_key, api_key)
+    if not resolved_api_key:
+        raise ValueError("API key is required")
+
+    client = _async_summary_client(resolved_api_key)
+    limiter = limiter or summary_rate_limiter()
+    transcript = _summary_transcript(transcript, usage)
+
+    chunk_tokens = _summary_chunk_tokens()
+    if chunk_tokens and _estimate_tokens(transcript) > chunk_tokens:
+        return await _amap_reduce_summary(
+            client=client,
+            transcript=transcript,
+            chunk_tokens=chunk_tokens,
+            limiter=limiter,
+            usage=usage,
+        )
+
+    return await _acomplete_summary(
+        client=client,
+        prompt=_summary_prompt(transcript),
+        max_tokens=_summary_max_tokens(),
+        limiter=limiter,
+        usage=usage,
+    )
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import re
+
+
+# Bump when the output changes so cached summaries of compacted transcripts are not reused.
+COMPACTION_VERSION = 2
+
+_DIARIZED_TURN_RE = re.compile(r"^\[[^\]]*\]\s+(?P<speaker>[^:\s]+):\s*(?P<text>.*)$")
+# Standalone disfluencies and back-channel acknowledgements; content words such as "like" or
+# "so" are left alone because they cannot be told apart from real usage without context.
+_FILLER_RE = re.compile(
+    r"(?<![\w'-])(?:u+m+|u+h+|e+r+m+|h+m+|m+h+m+|m+-?h+m+|uh-huh)(?![\w'-])[,.!?]*\s*",
+    re.IGNORECASE,
+)
+_MAX_LOOP_WORDS = 8
+_MIN_LOOP_REPEATS = 3
+# A collapsed turn holds at most two copies of any looping phrase, so a loop that straddles
+# a merge can only reach this many words back into the earlier turn.
+_JOIN_TAIL_WORDS = _MAX_LOOP_WORDS * (_MIN_LOOP_REPEATS - 1)
+
+
+def _normalize_word(word: str) -> str:
+    return word.strip(".,!?;:\"'()").lower()
+
+
+def collapse_repetition_loops(text: str) -> str:
+    """Keep one copy of any 1-8 word phrase repeated three or more times in a row.
+
+    Whisper hallucinates loops such as "Thank you. Thank you. Thank you." on silence.
+    """
+    words = text.split()
+    keys = [_normalize_word(word) for word in words]
+    kept: list[str] = []
+    index = 0
+    while index < len(words):
+        collapsed = False
+        for size in range(1, min(_MAX_LOOP_WORDS, len(words) - index) + 1):
+            window = keys[index : index + size]
+            repeats = 1
+            while keys[index + repeats * size : index + (repeats + 1) * size] == window:
+                repeats += 1
+            if repeats >= _MIN_LOOP_REPEATS:
+                kept.extend(words[index : index + size])
+                index += repeats * size
+                collapsed = True
+                break
+        if not collapsed:
+            kept.append(words[index])
+            index += 1
+    return " ".join(kept)
+
+
+def strip_filler(text: str) -> str:
+    return " ".join(_FILLER_RE.sub(" ", text).split())
+
+
+def compact_transcript(transcript: str) -> str:
+    """Shrink a transcript before summarization without changing what was said.
+
+    Diarized ``[start-end] SPEAKER_NN: text`` lines lose their timestamps and consecutive
+    turns by the same speaker are merged; filler and repetition loops are removed from every
+    line, and lines left empty (bare "mm-hmm" turns) or exactly repeating the previous line
+    are dropped.
+    """
+    # Entries are [speaker, words, last line text]; merged turns only re-check the join.
+    entries: list[list] = []
+    for raw_line in transcript.splitlines():
+        line = raw_line.strip()
+        if not line:
+            continue
+        match = _DIARIZED_TURN_RE.match(line)
+        speaker, text = (match.group("speaker"), match.group("text")) if match else (None, line)
+        text = collapse_repetition_loops(strip_filler(text))
+        if not text:
+            continue
+        if entries and entries[-1][0] == speaker:
+            entry = entries[-1]
+            if text.lower() == entry[2].lower():
+                continue
+            if speaker is not None:
+                words = entry[1]
+                tail = words[-_JOIN_TAIL_WORDS:]
+                del words[-_JOIN_TAIL_WORDS:]
+                words.extend(collapse_repetition_loops(" ".join([*tail, text])).split())
+                entry[2] = text
+                continue
+        entries.append([speaker, text.split(), text])
+    return "\n".join(
+        f"{speaker}: {' '.join(words)}" if speaker else " ".join(words) for speaker, words, _ in entries
+    )
@@ -0,0 +1,56 @@
+"""Transcript JSON artifact formats shared by meetingctl and the diarization sidecar.
+
+The sidecar image copies this file next to ``diarize.py``, so it must stay standard-library
+only and must not import anything from ``meetingctl``.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+from pathlib import Path
+
+
+TRANSCRIPT_NDJSON_FORMAT = "meetingctl-transcript-ndjson/1"
+TRANSCRIPT_JSON_FORMATS = ("pretty", "compact", "ndjson")
+
+
+def transcript_json_suffix(json_format: str, *, compress: bool) -> str:
+    """File suffix for a transcript in ``json_format``: ``.json``/``.ndjson``, plus ``.gz``."""
+    suffix = ".ndjson" if json_format == "ndjson" else ".json"
+    return f"{suffix}.gz" if compress else suffix
+
+
+def is_plain_transcript_json(path: Path) -> bool:
+    """Whether ``path`` is named as a plain (pretty or compact) JSON transcript."""
+    return path.suffix == ".json"
+
+
+def load_transcript_json(path: Path) -> dict[str, object]:
+    """Load a transcript JSON artifact written as indented JSON, minified JSON, or NDJSON.
+
+    NDJSON transcripts carry a header object (``format`` marker plus top-level keys) on the
+    first line and one segment per following line. Any of these may be gzip-compressed; the
+    content is sniffed, so older artifacts that kept a ``.json`` name still load. Raises
+    ``ValueError`` for unreadable or non-object payloads.
+    """
+    raw = path.read_bytes()
+    if raw[:2] == b"\x1f\x8b":
+        try:
+            raw = gzip.decompress(raw)
+        except (OSError, EOFError) as exc:
+            raise ValueError(f"Corrupt gzip transcript JSON: {path}") from exc
+    text = raw.decode("utf-8")
+    head, _, rest = text.partition("\n")
+    try:
+        first = json.loads(head)
+    except json.JSONDecodeError:
+        first = None
+    if isinstance(first, dict) and first.get("format") == TRANSCRIPT_NDJSON_FORMAT:
+        payload = {key: value for key, value in first.items() if key != "format"}
+        payload["segments"] = [json.loads(line) for line in rest.splitlines() if line.strip()]
+        return payload
+    payload = first if first is not None and not rest.strip() else json.loads(text)
+    if not isinstance(payload, dict):
+        raise ValueError(f"Transcript JSON root must be an object: {path}")
+    return payload
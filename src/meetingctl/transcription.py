@@ -8,6 +8,13 @@ import subprocess
 import sys
 from typing import Callable, Protocol
 
+from meetingctl.transcript_json import is_plain_transcript_json, load_transcript_json
+
+
+ARTIFACT_LINK_MODES = ("auto", "hardlink", "copy")
+# Linux FICLONE ioctl request number (_IOW(0x94, 9, int)); btrfs/xfs/bcachefs support it.
+_FICLONE = 0x40049409
+
 
 class TranscriptionError(RuntimeError):
     pass
@@ -169,7 +176,13 @@ class SidecarDiarizationTranscriptionRunner:
 
     def diarize_existing_transcript(self, *, wav_path: Path, transcript_path: Path) -> Path:
         transcript_json_path = transcript_path.with_suffix(".json")
-        if not transcript_json_path.exists():
+        segments: object = None
+        if transcript_json_path.exists():
+            try:
+                segments = load_transcript_json(transcript_json_path).get("segments")
+            except ValueError:
+                segments = None
+        if not isinstance(segments, list) or not segments:
             raise TranscriptionError(
                 f"Cannot diarize existing transcript without JSON segments: {transcript_json_path}"
             )
@@ -239,11 +252,13 @@ class SidecarDiarizationTranscriptionRunner:
             if not source_path.exists():
                 raise TranscriptionError(f"Diarization sidecar missing expected artifact: {source_path}")
             diarized_target = transcript_path.with_name(f"{transcript_path.stem}.diarized{ext}")
-            diarized_target.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copyfile(source_path, diarized_target)
+            if ext == ".json":
+                promote_transcript_json(source_path, diarized_target)
+            else:
+                promote_artifact(source_path, diarized_target)
 
             active_target = transcript_path if ext == ".txt" else transcript_path.with_suffix(ext)
-            shutil.copyfile(source_path, active_target)
+            promote_artifact(diarized_target, active_target)
         return transcript_path
 
 
@@ -438,6 +453,96 @@ def _promote_transcript_artifacts(
         generated_path.replace(target_path)
 
 
+def promote_artifact(source: Path, target: Path, *, link_mode: str | None = None) -> str:
+    """Place ``source`` at ``target`` without duplicating bytes where the filesystem allows it.
+
+    ``auto`` tries a copy-on-write clone (APFS ``clonefile``, Linux ``FICLONE``) and falls back
+    to a byte copy. ``hardlink`` additionally tries ``os.link`` before copying; only use it when
+    nothing rewrites promoted artifacts in place, since both names share one inode. ``copy``
+    always copies. The result is staged next to ``target`` and renamed over it atomically, so
+    readers never observe a partial file. Returns the method used.
+    """
+    mode = link_mode or _artifact_link_mode()
+    target.parent.mkdir(parents=True, exist_ok=True)
+    staging = target.with_name(f".{target.name}.{os.getpid()}.promote")
+    staging.unlink(missing_ok=True)
+    try:
+        method = _materialize_artifact(source, staging, mode=mode)
+        os.replace(staging, target)
+    except BaseException:
+        staging.unlink(missing_ok=True)
+        raise
+    return method
+
+
+def promote_transcript_json(source: Path, target: Path) -> str:
+    """Promote a sidecar transcript JSON to ``target`` as plain JSON.
+
+    Job copies may be NDJSON or gzip (``.ndjson``/``.json.gz``); vault artifacts keep the
+    ``.json`` name, so those are decoded and rewritten as indented JSON instead of copied.
+    """
+    if is_plain_transcript_json(source):
+        return promote_artifact(source, target)
+    payload = load_transcript_json(source)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    staging = target.with_name(f".{target.name}.{os.getpid()}.promote")
+    try:
+        staging.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+        os.replace(staging, target)
+    except BaseException:
+        staging.unlink(missing_ok=True)
+        raise
+    return "decode"
+
+
+def _artifact_link_mode() -> str:
+    raw = os.environ.get("MEETINGCTL_ARTIFACT_LINK_MODE", "").strip().lower()
+    return raw if raw in ARTIFACT_LINK_MODES else "auto"
+
+
+def _materialize_artifact(source: Path, staging: Path, *, mode: str) -> str:
+    if mode != "copy":
+        if _reflink(source, staging):
+            return "reflink"
+        if mode == "hardlink":
+            try:
+                os.link(source, staging)
+                return "hardlink"
+            except OSError:
+                pass
+    shutil.copyfile(source, staging)
+    return "copy"
+
+
+def _reflink(source: Path, target: Path) -> bool:
+    if sys.platform == "darwin":
+        return _clonefile(source, target)
+    try:
+        import fcntl
+    except ImportError:
+        return False
+    try:
+        with source.open("rb") as src, target.open("xb") as dst:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+    except OSError:
+        # Cross-device, unsupported filesystem, or missing source: let the caller fall back.
+        target.unlink(missing_ok=True)
+        return False
+    return True
+
+
+def _clonefile(source: Path, target: Path) -> bool:
+    import ctypes
+    import ctypes.util
+
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        clonefile = libc.clonefile
+    except (OSError, AttributeError):
+        return False
+    return clonefile(os.fsencode(source), os.fsencode(target), 0) == 0
+
+
 def _subprocess_run_captured(args: list[str], *, check: bool = True) -> subprocess.CompletedProcess:
     completed = subprocess.run(
         args,
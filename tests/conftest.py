@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from meetingctl.summary_client import reset_summary_clients
+
+
+@pytest.fixture(autouse=True)
+def _isolated_summary_cache(monkeypatch, tmp_path: Path) -> None:
+    # Keep the persistent summary cache out of ~/.local/state and separate per test.
+    monkeypatch.setenv("MEETINGCTL_SUMMARY_CACHE_DIR", str(tmp_path / "summary-cache"))
+    monkeypatch.setenv("MEETINGCTL_SUMMARY_BATCH_STATE_FILE", str(tmp_path / "summary_batch.json"))
+    monkeypatch.setenv("MEETINGCTL_SUMMARY_MODEL_STATE_FILE", str(tmp_path / "summary_model.json"))
+
+
+@pytest.fixture(autouse=True)
+def _fresh_summary_clients():
+    # Pooled Anthropic clients and cached secrets must not leak mocks between tests.
+    reset_summary_clients()
+    yield
+    reset_summary_clients()
@@ -4,6 +4,7 @@ import json
 from pathlib import Path
 import shutil
 import subprocess
+import threading
 import uuid
 
 from scripts import diarization_catchup
@@ -481,3 +482,260 @@ def test_run_reports_checkpoint_issue_without_stopping(monkeypatch, tmp_path: Pa
     issue_summary = payload["issue_summary"]
     assert issue_summary[0]["code"] == "lightning_checkpoint_upgrade_required"
     assert "compatible Lightning/WhisperX versions" in issue_summary[0]["action"]
+
+
+def _write_mapped_recordings(recordings: Path, vault: Path, count: int) -> list[str]:
+    meeting_ids: list[str] = []
+    for index in range(count):
+        audio = recordings / f"20260309-{10 + index:02d}00_Audio.m4a"
+        audio.write_text("m4a")
+        meeting_id = f"m-parallel{index}"
+        note = vault / "Meetings" / f"2026-03-09 {10 + index:02d}00 - Demo - {meeting_id}.md"
+        note.parent.mkdir(parents=True, exist_ok=True)
+        note.write_text(f'---\nmeeting_id: "{meeting_id}"\n---\n- audio: {audio}\n', encoding="utf-8")
+        meeting_ids.append(meeting_id)
+    return meeting_ids
+
+
+def test_run_with_jobs_runs_sidecars_concurrently_with_thread_budget(monkeypatch, tmp_path: Path) -> None:
+    recordings = tmp_path / "audio"
+    recordings.mkdir()
+    vault = tmp_path / "vault"
+    vault.mkdir()
+    meeting_ids = _write_mapped_recordings(recordings, vault, 3)
+
+    monkeypatch.setattr(diarization_catchup, "_audio_duration_seconds", lambda _path: 600.0)
+    monkeypatch.setattr(diarization_catchup.os, "cpu_count", lambda: 12)
+    # Every sidecar blocks until all three are running; a serial loop would time out here.
+    barrier = threading.Barrier(3, timeout=5)
+    calls: list[list[str]] = []
+
+    def _runner(args, check=False, capture_output=True, text=True):
+        calls.append(list(args))
+        barrier.wait()
+        manifest = {"transcript_txt": "/missing.txt", "transcript_json": "/missing.json"}
+        return subprocess.CompletedProcess(args=args, returncode=0, stdout=json.dumps(manifest), stderr="")
+
+    monkeypatch.setattr(diarization_catchup.subprocess, "run", _runner)
+
+    args = diarization_catchup.build_parser().parse_args(
+        [
+            "--recordings-root",
+            str(recordings),
+            "--vault-path",
+            str(vault),
+            "--extensions",
+            "m4a",
+            "--no-apply-to-artifacts",
+            "--jobs",
+            "3",
+            "--json",
+        ]
+    )
+
+    payload = diarization_catchup.run(args)
+
+    assert payload["processed"] == 3
+    assert payload["failed"] == 0
+    assert payload["jobs"] == 3
+    assert payload["threads_per_job"] == 4
+    assert [item["meeting_id"] for item in payload["results"]] == meeting_ids
+    assert all(item["ok"] for item in payload["results"])
+    assert len(calls) == 3
+    assert all(call[-2:] == ["--threads", "4"] for call in calls)
+
+
+def test_run_with_jobs_stops_submitting_after_systemic_error(monkeypatch, tmp_path: Path) -> None:
+    recordings = tmp_path / "audio"
+    recordings.mkdir()
+    vault = tmp_path / "vault"
+    vault.mkdir()
+    _write_mapped_recordings(recordings, vault, 4)
+
+    monkeypatch.setattr(diarization_catchup, "_audio_duration_seconds", lambda _path: 600.0)
+    barrier = threading.Barrier(2, timeout=5)
+    calls: list[list[str]] = []
+
+    def _runner(args, check=False, capture_output=True, text=True):
+        calls.append(list(args))
+        barrier.wait()
+        return subprocess.CompletedProcess(
+            args=args,
+            returncode=1,
+            stdout="",
+            stderr="secure_exec: timed out waiting for 1Password auth. Verify with: op whoami",
+        )
+
+    monkeypatch.setattr(diarization_catchup.subprocess, "run", _runner)
+
+    args = diarization_catchup.build_parser().parse_args(
+        [
+            "--recordings-root",
+            str(recordings),
+            "--vault-path",
+            str(vault),
+            "--extensions",
+            "m4a",
+            "--jobs",
+            "2",
+            "--threads-per-job",
+            "3",
+            "--json",
+        ]
+    )
+
+    payload = diarization_catchup.run(args)
+
+    assert len(calls) == 2
+    assert payload["processed"] == 2
+    assert payload["failed"] == 2
+    assert payload["stopped_early"] is True
+    assert payload["remaining_files"] == 2
+    assert "1Password authentication" in payload["stop_reason"]
+    assert payload["issue_summary"][0]["count"] == 2
+
+
+def test_run_logs_progress_per_item_and_resumes_from_interrupted_log(monkeypatch, tmp_path: Path) -> None:
+    recordings = tmp_path / "audio"
+    recordings.mkdir()
+    vault = tmp_path / "vault"
+    vault.mkdir()
+    meeting_ids = _write_mapped_recordings(recordings, vault, 3)
+
+    probed: list[Path] = []
+
+    def _duration(path: Path) -> float:
+        probed.append(path)
+        return 600.0
+
+    monkeypatch.setattr(diarization_catchup, "_audio_duration_seconds", _duration)
+    calls: list[str] = []
+    fail_meeting = {meeting_ids[1]}
+
+    def _runner(args, check=False, capture_output=True, text=True):
+        meeting_id = args[args.index("--meeting-id") + 1]
+        calls.append(meeting_id)
+        if meeting_id in fail_meeting:
+            return subprocess.CompletedProcess(args=args, returncode=1, stdout="", stderr="boom")
+        manifest = {"transcript_txt": "/missing.txt", "transcript_json": "/missing.json"}
+        return subprocess.CompletedProcess(args=args, returncode=0, stdout=json.dumps(manifest), stderr="")
+
+    monkeypatch.setattr(diarization_catchup.subprocess, "run", _runner)
+    argv = [
+        "--recordings-root",
+        str(recordings),
+        "--vault-path",
+        str(vault),
+        "--extensions",
+        "m4a",
+        "--no-apply-to-artifacts",
+        "--json",
+    ]
+
+    first = diarization_catchup.run(diarization_catchup.build_parser().parse_args(argv))
+    progress_log = Path(first["progress_log"])
+    try:
+        lines = progress_log.read_text(encoding="utf-8").splitlines()
+        events = [json.loads(line)["event"] for line in lines]
+        assert events == ["start", "item", "item", "item", "end"]
+        assert [json.loads(line)["item"]["meeting_id"] for line in lines[1:4]] == meeting_ids
+
+        # Simulate a crash: no end record and a half-written trailing line.
+        progress_log.write_text("\n".join(lines[:4]) + '\n{"event": "it', encoding="utf-8")
+        calls.clear()
+        probed.clear()
+        fail_meeting.clear()
+
+        second = diarization_catchup.run(
+            diarization_catchup.build_parser().parse_args([*argv, "--resume", str(progress_log)])
+        )
+    finally:
+        for path in (first["report_path"], first["progress_log"]):
+            Path(path).unlink(missing_ok=True)
+    Path(second["report_path"]).unlink(missing_ok=True)
+    Path(second["progress_log"]).unlink(missing_ok=True)
+
+    assert calls == [meeting_ids[1]]
+    assert [path.name for path in probed] == ["20260309-1100_Audio.m4a"]
+    assert second["resumed"] == 2
+    assert second["resume_from"] == str(progress_log)
+    assert second["failed"] == 0
+    assert [item["meeting_id"] for item in second["results"]] == meeting_ids
+    assert [bool(item.get("resumed")) for item in second["results"]] == [True, False, True]
+
+
+def test_resume_counts_restored_actions_and_retries_missing_transcript_json(monkeypatch, tmp_path: Path) -> None:
+    recordings = tmp_path / "audio"
+    recordings.mkdir()
+    vault = tmp_path / "vault"
+    vault.mkdir()
+    meeting_ids = _write_mapped_recordings(recordings, vault, 3)
+    audio_paths = sorted(recordings.glob("*.m4a"))
+    report = tmp_path / "previous.json"
+    report.write_text(
+        json.dumps(
+            {
+                "results": [
+                    {
+                        "audio_path": str(audio_paths[0]),
+                        "meeting_id": meeting_ids[0],
+                        "ok": True,
+                        "skipped": True,
+                        "replaced_active": True,
+                        "error": "existing diarized artifacts present",
+                    },
+                    {
+                        "audio_path": str(audio_paths[1]),
+                        "meeting_id": meeting_ids[1],
+                        "ok": False,
+                        "skipped": True,
+                        "error": "missing existing transcript JSON",
+                    },
+                    {
+                        "audio_path": str(audio_paths[2]),
+                        "meeting_id": meeting_ids[2],
+                        "ok": True,
+                        "skipped": False,
+                        "manifest": {},
+                        "copied_to_artifacts": True,
+                    },
+                ]
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    monkeypatch.setattr(diarization_catchup, "_audio_duration_seconds", lambda _path: 600.0)
+    calls: list[str] = []
+
+    def _runner(args, check=False, capture_output=True, text=True):
+        calls.append(args[args.index("--meeting-id") + 1])
+        manifest = {"transcript_txt": "/missing.txt", "transcript_json": "/missing.json"}
+        return subprocess.CompletedProcess(args=args, returncode=0, stdout=json.dumps(manifest), stderr="")
+
+    monkeypatch.setattr(diarization_catchup.subprocess, "run", _runner)
+    args = diarization_catchup.build_parser().parse_args(
+        [
+            "--recordings-root",
+            str(recordings),
+            "--vault-path",
+            str(vault),
+            "--extensions",
+            "m4a",
+            "--no-apply-to-artifacts",
+            "--resume",
+            str(report),
+            "--json",
+        ]
+    )
+
+    payload = diarization_catchup.run(args)
+    Path(payload["report_path"]).unlink(missing_ok=True)
+    Path(payload["progress_log"]).unlink(missing_ok=True)
+
+    assert calls == [meeting_ids[1]]
+    assert payload["resumed"] == 2
+    assert payload["processed"] == 3
+    assert payload["skipped"] == 1
+    assert payload["copied_to_artifacts"] == 1
+    assert payload["replaced_active"] == 1
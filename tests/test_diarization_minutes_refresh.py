@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from scripts import diarization_minutes_refresh
+
+
+def _write_meeting(vault: Path, meeting_id: str) -> None:
+    artifact_dir = vault / "Meetings" / "_artifacts" / meeting_id
+    artifact_dir.mkdir(parents=True, exist_ok=True)
+    (artifact_dir / f"{meeting_id}.txt").write_text(f"baseline {meeting_id}", encoding="utf-8")
+    (artifact_dir / f"{meeting_id}.diarized.txt").write_text(f"SPEAKER_00: diarized {meeting_id}", encoding="utf-8")
+    (vault / f"Sync - {meeting_id}.md").write_text("# Note\n", encoding="utf-8")
+
+
+def test_run_summarizes_meetings_concurrently_and_reuses_cache(monkeypatch, tmp_path: Path) -> None:
+    vault = tmp_path / "vault"
+    for meeting_id in ("m-1", "m-2", "m-3"):
+        _write_meeting(vault, meeting_id)
+    monkeypatch.setattr(diarization_minutes_refresh, "ROOT", tmp_path)
+    monkeypatch.delenv("MEETINGCTL_ARTIFACTS_ROOT", raising=False)
+    calls: list[str] = []
+    in_flight = 0
+    peak = 0
+
+    async def _fake_agenerate(transcript: str, *, api_key: str, **kwargs: object) -> dict[str, object]:
+        nonlocal in_flight, peak
+        calls.append(transcript)
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {"minutes": f"Minutes for {transcript}", "decisions": [], "action_items": []}
+
+    monkeypatch.setattr("meetingctl.summary_client.agenerate_summary", _fake_agenerate)
+    args = argparse.Namespace(
+        vault_path=str(vault),
+        meeting_id=[],
+        max_items=0,
+        apply_diarized=False,
+        json=True,
+        max_concurrency=4,
+    )
+
+    payload = diarization_minutes_refresh.run(args)
+
+    assert payload["compared"] == 3
+    assert payload["failed"] == 0
+    assert len(calls) == 6
+    assert peak > 1
+    assert [item["meeting_id"] for item in payload["results"]] == ["m-1", "m-2", "m-3"]
+
+    # Only the changed diarized transcript is summarized again.
+    (vault / "Meetings" / "_artifacts" / "m-2" / "m-2.diarized.txt").write_text("SPEAKER_01: redone", encoding="utf-8")
+    calls.clear()
+
+    rerun = diarization_minutes_refresh.run(args)
+
+    assert calls == ["SPEAKER_01: redone"]
+    m2 = rerun["results"][1]
+    assert m2["baseline_summary_reused"] is True
+    assert m2["diarized_summary_reused"] is False
+
+
+def test_run_caps_api_requests_in_flight_including_map_reduce_chunks(monkeypatch, tmp_path: Path) -> None:
+    vault = tmp_path / "vault"
+    for meeting_id in ("m-1", "m-2"):
+        _write_meeting(vault, meeting_id)
+        diarized = vault / "Meetings" / "_artifacts" / meeting_id / f"{meeting_id}.diarized.txt"
+        diarized.write_text(
+            "\n".join(f"SPEAKER_0{turn % 2}: " + " ".join(f"{meeting_id}-{turn}-{word}" for word in range(60))
+                for turn in range(40)),
+            encoding="utf-8",
+        )
+    monkeypatch.setattr(diarization_minutes_refresh, "ROOT", tmp_path)
+    monkeypatch.delenv("MEETINGCTL_ARTIFACTS_ROOT", raising=False)
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    monkeypatch.setenv("MEETINGCTL_SUMMARY_CHUNK_TOKENS", "1000")
+    monkeypatch.setenv("MEETINGCTL_SUMMARY_CACHE", "0")
+    requests = 0
+    in_flight = 0
+    peak = 0
+
+    async def _create(**kwargs):
+        nonlocal requests, in_flight, peak
+        requests += 1
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.005)
+        in_flight -= 1
+        text = json.dumps({"minutes": "ok", "decisions": [], "action_items": []})
+        return SimpleNamespace(
+            headers={},
+            parse=lambda: SimpleNamespace(content=[SimpleNamespace(text=text)]),
+        )
+
+    mock_client = MagicMock()
+    mock_client.api_key = "test-key"
+    mock_client.messages.with_raw_response.create.side_effect = _create
+    monkeypatch.setattr("meetingctl.summary_client.anthropic.AsyncAnthropic", MagicMock(return_value=mock_client))
+    args = argparse.Namespace(
+        vault_path=str(vault),
+        meeting_id=[],
+        max_items=0,
+        apply_diarized=False,
+        json=True,
+        max_concurrency=2,
+    )
+
+    payload = diarization_minutes_refresh.run(args)
+
+    assert payload["compared"] == 2
+    assert requests > 4
+    assert peak == 2
@@ -0,0 +1,505 @@
+from __future__ import annotations
+
+import copy
+import importlib.util
+import json
+import os
+from pathlib import Path
+import random
+import sys
+import tempfile
+import time
+import types
+
+import pytest
+
+
+SIDECAR = Path(__file__).resolve().parents[1] / "docker" / "diarization" / "diarize.py"
+_SPEC = importlib.util.spec_from_file_location("diarize_sidecar", SIDECAR)
+diarize = importlib.util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(diarize)
+
+
+def _linear_speaker_for_interval(windows: list[dict], start: float, end: float) -> str:
+    best_overlap = 0.0
+    best_speaker = "UNKNOWN"
+    for win in windows:
+        overlap = min(end, float(win["end"])) - max(start, float(win["start"]))
+        if overlap > best_overlap:
+            best_overlap = overlap
+            best_speaker = str(win["speaker"])
+    if best_overlap > 0:
+        return best_speaker
+    center = (start + end) / 2.0
+    nearest = min(windows, key=lambda x: abs(center - ((float(x["start"]) + float(x["end"])) / 2.0)))
+    return str(nearest["speaker"])
+
+
+def _merged_window_fixture() -> list[dict]:
+    return [
+        {"start": 0.0, "end": 4.0, "speaker": "SPEAKER_00"},
+        {"start": 3.2, "end": 6.4, "speaker": "SPEAKER_01"},
+        {"start": 5.6, "end": 7.2, "speaker": "SPEAKER_00"},
+        {"start": 12.0, "end": 20.0, "speaker": "SPEAKER_02"},
+        {"start": 19.2, "end": 20.8, "speaker": "SPEAKER_01"},
+    ]
+
+
+def test_speaker_interval_index_picks_best_overlap_and_nearest_center() -> None:
+    lookup = diarize._speaker_interval_index(_merged_window_fixture())
+
+    assert lookup(0.5, 1.0) == "SPEAKER_00"
+    assert lookup(3.5, 6.0) == "SPEAKER_01"
+    assert lookup(6.5, 7.0) == "SPEAKER_00"
+    # Equal overlap resolves to the earlier window.
+    assert lookup(3.6, 4.0) == "SPEAKER_00"
+    # Gaps and zero-length intervals fall back to the nearest window center.
+    assert lookup(8.0, 9.0) == "SPEAKER_00"
+    assert lookup(11.0, 11.5) == "SPEAKER_02"
+    assert lookup(30.0, 31.0) == "SPEAKER_01"
+    assert lookup(16.0, 16.0) == "SPEAKER_02"
+
+
+def test_speaker_interval_index_matches_linear_scan() -> None:
+    rng = random.Random(7)
+    for _ in range(100):
+        windows: list[dict] = []
+        cursor = 0.0
+        for _ in range(rng.randint(1, 30)):
+            cursor += rng.choice([0.0, 0.8, 1.6, 4.0])
+            windows.append(
+                {
+                    "start": cursor,
+                    "end": cursor + rng.choice([0.8, 1.6, 2.4, 6.0]),
+                    "speaker": f"SPEAKER_{rng.randint(0, 3):02d}",
+                }
+            )
+        lookup = diarize._speaker_interval_index(windows)
+        for _ in range(100):
+            start = rng.uniform(-2.0, cursor + 8.0)
+            end = start + rng.choice([0.0, 0.4, 0.8, rng.uniform(0.0, 10.0)])
+            assert lookup(start, end) == _linear_speaker_for_interval(windows, start, end)
+
+
+def _window_mode_smooth(labels: list[int], span: int) -> list[int]:
+    if span <= 1 or len(labels) < span:
+        return labels
+    radius = span // 2
+    smoothed: list[int] = []
+    for idx, raw_label in enumerate(labels):
+        counts: dict[int, int] = {}
+        for item in labels[max(0, idx - radius) : idx + radius + 1]:
+            counts[item] = counts.get(item, 0) + 1
+        best_label = raw_label
+        best_count = -1
+        for item, count in counts.items():
+            if count > best_count:
+                best_label = item
+                best_count = count
+            elif count == best_count and item == raw_label:
+                best_label = item
+        smoothed.append(best_label)
+    return smoothed
+
+
+def test_smooth_labels_matches_window_mode_filter() -> None:
+    pytest.importorskip("numpy")
+    assert diarize._smooth_labels([0, 0, 1, 0, 0], 5) == [0, 0, 0, 0, 0]
+    assert diarize._smooth_labels([0, 1, 2], 5) == [0, 1, 2]
+    rng = random.Random(11)
+    for span in (2, 3, 4, 5, 7):
+        for size in (span, span + 1, 50, 10_000):
+            labels = [rng.choice([0, 0, 1, 2, 3]) for _ in range(size)]
+            assert diarize._smooth_labels(labels, span) == _window_mode_smooth(labels, span)
+
+
+def _sparse_fixture(rng: random.Random, count: int, rare_speakers: int = 2) -> list[dict]:
+    speakers = [f"SPEAKER_{idx:02d}" for idx in range(2 + rare_speakers)]
+    weights = [50, 40, *([1] * rare_speakers)]
+    segments: list[dict] = []
+    cursor = 0.0
+    for _ in range(count):
+        cursor += rng.choice([0.0, 0.5, 1.0, 2.5])
+        speaker = rng.choices(speakers, weights)[0]
+        segments.append(
+            {
+                "start": cursor,
+                "end": cursor + rng.choice([0.0, 1.0, 2.0]),
+                "speaker": speaker,
+                "words": [{"word": "hi", "speaker": speaker}],
+            }
+        )
+    return segments
+
+
+def _nearest_dominant_reference(segments: list[dict], sparse: set[str]) -> list[str]:
+    centers = [(float(seg["start"]) + float(seg["end"])) / 2.0 for seg in segments]
+    speakers = [str(seg["speaker"]) for seg in segments]
+    expected: list[str] = []
+    for idx, speaker in enumerate(speakers):
+        if speaker not in sparse:
+            expected.append(speaker)
+            continue
+        best_speaker = speaker
+        best_distance = float("inf")
+        for other_idx, other_speaker in enumerate(speakers):
+            if other_speaker in sparse:
+                continue
+            distance = abs(centers[idx] - centers[other_idx])
+            if distance < best_distance:
+                best_distance = distance
+                best_speaker = other_speaker
+        expected.append(best_speaker)
+    return expected
+
+
+def test_reassign_sparse_speakers_uses_nearest_dominant_segment() -> None:
+    rng = random.Random(5)
+    for count in (3, 40, 400):
+        segments = _sparse_fixture(rng, count)
+        speakers = [seg["speaker"] for seg in segments]
+        sparse = {speaker for speaker in set(speakers) if speakers.count(speaker) < max(2, 0.03 * count)}
+        if len(sparse) == len(set(speakers)):
+            continue
+        expected = _nearest_dominant_reference(segments, sparse)
+
+        diarize._reassign_sparse_speakers(segments, min_segments_per_speaker=2, min_segment_fraction=0.03)
+
+        assert [seg["speaker"] for seg in segments] == expected
+        assert [seg["words"][0]["speaker"] for seg in segments] == expected
+
+
+def test_reassign_sparse_speakers_and_smooth_labels_handle_10k_segments_quickly() -> None:
+    pytest.importorskip("numpy")
+    rng = random.Random(7)
+    # 90 rare speakers hold about half of the 10k segments, each well under 3%.
+    segments = _sparse_fixture(rng, 10_000, rare_speakers=90)
+    labels = [rng.choice([0, 0, 1, 2, 3]) for _ in range(10_000)]
+
+    started = time.perf_counter()
+    diarize._reassign_sparse_speakers(segments, min_segments_per_speaker=2, min_segment_fraction=0.03)
+    reassign_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    smoothed = diarize._smooth_labels(labels, 5)
+    smooth_seconds = time.perf_counter() - started
+
+    assert {seg["speaker"] for seg in segments} == {"SPEAKER_00", "SPEAKER_01"}
+    assert len(smoothed) == len(labels)
+    # Scanning every dominant segment for each sparse one is ~25M distance checks here
+    # (several seconds); the bisect lookup and sliding window take milliseconds.
+    assert reassign_seconds < 1.0
+    assert smooth_seconds < 1.0
+
+
+def test_reassign_sparse_speakers_breaks_distance_ties_by_segment_order() -> None:
+    segments = [
+        {"start": 4.0, "end": 4.0, "speaker": "SPEAKER_01"},
+        {"start": 0.0, "end": 0.0, "speaker": "SPEAKER_00"},
+        {"start": 2.0, "end": 2.0, "speaker": "SPEAKER_09"},
+        {"start": 4.0, "end": 4.0, "speaker": "SPEAKER_00"},
+        {"start": 0.0, "end": 0.0, "speaker": "SPEAKER_01"},
+    ]
+
+    diarize._reassign_sparse_speakers(segments, min_segments_per_speaker=2, min_segment_fraction=0.0)
+
+    assert segments[2]["speaker"] == "SPEAKER_01"
+
+
+def _same_partition(left: list[int], right: list[int]) -> bool:
+    forward: dict[int, int] = {}
+    backward: dict[int, int] = {}
+    return len(left) == len(right) and all(
+        forward.setdefault(a, b) == b and backward.setdefault(b, a) == a for a, b in zip(left, right)
+    )
+
+
+def test_cluster_embeddings_cuts_match_agglomerative_clustering(monkeypatch: pytest.MonkeyPatch) -> None:
+    np = pytest.importorskip("numpy")
+    sklearn_cluster = pytest.importorskip("sklearn.cluster")
+    monkeypatch.setenv("WHISPERX_DIARIZATION_AUTO_CLUSTER", "0")
+    rng = np.random.default_rng(3)
+    centers = rng.normal(size=(3, 16))
+    embeddings = (centers[rng.integers(0, 3, 300)] + rng.normal(scale=0.8, size=(300, 16))).astype(np.float32)
+
+    for n_clusters in (1, 2, 3, 5):
+        expected = sklearn_cluster.AgglomerativeClustering(
+            n_clusters=n_clusters, metric="cosine", linkage="average"
+        ).fit_predict(embeddings)
+        labels = diarize._cluster_embeddings(
+            embeddings, min_speakers=n_clusters, max_speakers=n_clusters, distance_threshold=0.08
+        )
+        assert _same_partition(labels.tolist(), expected.tolist())
+
+    expected = sklearn_cluster.AgglomerativeClustering(
+        n_clusters=None, distance_threshold=0.2, metric="cosine", linkage="average"
+    ).fit_predict(embeddings)
+    labels = diarize._cluster_embeddings(embeddings, min_speakers=None, max_speakers=None, distance_threshold=0.2)
+    assert _same_partition(labels.tolist(), expected.tolist())
+
+
+def _two_voice_fixture(np, seconds: int = 40) -> tuple[object, dict]:
+    sample_rate = 16000
+    times = np.arange(seconds * sample_rate) / sample_rate
+    audio = np.zeros_like(times, dtype=np.float32)
+    segments: list[dict] = []
+    for idx, start in enumerate(range(0, seconds, 5)):
+        freq = 140.0 if idx % 2 == 0 else 330.0
+        lo, hi = start * sample_rate, (start + 4) * sample_rate
+        audio[lo:hi] = (0.2 * np.sin(2 * np.pi * freq * times[lo:hi])).astype(np.float32)
+        words = [{"word": f"w{n}", "start": start + n * 0.5, "end": start + n * 0.5 + 0.4} for n in range(8)]
+        segments.append({"start": float(start), "end": float(start + 4), "text": "", "words": words})
+    return audio, {"segments": segments, "language": "en"}
+
+
+def test_fallback_feature_cache_round_trips_without_audio(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    np = pytest.importorskip("numpy")
+    pytest.importorskip("torchaudio")
+    pytest.importorskip("sklearn")
+    monkeypatch.setenv("WHISPERX_DIARIZATION_AUTO_CLUSTER", "1")
+    audio, result = _two_voice_fixture(np)
+    audio_path = tmp_path / "meeting.wav"
+    audio_path.write_bytes(audio.tobytes())
+    cache_path = tmp_path / "embeddings.npz"
+
+    first = diarize._assign_segment_speakers_from_embeddings(
+        audio=audio,
+        result=copy.deepcopy(result),
+        min_speakers=None,
+        max_speakers=None,
+        audio_path=audio_path,
+        feature_cache_path=cache_path,
+    )
+    assert cache_path.is_file()
+
+    reclustered = diarize._assign_segment_speakers_from_embeddings(
+        audio=None,
+        result=copy.deepcopy(result),
+        min_speakers=None,
+        max_speakers=None,
+        audio_path=audio_path,
+        feature_cache_path=cache_path,
+    )
+    assert [seg["speaker"] for seg in reclustered["segments"]] == [seg["speaker"] for seg in first["segments"]]
+    assert len({seg["speaker"] for seg in first["segments"]}) == 2
+
+    with np.load(cache_path, allow_pickle=False) as data:
+        stored_key = str(data["cache_key"])
+    assert diarize._load_feature_cache(cache_path, stored_key) is not None
+    assert diarize._load_feature_cache(cache_path, stored_key.replace('"hop_samples": 12800', '"hop_samples": 6400')) is None
+
+
+def test_load_audio_memmap_streams_ffmpeg_pcm(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    np = pytest.importorskip("numpy")
+    fake_bin = tmp_path / "bin"
+    fake_bin.mkdir()
+    ffmpeg = fake_bin / "ffmpeg"
+    # Stand-in decoder: the "input" is already s16le PCM.
+    ffmpeg.write_text('#!/usr/bin/env bash\necho "decoding" >&2\ncat "$5"\n', encoding="utf-8")
+    ffmpeg.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{fake_bin}{os.pathsep}{os.environ.get('PATH', '')}")
+    monkeypatch.delenv("WHISPERX_AUDIO_SCRATCH_DIR", raising=False)
+    system_tmp = tmp_path / "tmpfs"
+    system_tmp.mkdir()
+    monkeypatch.setattr(tempfile, "tempdir", str(system_tmp))
+    job_dir = tmp_path / "job"
+    scratch_names: list[str] = []
+    real_named_temporary_file = tempfile.NamedTemporaryFile
+
+    def _recording_named_temporary_file(*args, **kwargs):
+        handle = real_named_temporary_file(*args, **kwargs)
+        scratch_names.append(handle.name)
+        return handle
+
+    monkeypatch.setattr(tempfile, "NamedTemporaryFile", _recording_named_temporary_file)
+    pcm = np.random.default_rng(0).integers(-32768, 32767, size=(1 << 21) + 3).astype(np.int16)
+    source = tmp_path / "meeting.wav"
+    source.write_bytes(pcm.tobytes())
+
+    audio = diarize._load_audio_memmap(source, scratch_dir=job_dir)
+
+    assert audio.dtype == np.float32
+    assert np.array_equal(np.asarray(audio), pcm.astype(np.float32) / 32768.0)
+    assert [Path(name).parent for name in scratch_names] == [job_dir]
+    assert not list(job_dir.glob("diarize_pcm_*"))
+    assert not list(system_tmp.iterdir())
+    frames, starts = diarize._frame_audio(audio, window_samples=25600, hop_samples=12800, min_samples=6400)
+    assert np.shares_memory(frames, audio)
+    assert np.array_equal(frames[3], np.asarray(audio[starts[3] : starts[3] + 25600]))
+
+    override = tmp_path / "scratch"
+    monkeypatch.setenv("WHISPERX_AUDIO_SCRATCH_DIR", str(override))
+    with pytest.raises(RuntimeError, match="Failed to load audio"):
+        diarize._load_audio_memmap(tmp_path / "missing.wav", scratch_dir=job_dir)
+    assert Path(scratch_names[-1]).parent == override
+    assert not list(override.iterdir())
+
+
+def test_transcript_rows_drive_turn_lines() -> None:
+    result = {
+        "segments": [
+            {
+                "start": 0.0,
+                "end": 2.0,
+                "speaker": "SPEAKER_00",
+                "words": [
+                    {"word": " Hello", "start": 0.0, "end": 0.4},
+                    {"word": " ", "start": 0.4, "end": 0.5},
+                    {"word": ",", "start": 0.5, "end": 0.5},
+                    {"word": " team", "start": 0.6, "end": 0.3, "speaker": "SPEAKER_00"},
+                ],
+            },
+            {"start": 2.2, "end": 3.0, "speaker": "", "text": " Thanks. "},
+            {"start": 5.0, "end": 6.0, "speaker": "SPEAKER_01", "words": [{"word": "Bye", "end": 5.5}]},
+        ]
+    }
+
+    assert list(diarize._transcript_rows(result)) == [
+        ("SPEAKER_00", 0.0, 0.4, " Hello"),
+        ("SPEAKER_00", 0.5, 0.5, ","),
+        ("SPEAKER_00", 0.6, 0.6, " team"),
+        ("UNKNOWN", 2.2, 3.0, "Thanks."),
+        ("SPEAKER_01", 5.0, 5.5, "Bye"),
+    ]
+    assert diarize._build_turn_lines(result, max_gap_seconds=1.5, max_turn_duration_seconds=90) == [
+        "[00:00:00-00:00:00] SPEAKER_00: Hello, team",
+        "[00:00:02-00:00:03] UNKNOWN: Thanks.",
+        "[00:00:05-00:00:05] SPEAKER_01: Bye",
+    ]
+
+
+def _three_hour_word_stream(words_per_second: float = 3.0, hours: float = 3.0) -> dict:
+    count = int(hours * 3600 * words_per_second)
+    words: list[dict] = []
+    for idx in range(count):
+        start = idx / words_per_second
+        words.append({"word": f" word{idx % 97}" if idx % 11 else ",", "start": start, "end": start + 0.25})
+    segment = {"start": 0.0, "end": count / words_per_second, "speaker": "SPEAKER_00", "words": words}
+    return {"segments": [segment]}
+
+
+def test_build_turn_lines_three_hour_word_stream_matches_naive_reference() -> None:
+    result = _three_hour_word_stream()
+    words = result["segments"][0]["words"]
+    # Naive reference: every token's raw text concatenated, first token stripped.
+    reference = "".join(str(word["word"]) for word in words).strip()
+
+    monologue = diarize._build_turn_lines(result, max_gap_seconds=1.5, max_turn_duration_seconds=0)
+    chunked = diarize._build_turn_lines(result, max_gap_seconds=1.5, max_turn_duration_seconds=90)
+
+    assert monologue == [f"[00:00:00-02:59:59] SPEAKER_00: {reference}"]
+    assert len(chunked) == 120
+    chunk_text = " ".join(line.split("] SPEAKER_00: ", 1)[1] for line in chunked)
+    assert chunk_text.replace(",", " ,").split() == reference.replace(",", " ,").split()
+
+
+def test_build_turn_lines_scales_linearly_with_word_stream_length() -> None:
+    def _best_of_three(result: dict) -> float:
+        timings = []
+        for _ in range(3):
+            started = time.perf_counter()
+            diarize._build_turn_lines(result, max_gap_seconds=1.5, max_turn_duration_seconds=0)
+            timings.append(time.perf_counter() - started)
+        return min(timings)
+
+    base = _best_of_three(_three_hour_word_stream())
+    quadrupled = _best_of_three(_three_hour_word_stream(hours=12.0))
+
+    # One growing monologue: linear building takes ~4x as long on 4x the words, while
+    # re-copying the turn text per token (the old f-string append) took ~13x here.
+    assert quadrupled < 8 * base
+
+
+def test_transcript_json_formats_round_trip_and_promote_as_plain_json(tmp_path: Path) -> None:
+    from meetingctl.transcript_json import load_transcript_json, transcript_json_suffix
+    from meetingctl.transcription import promote_transcript_json
+
+    result = {
+        "language": "en",
+        "segments": [
+            {"start": 0.0, "end": 1.5, "text": " Hallo, wörld", "speaker": "SPEAKER_00", "words": []},
+            {"start": 2.0, "end": 3.0, "text": "next\nline", "speaker": "SPEAKER_01"},
+        ],
+    }
+    assert diarize.load_transcript_json is load_transcript_json
+    for json_format in ("pretty", "compact", "ndjson"):
+        for compress in (False, True):
+            suffix = transcript_json_suffix(json_format, compress=compress)
+            path = tmp_path / f"{json_format}{suffix}"
+            diarize._write_transcript_json(path, result, json_format=json_format, compress=compress)
+
+            assert (path.read_bytes()[:2] == b"\x1f\x8b") is compress
+            assert path.name.endswith(".gz") is compress
+            assert (".ndjson" in path.name) is (json_format == "ndjson")
+            assert load_transcript_json(path) == result
+
+            vault_copy = tmp_path / "vault" / f"{json_format}-{compress}.diarized.json"
+            promote_transcript_json(path, vault_copy)
+            assert json.loads(vault_copy.read_text(encoding="utf-8")) == result
+
+    compact = tmp_path / "compact.json"
+    ndjson = tmp_path / "ndjson.ndjson"
+    assert "\n" not in compact.read_text(encoding="utf-8")
+    assert len(ndjson.read_text(encoding="utf-8").splitlines()) == 1 + len(result["segments"])
+    assert compact.stat().st_size < (tmp_path / "pretty.json").stat().st_size
+
+
+def test_diarize_uses_memoized_cached_snapshot(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(diarize, "_SNAPSHOT_CACHE", {})
+    built: list[tuple[str, str]] = []
+
+    class _Pipeline:
+        def __init__(self, *, model_name: str, device: str, use_auth_token: str = "") -> None:
+            built.append((model_name, device))
+
+        def __call__(self, audio, **kwargs):
+            return {"audio": audio}
+
+    fake = types.SimpleNamespace(
+        DiarizationPipeline=_Pipeline,
+        assign_word_speakers=lambda diarize_segments, result: {**result, "assigned": True},
+    )
+    monkeypatch.setitem(sys.modules, "whisperx", fake)
+
+    snapshot = tmp_path / "hub" / "models--pyannote--speaker-diarization-3.1" / "snapshots" / "abc"
+    snapshot.mkdir(parents=True)
+    (snapshot / "config.yaml").write_text("pipeline: {}")
+    monkeypatch.setenv("HF_HOME", str(tmp_path))
+    monkeypatch.delenv("WHISPERX_DOWNLOAD_ROOT", raising=False)
+
+    def _run(models: list[str]) -> tuple[dict, str, list[str]]:
+        return diarize._diarize(
+            audio="pcm",
+            audio_path=tmp_path / "a.wav",
+            result={"segments": []},
+            device="cpu",
+            token="",
+            models=models,
+            min_speakers=None,
+            max_speakers=None,
+            allow_embedding_fallback=False,
+            require_pyannote=True,
+        )
+
+    for _ in range(2):
+        assigned, backend, _errors = _run(["pyannote/speaker-diarization-3.1"])
+        assert assigned["assigned"] is True
+        assert backend == "pyannote-local:pyannote/speaker-diarization-3.1"
+    assert built == [(str(snapshot), "cpu")] * 2
+
+    # The snapshot lookup is memoized: removing the cache dir does not trigger a new walk.
+    (snapshot / "config.yaml").unlink()
+    assert diarize._resolve_cached_model_snapshot("pyannote/speaker-diarization-3.1") == snapshot
+
+
+def test_resolve_cached_model_snapshot_retries_after_a_miss(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(diarize, "_SNAPSHOT_CACHE", {})
+    monkeypatch.setenv("HF_HOME", str(tmp_path))
+    monkeypatch.delenv("WHISPERX_DOWNLOAD_ROOT", raising=False)
+
+    assert diarize._resolve_cached_model_snapshot("pyannote/speaker-diarization-3.1") is None
+
+    snapshot = tmp_path / "hub" / "models--pyannote--speaker-diarization-3.1" / "snapshots" / "abc"
+    snapshot.mkdir(parents=True)
+    (snapshot / "config.yaml").write_text("pipeline: {}")
+
+    assert diarize._resolve_cached_model_snapshot("pyannote/speaker-diarization-3.1") == snapshot
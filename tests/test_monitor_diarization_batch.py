@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from scripts import monitor_diarization_batch
+
+
+def test_monitor_tails_catchup_progress_log(tmp_path: Path) -> None:
+    progress_log = tmp_path / "catchup_20260309T100000Z.ndjson"
+    records = [
+        {"event": "start", "files": ["/a/one.m4a", "/a/two.m4a", "/a/three.m4a"]},
+        {"event": "item", "item": {"audio_path": "/a/one.m4a", "meeting_id": "m-1", "ok": True, "skipped": False}},
+        {"event": "item", "item": {"audio_path": "/a/two.m4a", "meeting_id": "m-2", "ok": False, "error": "boom"}},
+    ]
+    progress_log.write_text("".join(json.dumps(record) + "\n" for record in records) + '{"event": "ite')
+
+    polled, offset = monitor_diarization_batch._read_progress_records(progress_log, 0)
+    assert polled == records
+    assert offset == progress_log.stat().st_size - len('{"event": "ite')
+
+    with progress_log.open("a", encoding="utf-8") as handle:
+        handle.write('m", "item": {"audio_path": "/a/three.m4a", "skipped": true}}\n')
+        handle.write(json.dumps({"event": "end", "processed": 3}) + "\n")
+    tail, _ = monitor_diarization_batch._read_progress_records(progress_log, offset)
+    assert [record["event"] for record in tail] == ["item", "end"]
+
+    snapshot = tmp_path / "snapshot.json"
+    args = monitor_diarization_batch.build_parser().parse_args(
+        ["--report-path", str(progress_log), "--output-path", str(snapshot), "--max-items", "0"]
+    )
+    assert monitor_diarization_batch.run(args) == 0
+
+    payload = json.loads(snapshot.read_text(encoding="utf-8"))
+    assert payload["run_ended"] is True
+    assert payload["completed"] == 3
+    assert payload["failed"] == 1
+    assert [item["status"] for item in payload["items"]] == ["completed", "failed", "skipped"]
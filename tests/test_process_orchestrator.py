@@ -63,3 +63,50 @@ def test_process_orchestrator_runs_full_chain_when_transcript_missing(tmp_path:
     )
 
     assert steps == ["transcribe", "summarize", "patch", "convert"]
+
+
+def test_process_orchestrator_schedules_upgrade_after_draft_summary(tmp_path: Path) -> None:
+    transcript = tmp_path / "transcript.txt"
+    transcript.write_text("existing transcript")
+    context = ProcessContext(
+        meeting_id="m-123",
+        note_path=tmp_path / "note.md",
+        wav_path=tmp_path / "audio.wav",
+        transcript_path=transcript,
+        mp3_path=tmp_path / "audio.mp3",
+    )
+    steps: list[str] = []
+
+    result = run_processing(
+        context=context,
+        transcribe=lambda wav_path, transcript_path: transcript_path,
+        summarize=lambda transcript_path: {"minutes": "draft", "draft": True},
+        patch_note=lambda note_path, payload: steps.append(f"patch:{payload['minutes']}"),
+        convert_audio=lambda wav_path, mp3_path: steps.append("convert") or mp3_path,
+        schedule_upgrade=lambda scheduled: steps.append(f"upgrade:{scheduled.meeting_id}"),
+    )
+
+    assert steps == ["patch:draft", "upgrade:m-123", "convert"]
+    assert result.summary_tier == "draft"
+
+
+def test_process_orchestrator_reports_draft_tier_without_upgrade_scheduler(tmp_path: Path) -> None:
+    transcript = tmp_path / "transcript.txt"
+    transcript.write_text("existing transcript")
+    context = ProcessContext(
+        meeting_id="m-123",
+        note_path=tmp_path / "note.md",
+        wav_path=tmp_path / "audio.wav",
+        transcript_path=transcript,
+        mp3_path=tmp_path / "audio.mp3",
+    )
+
+    result = run_processing(
+        context=context,
+        transcribe=lambda wav_path, transcript_path: transcript_path,
+        summarize=lambda transcript_path: {"minutes": "draft", "draft": True},
+        patch_note=lambda note_path, payload: None,
+        convert_audio=lambda wav_path, mp3_path: mp3_path,
+    )
+
+    assert result.summary_tier == "draft"
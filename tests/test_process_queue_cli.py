@@ -60,7 +60,7 @@ def test_process_queue_cli_runs_real_pipeline_success(monkeypatch, tmp_path: Pat
     monkeypatch.setattr("meetingctl.cli.create_transcription_runner", lambda: FakeRunner())
     monkeypatch.setattr(
         "meetingctl.cli.generate_summary",
-        lambda transcript, api_key: {
+        lambda transcript, api_key, usage=None: {
             "minutes": "Summary",
             "decisions": ["Decision A"],
             "action_items": ["Do thing"],
@@ -176,6 +176,191 @@ def test_process_queue_cli_supports_transcribe_dry_run(monkeypatch, tmp_path: Pa
     assert not wav.exists()
 
 
+def test_process_queue_cli_two_tier_summary_drafts_then_upgrades(monkeypatch, tmp_path: Path, capsys) -> None:
+    queue_file = tmp_path / "process_queue.jsonl"
+    processed_file = tmp_path / "processed.jsonl"
+    recordings = tmp_path / "recordings"
+    recordings.mkdir(parents=True, exist_ok=True)
+    note = tmp_path / "meeting.md"
+    note.write_text(
+        "\n".join(
+            [
+                "# Note",
+                "<!-- MINUTES_START -->",
+                "",
+                "<!-- MINUTES_END -->",
+                "<!-- DECISIONS_START -->",
+                "",
+                "<!-- DECISIONS_END -->",
+                "<!-- ACTION_ITEMS_START -->",
+                "",
+                "<!-- ACTION_ITEMS_END -->",
+            ]
+        )
+        + "\n"
+    )
+    (recordings / "m-7.wav").write_text("wav")
+    _write_queue(queue_file, [{"meeting_id": "m-7", "note_path": str(note)}])
+    monkeypatch.setenv("MEETINGCTL_PROCESS_QUEUE_FILE", str(queue_file))
+    monkeypatch.setenv("MEETINGCTL_PROCESSED_JOBS_FILE", str(processed_file))
+    monkeypatch.setenv("VAULT_PATH", str(tmp_path))
+    monkeypatch.setenv("RECORDINGS_PATH", str(recordings))
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    monkeypatch.setenv("MEETINGCTL_SUMMARY_DRAFT", "1")
+    monkeypatch.setenv("MEETINGCTL_PROCESSING_TRANSCRIBE_DRY_RUN", "1")
+    monkeypatch.setenv("MEETINGCTL_PROCESSING_CONVERT_DRY_RUN", "1")
+    monkeypatch.setattr(
+        "meetingctl.cli.generate_draft_summary",
+        lambda transcript, api_key, usage=None: {"minutes": "Draft", "decisions": [], "action_items": []},
+    )
+    monkeypatch.setattr(
+        "meetingctl.cli.generate_summary",
+        lambda transcript, api_key, usage=None: {
+            "minutes": "Full minutes",
+            "decisions": ["Decision A"],
+            "action_items": ["Do thing"],
+        },
+    )
+    monkeypatch.setattr("sys.argv", ["meetingctl", "process-queue", "--max-jobs", "1", "--json"])
+
+    assert cli.main() == 0
+    assert json.loads(capsys.readouterr().out) == {"processed_jobs": 1, "failed_jobs": 0, "remaining_jobs": 1}
+    drafted = note.read_text()
+    assert "Draft summary; full minutes will replace it shortly." in drafted
+    assert "Draft" in drafted
+    assert json.loads(queue_file.read_text())["summary_upgrade"] is True
+
+    assert cli.main() == 0
+    assert json.loads(capsys.readouterr().out) == {"processed_jobs": 1, "failed_jobs": 0, "remaining_jobs": 0}
+    upgraded = note.read_text()
+    assert "Full minutes" in upgraded
+    assert "Draft summary" not in upgraded
+    assert "- Decision A" in upgraded
+    processed = [json.loads(line) for line in processed_file.read_text().splitlines()]
+    assert [entry.get("summary_tier") for entry in processed] == ["draft", None]
+    assert processed[1]["summary_upgrade"] is True
+
+
+def test_process_queue_cli_draft_failure_falls_back_to_full_summary(monkeypatch, tmp_path: Path, capsys) -> None:
+    queue_file = tmp_path / "process_queue.jsonl"
+    processed_file = tmp_path / "processed.jsonl"
+    recordings = tmp_path / "recordings"
+    recordings.mkdir(parents=True, exist_ok=True)
+    note = tmp_path / "meeting.md"
+    note.write_text(
+        "\n".join(
+            [
+                "# Note",
+                "<!-- MINUTES_START -->",
+                "",
+                "<!-- MINUTES_END -->",
+                "<!-- DECISIONS_START -->",
+                "",
+                "<!-- DECISIONS_END -->",
+                "<!-- ACTION_ITEMS_START -->",
+                "",
+                "<!-- ACTION_ITEMS_END -->",
+            ]
+        )
+        + "\n"
+    )
+    (recordings / "m-8.wav").write_text("wav")
+    _write_queue(queue_file, [{"meeting_id": "m-8", "note_path": str(note)}])
+    monkeypatch.setenv("MEETINGCTL_PROCESS_QUEUE_FILE", str(queue_file))
+    monkeypatch.setenv("MEETINGCTL_PROCESSED_JOBS_FILE", str(processed_file))
+    monkeypatch.setenv("VAULT_PATH", str(tmp_path))
+    monkeypatch.setenv("RECORDINGS_PATH", str(recordings))
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    monkeypatch.setenv("MEETINGCTL_SUMMARY_DRAFT", "1")
+    monkeypatch.setenv("MEETINGCTL_PROCESSING_TRANSCRIBE_DRY_RUN", "1")
+    monkeypatch.setenv("MEETINGCTL_PROCESSING_CONVERT_DRY_RUN", "1")
+
+    def _draft_unavailable(transcript, api_key, usage=None):
+        raise RuntimeError("model not found: claude-3-5-haiku-latest")
+
+    monkeypatch.setattr("meetingctl.cli.generate_draft_summary", _draft_unavailable)
+    monkeypatch.setattr(
+        "meetingctl.cli.generate_summary",
+        lambda transcript, api_key, usage=None: {
+            "minutes": "Full minutes",
+            "decisions": ["Decision A"],
+            "action_items": [],
+        },
+    )
+    monkeypatch.setattr("sys.argv", ["meetingctl", "process-queue", "--max-jobs", "1", "--json"])
+
+    assert cli.main() == 0
+    assert json.loads(capsys.readouterr().out) == {"processed_jobs": 1, "failed_jobs": 0, "remaining_jobs": 0}
+    patched = note.read_text()
+    assert "Full minutes" in patched
+    assert "Draft summary" not in patched
+    assert "- Decision A" in patched
+    processed = [json.loads(line) for line in processed_file.read_text().splitlines()]
+    assert processed[0]["summary_tier"] == "full"
+
+
+def test_process_queue_cli_streams_minutes_and_falls_back_on_stream_failure(
+    monkeypatch, tmp_path: Path, capsys
+) -> None:
+    queue_file = tmp_path / "process_queue.jsonl"
+    recordings = tmp_path / "recordings"
+    recordings.mkdir(parents=True, exist_ok=True)
+    notes = {}
+    for meeting_id in ("m-8", "m-9"):
+        note = tmp_path / f"{meeting_id}.md"
+        note.write_text(
+            "# Note\n<!-- MINUTES_START -->\n\n<!-- MINUTES_END -->\n"
+            "<!-- DECISIONS_START -->\n\n<!-- DECISIONS_END -->\n"
+            "<!-- ACTION_ITEMS_START -->\n\n<!-- ACTION_ITEMS_END -->\n"
+        )
+        (recordings / f"{meeting_id}.wav").write_text("wav")
+        notes[meeting_id] = note
+    _write_queue(queue_file, [{"meeting_id": key, "note_path": str(note)} for key, note in notes.items()])
+    monkeypatch.setenv("MEETINGCTL_PROCESS_QUEUE_FILE", str(queue_file))
+    monkeypatch.setenv("MEETINGCTL_PROCESSED_JOBS_FILE", str(tmp_path / "processed.jsonl"))
+    monkeypatch.setenv("VAULT_PATH", str(tmp_path))
+    monkeypatch.setenv("RECORDINGS_PATH", str(recordings))
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    monkeypatch.setenv("MEETINGCTL_SUMMARY_CACHE", "0")
+    monkeypatch.setenv("MEETINGCTL_SUMMARY_STREAM", "1")
+    monkeypatch.setenv("MEETINGCTL_SUMMARY_STREAM_PATCH_SECONDS", "3600")
+    monkeypatch.setenv("MEETINGCTL_PROCESSING_CONVERT_DRY_RUN", "1")
+
+    class FakeRunner:
+        def transcribe(self, *, wav_path: Path, transcript_path: Path) -> Path:
+            transcript_path.write_text(wav_path.stem)
+            return transcript_path
+
+    progress: list[str] = []
+
+    def _stream(transcript, api_key, on_minutes, usage=None):
+        if transcript == "m-9":
+            raise RuntimeError("stream dropped")
+        for partial in ("- One", "- One\n- Two"):
+            on_minutes(partial)
+            progress.append(notes["m-8"].read_text())
+        return {"minutes": "- One\n- Two\n- Three", "decisions": ["Ship"], "action_items": []}
+
+    monkeypatch.setattr("meetingctl.cli.create_transcription_runner", lambda: FakeRunner())
+    monkeypatch.setattr("meetingctl.cli.stream_summary", _stream)
+    monkeypatch.setattr(
+        "meetingctl.cli.generate_summary",
+        lambda transcript, api_key, usage=None: {"minutes": "Fallback", "decisions": [], "action_items": []},
+    )
+    monkeypatch.setattr("sys.argv", ["meetingctl", "process-queue", "--max-jobs", "2", "--json"])
+
+    assert cli.main() == 0
+    assert json.loads(capsys.readouterr().out) == {"processed_jobs": 2, "failed_jobs": 0, "remaining_jobs": 0}
+    # The first partial is written immediately; later ones wait for the patch interval.
+    assert "- One\n\n> _Summary in progress..._" in progress[0]
+    assert progress[1] == progress[0]
+    final = notes["m-8"].read_text()
+    assert "- Three" in final
+    assert "Summary in progress" not in final
+    assert "- Ship" in final
+    assert "Fallback" in notes["m-9"].read_text()
+
+
 def test_process_queue_cli_preserves_m4a_without_mp3_conversion(
     monkeypatch, tmp_path: Path, capsys
 ) -> None:
@@ -227,7 +412,7 @@ def test_process_queue_cli_preserves_m4a_without_mp3_conversion(
     monkeypatch.setattr("meetingctl.cli.create_transcription_runner", lambda: FakeRunner())
     monkeypatch.setattr(
         "meetingctl.cli.generate_summary",
-        lambda transcript, api_key: {
+        lambda transcript, api_key, usage=None: {
             "minutes": "Summary",
             "decisions": [],
             "action_items": [],
@@ -302,7 +487,7 @@ def test_process_queue_cli_prefers_wav_when_wav_and_m4a_both_exist(
     monkeypatch.setattr("meetingctl.cli.create_transcription_runner", lambda: FakeRunner())
     monkeypatch.setattr(
         "meetingctl.cli.generate_summary",
-        lambda transcript, api_key: {
+        lambda transcript, api_key, usage=None: {
             "minutes": "Summary",
             "decisions": [],
             "action_items": [],
@@ -387,7 +572,7 @@ def test_process_queue_cli_falls_back_to_m4a_when_wav_is_flawed(
     monkeypatch.setattr("meetingctl.cli.create_transcription_runner", lambda: FlakyRunner())
     monkeypatch.setattr(
         "meetingctl.cli.generate_summary",
-        lambda transcript, api_key: {
+        lambda transcript, api_key, usage=None: {
             "minutes": "Summary",
             "decisions": [],
             "action_items": [],
@@ -104,3 +104,18 @@ def test_queue_worker_dead_letters_failures_and_continues(tmp_path: Path) -> Non
     payload = json.loads(lines[0])
     assert payload["error"] == "boom"
     assert payload["payload"]["meeting_id"] == "m-2"
+
+
+def test_queue_worker_keeps_jobs_appended_while_processing(tmp_path: Path) -> None:
+    queue_file = tmp_path / "queue.jsonl"
+    _write_queue(queue_file, [{"meeting_id": "m-1"}])
+
+    def _handler(payload: dict[str, object]) -> None:
+        with queue_file.open("a", encoding="utf-8") as fh:
+            fh.write(json.dumps({"meeting_id": "m-1", "summary_upgrade": True}) + "\n")
+
+    result = process_queue_jobs(queue_file=queue_file, handler=_handler, max_jobs=1)
+
+    assert result == {"processed_jobs": 1, "failed_jobs": 0, "remaining_jobs": 1}
+    remaining = queue_file.read_text().strip().splitlines()
+    assert json.loads(remaining[0]) == {"meeting_id": "m-1", "summary_upgrade": True}
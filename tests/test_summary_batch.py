@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+from pathlib import Path
+import threading
+
+import pytest
+
+from meetingctl import cli
+from meetingctl.summary_batch import SummaryBatchItem, run_summary_batch
+from meetingctl.summary_cache import SummaryCache
+
+
+class _BatchServer:
+    """Stand-in for the Message Batches endpoints, served over plain HTTP on localhost."""
+
+    def __init__(self, *, polls_before_end: int = 1, errored: set[str] | None = None) -> None:
+        self.polls_before_end = polls_before_end
+        self.errored = errored or set()
+        self.batches: dict[str, dict[str, object]] = {}
+        self.created: list[list[dict[str, object]]] = []
+        self.url = ""
+
+    def batch_object(self, batch_id: str) -> dict[str, object]:
+        batch = self.batches[batch_id]
+        ended = int(batch["polls"]) >= self.polls_before_end
+        return {
+            "id": batch_id,
+            "type": "message_batch",
+            "processing_status": "ended" if ended else "in_progress",
+            "request_counts": {"processing": 0, "succeeded": 0, "errored": 0, "canceled": 0, "expired": 0},
+            "created_at": "2026-10-18T00:00:00Z",
+            "expires_at": "2026-10-19T00:00:00Z",
+            "ended_at": "2026-10-18T00:05:00Z" if ended else None,
+            "archived_at": None,
+            "cancel_initiated_at": None,
+            "results_url": f"{self.url}/v1/messages/batches/{batch_id}/results" if ended else None,
+        }
+
+    def results(self, batch_id: str) -> str:
+        lines = []
+        for request in self.batches[batch_id]["requests"]:  # type: ignore[union-attr]
+            custom_id = request["custom_id"]
+            if custom_id in self.errored:
+                result = {"type": "errored", "error": {"type": "error", "error": {"type": "api_error", "message": "boom"}}}
+            else:
+                prompt = request["params"]["messages"][0]["content"][0]["text"]
+                first_line = prompt.split("Transcript:\n", 1)[1].splitlines()[0]
+                text = json.dumps({"minutes": f"Batch minutes: {first_line}", "decisions": [], "action_items": []})
+                result = {
+                    "type": "succeeded",
+                    "message": {
+                        "id": f"msg_{custom_id}",
+                        "type": "message",
+                        "role": "assistant",
+                        "model": request["params"]["model"],
+                        "content": [{"type": "text", "text": text}],
+                        "stop_reason": "end_turn",
+                        "stop_sequence": None,
+                        "usage": {"input_tokens": 10, "output_tokens": 10},
+                    },
+                }
+            lines.append(json.dumps({"custom_id": custom_id, "result": result}))
+        return "\n".join(lines) + "\n"
+
+
+@pytest.fixture
+def batch_server(monkeypatch):
+    state = _BatchServer()
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args) -> None:
+            pass
+
+        def _send(self, body: str, content_type: str = "application/json") -> None:
+            encoded = body.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(encoded)))
+            self.end_headers()
+            self.wfile.write(encoded)
+
+        def do_POST(self) -> None:
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            batch_id = f"msgbatch_{len(state.batches) + 1:03d}"
+            state.batches[batch_id] = {"requests": body["requests"], "polls": 0}
+            state.created.append(body["requests"])
+            self._send(json.dumps(state.batch_object(batch_id)))
+
+        def do_GET(self) -> None:
+            parts = self.path.strip("/").split("/")
+            batch_id = parts[3]
+            if parts[-1] == "results":
+                self._send(state.results(batch_id), "application/binary")
+                return
+            state.batches[batch_id]["polls"] = int(state.batches[batch_id]["polls"]) + 1
+            self._send(json.dumps(state.batch_object(batch_id)))
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    state.url = f"http://127.0.0.1:{server.server_address[1]}"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setenv("ANTHROPIC_BASE_URL", state.url)
+    monkeypatch.setenv("MEETINGCTL_SUMMARY_MODEL", "claude-test")
+    yield state
+    server.shutdown()
+    server.server_close()
+
+
+def _items(tmp_path: Path, count: int) -> list[SummaryBatchItem]:
+    items = []
+    for index in range(count):
+        transcript = tmp_path / f"m-{index}.txt"
+        transcript.write_text(f"[00:00:00-00:00:05] SPEAKER_00: meeting {index}\n", encoding="utf-8")
+        items.append(
+            SummaryBatchItem(meeting_id=f"m-{index}", note_path=tmp_path / f"m-{index}.md", transcript_path=transcript)
+        )
+    return items
+
+
+def test_run_summary_batch_fans_results_out_and_falls_back_for_errors(batch_server, tmp_path: Path) -> None:
+    batch_server.errored = {"item-00002"}
+    cache = SummaryCache(tmp_path / "cache", max_bytes=1 << 20)
+    state_path = tmp_path / "state.json"
+    applied: dict[str, str] = {}
+
+    report = run_summary_batch(
+        _items(tmp_path, 3),
+        api_key="test-key",
+        apply=lambda item, summary: applied.__setitem__(item.meeting_id, str(summary["minutes"])),
+        fallback=lambda transcript_path: {"minutes": "sync", "decisions": [], "action_items": []},
+        state_path=state_path,
+        cache=cache,
+        sleep=lambda _: None,
+    )
+
+    assert len(batch_server.created) == 1
+    assert len(batch_server.created[0]) == 3
+    assert applied == {
+        "m-0": "Batch minutes: SPEAKER_00: meeting 0",
+        "m-1": "sync",
+        "m-2": "Batch minutes: SPEAKER_00: meeting 2",
+    }
+    assert report["submitted"] == 3
+    assert report["applied"] == 3
+    assert report["fallback"] == 1
+    assert report["usage"]["requests"] == 2
+    assert report["usage"]["input_tokens"] == 20
+    assert batch_server.created[0][0]["params"]["messages"][0]["content"][0]["cache_control"] == {"type": "ephemeral"}
+    assert not state_path.exists()
+
+    # A second pass over the same transcripts is served from the cache without a new batch.
+    rerun = run_summary_batch(
+        _items(tmp_path, 3)[::2],
+        api_key="test-key",
+        apply=lambda item, summary: None,
+        fallback=lambda transcript_path: {},
+        state_path=state_path,
+        cache=cache,
+    )
+    assert rerun["cached"] == 2
+    assert len(batch_server.created) == 1
+
+
+def test_run_summary_batch_reattaches_to_in_flight_batch_after_interrupt(batch_server, tmp_path: Path) -> None:
+    batch_server.polls_before_end = 2
+    state_path = tmp_path / "state.json"
+    applied: list[str] = []
+
+    def _interrupt(_: float) -> None:
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        run_summary_batch(
+            _items(tmp_path, 2),
+            api_key="test-key",
+            apply=lambda item, summary: applied.append(item.meeting_id),
+            fallback=lambda transcript_path: {},
+            state_path=state_path,
+            cache=None,
+            sleep=_interrupt,
+        )
+    state = json.loads(state_path.read_text(encoding="utf-8"))
+    assert state["batch_id"] == "msgbatch_001"
+    assert applied == []
+
+    report = run_summary_batch(
+        [],
+        api_key="test-key",
+        apply=lambda item, summary: applied.append(item.meeting_id),
+        fallback=lambda transcript_path: {},
+        state_path=state_path,
+        cache=None,
+        sleep=lambda _: None,
+    )
+
+    assert report["reattached_batch_id"] == "msgbatch_001"
+    assert sorted(applied) == ["m-0", "m-1"]
+    assert len(batch_server.created) == 1
+    assert not state_path.exists()
+
+
+def test_backfill_cli_batch_summary_mode_patches_notes_after_batch(
+    batch_server, monkeypatch, tmp_path: Path, capsys
+) -> None:
+    recordings = tmp_path / "recordings"
+    recordings.mkdir(parents=True, exist_ok=True)
+    vault = tmp_path / "vault"
+    vault.mkdir(parents=True, exist_ok=True)
+    (recordings / "20260208_0915-retro.wav").write_text("wav")
+    (recordings / "20260208_1015-planning.wav").write_text("wav")
+    monkeypatch.setenv("RECORDINGS_PATH", str(recordings))
+    monkeypatch.setenv("VAULT_PATH", str(vault))
+    monkeypatch.setenv("DEFAULT_MEETINGS_FOLDER", "meetings")
+    monkeypatch.setenv("MEETINGCTL_PROCESSED_JOBS_FILE", str(tmp_path / "processed.jsonl"))
+    monkeypatch.setenv("MEETINGCTL_PROCESSING_TRANSCRIBE_DRY_RUN", "1")
+    monkeypatch.setenv("MEETINGCTL_PROCESSING_CONVERT_DRY_RUN", "1")
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    monkeypatch.setattr("sys.argv", ["meetingctl", "backfill", "--process-now", "--summary-mode", "batch", "--json"])
+
+    assert cli.main() == 0
+    payload = json.loads(capsys.readouterr().out)
+
+    assert payload["processed_jobs"] == 2
+    assert payload["summary_mode"] == "batch"
+    # Both dry-run transcripts are identical, so the batch holds one request per note.
+    assert payload["summary_batch"]["submitted"] == 2
+    assert payload["summary_batch"]["applied"] == 2
+    assert len(batch_server.created) == 1
+    notes = sorted(vault.rglob("*.md"))
+    assert len(notes) == 2
+    for note in notes:
+        assert "Batch minutes: dry-run transcript" in note.read_text(encoding="utf-8")
+
+
+def test_backfill_cli_batch_resubmits_items_lost_before_submission(
+    batch_server, monkeypatch, tmp_path: Path, capsys
+) -> None:
+    recordings = tmp_path / "recordings"
+    recordings.mkdir(parents=True, exist_ok=True)
+    vault = tmp_path / "vault"
+    vault.mkdir(parents=True, exist_ok=True)
+    (recordings / "20260208_0915-retro.wav").write_text("wav")
+    (recordings / "20260208_1015-planning.wav").write_text("wav")
+    monkeypatch.setenv("RECORDINGS_PATH", str(recordings))
+    monkeypatch.setenv("VAULT_PATH", str(vault))
+    monkeypatch.setenv("DEFAULT_MEETINGS_FOLDER", "meetings")
+    monkeypatch.setenv("MEETINGCTL_PROCESSED_JOBS_FILE", str(tmp_path / "processed.jsonl"))
+    monkeypatch.setenv("MEETINGCTL_INGESTED_FILES_FILE", str(tmp_path / "ingested.jsonl"))
+    monkeypatch.setenv("MEETINGCTL_PROCESSING_TRANSCRIBE_DRY_RUN", "1")
+    monkeypatch.setenv("MEETINGCTL_PROCESSING_CONVERT_DRY_RUN", "1")
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    monkeypatch.setattr("sys.argv", ["meetingctl", "backfill", "--process-now", "--summary-mode", "batch", "--json"])
+
+    def _interrupted(*args, **kwargs):
+        raise KeyboardInterrupt
+
+    # Transcription and ingest logging finish, then the run dies before the batch is submitted.
+    with monkeypatch.context() as patched:
+        patched.setattr("meetingctl.summary_batch.create_summary_batch", _interrupted)
+        with pytest.raises(KeyboardInterrupt):
+            cli.main()
+    capsys.readouterr()
+    state = json.loads((tmp_path / "summary_batch.json").read_text(encoding="utf-8"))
+    assert len(state["pending"]) == 2
+    assert batch_server.created == []
+
+    assert cli.main() == 0
+    payload = json.loads(capsys.readouterr().out)
+
+    # The recordings themselves were already handled; only their summaries are resubmitted.
+    assert payload["processed_jobs"] == 0
+    assert payload["summary_batch"]["submitted"] == 2
+    assert payload["summary_batch"]["applied"] == 2
+    for note in sorted(vault.rglob("*.md")):
+        assert "Batch minutes: dry-run transcript" in note.read_text(encoding="utf-8")
+    assert not (tmp_path / "summary_batch.json").exists()
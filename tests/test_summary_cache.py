@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from meetingctl.summary_cache import SummaryCache, default_summary_cache, summarize_with_cache, summary_cache_key
+
+
+def _summary(minutes: str) -> dict[str, object]:
+    return {"minutes": minutes, "decisions": ["D"], "action_items": []}
+
+
+def test_summarize_with_cache_reuses_unchanged_transcript(tmp_path: Path) -> None:
+    cache = SummaryCache(tmp_path / "cache", max_bytes=1 << 20)
+    calls: list[str] = []
+
+    def _generate(transcript: str) -> dict[str, object]:
+        calls.append(transcript)
+        return _summary(f"minutes for {transcript}")
+
+    first = summarize_with_cache("hello", generate=_generate, cache=cache)
+    second = summarize_with_cache("hello", generate=_generate, cache=cache)
+    other = summarize_with_cache("hello!", generate=_generate, cache=cache)
+
+    assert "reused" not in first
+    assert second == {**first, "reused": True}
+    assert other["minutes"] == "minutes for hello!"
+    assert calls == ["hello", "hello!"]
+
+
+def test_summary_cache_key_tracks_model_and_max_tokens(monkeypatch) -> None:
+    base = summary_cache_key("hello")
+    monkeypatch.setenv("MEETINGCTL_SUMMARY_MODEL", "claude-other")
+    with_model = summary_cache_key("hello")
+    monkeypatch.setenv("MEETINGCTL_SUMMARY_MAX_TOKENS", "2048")
+    with_tokens = summary_cache_key("hello")
+
+    assert len({base, with_model, with_tokens}) == 3
+
+
+def test_summary_cache_evicts_least_recently_used_entries_by_size(tmp_path: Path) -> None:
+    cache = SummaryCache(tmp_path / "cache", max_bytes=1 << 20)
+    for index in range(3):
+        cache.put(f"key{index}", _summary("x" * 200))
+        os.utime(cache.root / f"key{index}.json", (1000 + index, 1000 + index))
+    entry_size = (cache.root / "key0.json").stat().st_size
+
+    assert cache.get("key0") is not None  # touch: key0 becomes most recently used
+    cache.max_bytes = entry_size * 2
+    cache.put("key3", _summary("x" * 200))
+
+    assert sorted(path.stem for path in cache.root.glob("*.json")) == ["key0", "key3"]
+
+
+def test_default_summary_cache_respects_env(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("MEETINGCTL_SUMMARY_CACHE_DIR", str(tmp_path / "c"))
+    monkeypatch.setenv("MEETINGCTL_SUMMARY_CACHE_MAX_MB", "0.5")
+    cache = default_summary_cache()
+    assert cache is not None
+    assert cache.root == tmp_path / "c"
+    assert cache.max_bytes == 512 * 1024
+
+    monkeypatch.setenv("MEETINGCTL_SUMMARY_CACHE", "0")
+    assert default_summary_cache() is None
+
+
+def test_cli_summary_from_transcript_marks_cached_summary_reused(monkeypatch, tmp_path: Path) -> None:
+    from meetingctl import cli
+
+    calls: list[str] = []
+
+    def _fake_generate(transcript: str, api_key: str, usage: dict[str, int] | None = None) -> dict[str, object]:
+        calls.append(transcript)
+        return _summary("Summary")
+
+    monkeypatch.delenv("MEETINGCTL_PROCESSING_SUMMARY_JSON", raising=False)
+    monkeypatch.setattr(cli, "generate_summary", _fake_generate)
+    transcript = tmp_path / "m-1.txt"
+    transcript.write_text("same words")
+
+    first = cli._summary_from_transcript(transcript)
+    second = cli._summary_from_transcript(transcript)
+
+    assert first.get("reused", False) is False
+    assert second["reused"] is True
+    assert second["minutes"] == "Summary"
+    assert calls == ["same words"]
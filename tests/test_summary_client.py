@@ -1,13 +1,25 @@
 from __future__ import annotations
 
+import asyncio
+from datetime import UTC, datetime, timedelta
+import json
 import sys
+import threading
 from types import ModuleType
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from meetingctl.summary_client import generate_summary
+from meetingctl import summary_client
+from meetingctl.summary_client import (
+    SummaryRateLimiter,
+    agenerate_summary,
+    generate_draft_summary,
+    generate_summary,
+    reset_summary_clients,
+    stream_summary,
+)
 
 
 @patch("meetingctl.summary_client.anthropic.Anthropic")
@@ -39,7 +51,7 @@ def test_generate_summary_sends_transcript_to_llm(mock_anthropic_class: MagicMoc
     # Check that transcript was sent
     messages = call_kwargs["messages"]
     assert len(messages) == 1
-    assert transcript in messages[0]["content"]
+    assert transcript in messages[0]["content"][0]["text"]
 
     # Verify result structure
     assert result["minutes"] == "Team discussed Q1 roadmap priorities."
@@ -382,6 +394,46 @@ def test_generate_summary_errors_when_all_models_not_found(
         generate_summary("Test transcript", api_key="test-key")
 
 
+@patch("meetingctl.summary_client.anthropic.Anthropic")
+def test_generate_summary_remembers_working_model_and_skips_missing_ones(
+    mock_anthropic_class: MagicMock, monkeypatch
+) -> None:
+    mock_client = MagicMock()
+    mock_client.api_key = "test-key"
+    mock_anthropic_class.return_value = mock_client
+    models: list[str] = []
+
+    def _create(**kwargs):
+        models.append(kwargs["model"])
+        if kwargs["model"] == "bad-model":
+            raise RuntimeError(
+                "Error code: 404 - {'type':'error','error':{'type':'not_found_error','message':'model: bad-model'}}"
+            )
+        response = MagicMock()
+        response.content = [SimpleNamespace(text='{"minutes":"ok","decisions":[],"action_items":[]}')]
+        return response
+
+    mock_client.messages.create.side_effect = _create
+    monkeypatch.setenv("MEETINGCTL_SUMMARY_MODEL", "bad-model,good-model")
+
+    generate_summary("First transcript", api_key="test-key")
+    generate_summary("Second transcript", api_key="test-key")
+    assert models == ["bad-model", "good-model", "good-model"]
+
+    # A new process (fresh skip set) starts from the persisted model instead of probing.
+    reset_summary_clients()
+    models.clear()
+    generate_summary("Third transcript", api_key="test-key")
+    assert models == ["good-model"]
+
+    # Expired memory falls back to the configured order.
+    reset_summary_clients()
+    models.clear()
+    monkeypatch.setenv("MEETINGCTL_SUMMARY_MODEL_MEMORY_TTL_SECONDS", "0")
+    generate_summary("Fourth transcript", api_key="test-key")
+    assert models == ["bad-model", "good-model"]
+
+
 @patch("meetingctl.summary_client.time.sleep")
 @patch("meetingctl.summary_client.anthropic.Anthropic")
 def test_generate_summary_retries_transient_overloaded_error(
@@ -506,3 +558,434 @@ def test_generate_summary_extracts_minutes_from_truncated_jsonish_repair(
     assert result["minutes"] == "## Meeting Details\n- Detail"
     assert result["decisions"] == []
     assert result["action_items"] == []
+
+
+def test_chunk_transcript_breaks_between_speaker_turns_under_budget() -> None:
+    turns = [f"[00:0{i}:00-00:0{i}:30] SPEAKER_0{i % 2}: " + " ".join(["talk"] * 150) for i in range(6)]
+    long_turn = "[00:09:00-00:12:00] SPEAKER_02: " + " ".join(["monologue"] * 800)
+    transcript = "\n".join([*turns, "", long_turn])
+
+    chunks = summary_client._chunk_transcript(transcript, 1000)
+
+    budget_chars = 1000 * summary_client._CHARS_PER_TOKEN
+    assert all(len(chunk) <= budget_chars for chunk in chunks)
+    lines = [line for chunk in chunks for line in chunk.splitlines()]
+    assert lines[:6] == turns
+    assert all(line.startswith("[00:09:00-00:12:00] SPEAKER_02: monologue") for line in lines[6:])
+    assert sum(line.count("monologue") for line in lines[6:]) == 800
+
+
+@patch("meetingctl.summary_client.anthropic.Anthropic")
+def test_generate_summary_map_reduces_long_transcripts_concurrently(
+    mock_anthropic_class: MagicMock,
+    monkeypatch,
+) -> None:
+    monkeypatch.setenv("MEETINGCTL_SUMMARY_CHUNK_TOKENS", "1000")
+    monkeypatch.setenv("MEETINGCTL_SUMMARY_MAX_CONCURRENCY", "3")
+    # The synthetic turns are repetition loops; keep them intact to exercise chunking.
+    monkeypatch.setenv("MEETINGCTL_SUMMARY_COMPACT_TRANSCRIPT", "0")
+    mock_client = MagicMock()
+    mock_anthropic_class.return_value = mock_client
+    transcript = "\n".join(
+        f"[00:{i:02d}:00-00:{i:02d}:59] SPEAKER_0{i % 3}: " + " ".join([f"topic{i}"] * 180) for i in range(9)
+    )
+    # All three map calls must be in flight together for the barrier to release.
+    barrier = threading.Barrier(3, timeout=5)
+    prompts: list[str] = []
+
+    def _create(**kwargs):
+        prompt = kwargs["messages"][0]["content"][0]["text"]
+        prompts.append(prompt)
+        if "Partial summaries" in prompt:
+            text = json.dumps({"minutes": "Merged minutes", "decisions": ["D1", "D2", "D3"], "action_items": []})
+        else:
+            barrier.wait()
+            part = prompt.split("part ", 1)[1].split(" of", 1)[0]
+            text = json.dumps({"minutes": f"Part {part}", "decisions": [f"D{part}"], "action_items": []})
+        return SimpleNamespace(content=[SimpleNamespace(text=text)])
+
+    mock_client.messages.create.side_effect = _create
+
+    result = generate_summary(transcript, api_key="test-key")
+
+    assert result == {"minutes": "Merged minutes", "decisions": ["D1", "D2", "D3"], "action_items": []}
+    map_prompts = [prompt for prompt in prompts if "Transcript part:" in prompt]
+    reduce_prompts = [prompt for prompt in prompts if "Partial summaries" in prompt]
+    assert len(map_prompts) == 3
+    assert len(reduce_prompts) == 1
+    assert '"minutes": "Part 1"' in reduce_prompts[0]
+    assert reduce_prompts[0].index("Part 1") < reduce_prompts[0].index("Part 2") < reduce_prompts[0].index("Part 3")
+    for prompt in map_prompts:
+        body = prompt.split("Transcript part:\n", 1)[1].split("\n\nRespond with", 1)[0]
+        assert all(line in transcript.splitlines() for line in body.splitlines())
+
+
+@patch("meetingctl.summary_client.subprocess.run")
+@patch("meetingctl.summary_client.anthropic.Anthropic")
+def test_generate_summary_pools_client_and_caches_secret_with_ttl(
+    mock_anthropic_class: MagicMock,
+    mock_subprocess_run: MagicMock,
+    monkeypatch,
+) -> None:
+    mock_subprocess_run.return_value = SimpleNamespace(stdout="resolved-key\n")
+    mock_client = MagicMock()
+    mock_anthropic_class.return_value = mock_client
+    mock_client.messages.create.return_value = SimpleNamespace(
+        content=[SimpleNamespace(text='{"minutes":"ok","decisions":[],"action_items":[]}')]
+    )
+    monkeypatch.setenv("MEETINGCTL_SUMMARY_SECRET_TTL_SECONDS", "600")
+    clock = [1000.0]
+    monkeypatch.setattr(summary_client.time, "monotonic", lambda: clock[0])
+
+    for _ in range(3):
+        generate_summary("Test", api_key="op://Private/Anthropic/api_key")
+
+    assert mock_subprocess_run.call_count == 1
+    assert mock_anthropic_class.call_count == 1
+    assert mock_client.messages.create.call_count == 3
+
+    clock[0] += 601
+    generate_summary("Test", api_key="op://Private/Anthropic/api_key")
+    assert mock_subprocess_run.call_count == 2
+    assert mock_anthropic_class.call_count == 1
+
+    mock_subprocess_run.return_value = SimpleNamespace(stdout="rotated-key\n")
+    clock[0] += 601
+    generate_summary("Test", api_key="op://Private/Anthropic/api_key")
+    assert mock_anthropic_class.call_count == 2
+    assert mock_anthropic_class.call_args.kwargs["api_key"] == "rotated-key"
+
+
+def test_summary_rate_limiter_paces_requests_and_honours_server_headers() -> None:
+    clock = [100.0]
+    limiter = SummaryRateLimiter(requests_per_minute=60, burst=2, clock=lambda: clock[0])
+
+    assert [limiter.reserve() for _ in range(4)] == [0.0, 0.0, 1.0, 2.0]
+
+    clock[0] += 10
+    limiter.observe_headers({"retry-after": "7"})
+    assert limiter.reserve() == pytest.approx(7.0)
+
+    clock[0] += 20
+    reset = (datetime.now(UTC) + timedelta(seconds=30)).isoformat().replace("+00:00", "Z")
+    limiter.observe_headers(
+        {"anthropic-ratelimit-requests-remaining": "12", "anthropic-ratelimit-requests-reset": reset}
+    )
+    assert limiter.reserve() == 0.0
+    limiter.observe_headers(
+        {"anthropic-ratelimit-tokens-remaining": "0", "anthropic-ratelimit-tokens-reset": reset}
+    )
+    assert 25.0 < limiter.reserve() <= 30.0
+
+
+class _RateLimited(Exception):
+    def __init__(self) -> None:
+        super().__init__("Error code: 429 - {'type': 'error', 'error': {'type': 'rate_limit_error'}}")
+        self.response = SimpleNamespace(headers={"retry-after": "0.05"})
+
+
+@patch("meetingctl.summary_client.anthropic.AsyncAnthropic")
+def test_agenerate_summary_runs_meetings_concurrently_with_shared_backoff(
+    mock_async_anthropic_class: MagicMock,
+) -> None:
+    in_flight = 0
+    peak = 0
+    calls: list[str] = []
+
+    async def _create(**kwargs):
+        nonlocal in_flight, peak
+        prompt = kwargs["messages"][0]["content"][0]["text"]
+        calls.append(prompt)
+        if len(calls) == 1:
+            raise _RateLimited()
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.02)
+        in_flight -= 1
+        meeting = prompt.split("Transcript:\n", 1)[1].split("\n", 1)[0]
+        text = json.dumps({"minutes": f"Minutes for {meeting}", "decisions": [], "action_items": []})
+        return SimpleNamespace(
+            headers={"anthropic-ratelimit-requests-remaining": "40"},
+            parse=lambda: SimpleNamespace(content=[SimpleNamespace(text=text)]),
+        )
+
+    mock_client = MagicMock()
+    mock_client.messages.with_raw_response.create.side_effect = _create
+    mock_async_anthropic_class.return_value = mock_client
+    limiter = SummaryRateLimiter(requests_per_minute=6000, burst=10)
+
+    async def _run() -> list[dict[str, object]]:
+        return await asyncio.gather(
+            *(agenerate_summary(f"meeting-{i}", api_key="test-key", limiter=limiter) for i in range(5))
+        )
+
+    results = asyncio.run(_run())
+
+    assert [result["minutes"] for result in results] == [f"Minutes for meeting-{i}" for i in range(5)]
+    assert len(calls) == 6
+    assert peak > 1
+    assert mock_async_anthropic_class.call_count == 1
+
+
+@patch("meetingctl.summary_client.anthropic.AsyncAnthropic")
+def test_agenerate_summary_remembers_models_off_loop_without_losing_updates(
+    mock_async_anthropic_class: MagicMock,
+) -> None:
+    write_threads: set[int] = set()
+    remember = summary_client._remember_model
+
+    def _tracking_remember(fingerprint: str, model: str) -> None:
+        write_threads.add(threading.get_ident())
+        remember(fingerprint, model)
+
+    async def _create(**kwargs):
+        await asyncio.sleep(0.01)
+        text = json.dumps({"minutes": "ok", "decisions": [], "action_items": []})
+        return SimpleNamespace(
+            headers={},
+            parse=lambda: SimpleNamespace(content=[SimpleNamespace(text=text)]),
+        )
+
+    def _client(**kwargs):
+        client = MagicMock()
+        client.api_key = kwargs["api_key"]
+        client.messages.with_raw_response.create.side_effect = _create
+        return client
+
+    mock_async_anthropic_class.side_effect = _client
+    limiter = SummaryRateLimiter(requests_per_minute=6000, burst=20)
+    keys = [f"key-{i}" for i in range(8)]
+
+    async def _run() -> int:
+        await asyncio.gather(
+            *(agenerate_summary(f"meeting {key}", api_key=key, limiter=limiter) for key in keys)
+        )
+        return threading.get_ident()
+
+    with patch("meetingctl.summary_client._remember_model", side_effect=_tracking_remember):
+        loop_thread = asyncio.run(_run())
+
+    state = json.loads(summary_client.summary_model_state_file().read_text(encoding="utf-8"))
+    assert set(state) == {summary_client._api_key_fingerprint(SimpleNamespace(api_key=key)) for key in keys}
+    assert write_threads and loop_thread not in write_threads
+
+
+@patch("meetingctl.summary_client.anthropic.Anthropic")
+def test_generate_summary_caches_transcript_prefix_and_repairs_as_continuation(
+    mock_anthropic_class: MagicMock,
+    monkeypatch,
+) -> None:
+    mock_client = MagicMock()
+    mock_anthropic_class.return_value = mock_client
+    mock_client.messages.create.side_effect = [
+        SimpleNamespace(
+            content=[SimpleNamespace(text="Not JSON output")],
+            usage=SimpleNamespace(
+                input_tokens=40, output_tokens=30, cache_creation_input_tokens=1200, cache_read_input_tokens=0
+            ),
+        ),
+        SimpleNamespace(
+            content=[SimpleNamespace(text='{"minutes":"Recovered","decisions":[],"action_items":[]}')],
+            usage=SimpleNamespace(
+                input_tokens=25, output_tokens=20, cache_creation_input_tokens=0, cache_read_input_tokens=1200
+            ),
+        ),
+    ]
+    usage: dict[str, int] = {}
+
+    generate_summary("Alice: ship it", api_key="test-key", usage=usage)
+
+    summary_call, repair_call = (call.kwargs for call in mock_client.messages.create.call_args_list)
+    assert "Formatting rules:" in summary_call["system"][0]["text"]
+    transcript_block = summary_call["messages"][0]["content"][0]
+    assert "Alice: ship it" in transcript_block["text"]
+    assert "Formatting rules:" not in transcript_block["text"]
+    assert transcript_block["cache_control"] == {"type": "ephemeral"}
+    # The repair resends the cached prefix unchanged and continues the conversation.
+    assert repair_call["system"] == summary_call["system"]
+    assert repair_call["tools"] == summary_call["tools"]
+    assert repair_call["messages"][0] == summary_call["messages"][0]
+    assert repair_call["messages"][1] == {"role": "assistant", "content": "Not JSON output"}
+    assert repair_call["messages"][2]["role"] == "user"
+    assert "not valid JSON" in repair_call["messages"][2]["content"]
+    assert usage == {
+        "requests": 2,
+        "repairs": 1,
+        "input_tokens": 65,
+        "output_tokens": 50,
+        "cache_creation_input_tokens": 1200,
+        "cache_read_input_tokens": 1200,
+        "transcript_tokens_estimate": 4,
+        "compacted_tokens_estimate": 4,
+    }
+
+    monkeypatch.setenv("MEETINGCTL_SUMMARY_PROMPT_CACHE", "0")
+    mock_client.messages.create.side_effect = None
+    mock_client.messages.create.return_value = SimpleNamespace(
+        content=[SimpleNamespace(text='{"minutes":"ok","decisions":[],"action_items":[]}')]
+    )
+    generate_summary("Alice: ship it", api_key="test-key")
+    assert "Alice: ship it" in mock_client.messages.create.call_args.kwargs["messages"][0]["content"]
+
+
+@patch("meetingctl.summary_client.anthropic.Anthropic")
+def test_generate_summary_compacts_diarized_transcript_and_reports_token_estimates(
+    mock_anthropic_class: MagicMock,
+) -> None:
+    mock_client = MagicMock()
+    mock_anthropic_class.return_value = mock_client
+    mock_client.messages.create.return_value = SimpleNamespace(
+        content=[SimpleNamespace(text='{"minutes":"ok","decisions":[],"action_items":[]}')]
+    )
+    transcript = "\n".join(
+        [
+            "[00:00:00-00:00:04] SPEAKER_00: Um, the plan is to ship Friday.",
+            "[00:00:04-00:00:05] SPEAKER_01: Mm-hmm.",
+            "[00:00:05-00:00:09] SPEAKER_00: Uh, we still need QA sign-off.",
+            "[00:00:09-00:00:30] SPEAKER_01: " + "Thank you. " * 12 + "I can run QA tomorrow.",
+            "[00:00:30-00:00:31] SPEAKER_01: I can run QA tomorrow.",
+        ]
+    )
+    usage: dict[str, int] = {}
+
+    generate_summary(transcript, api_key="test-key", usage=usage)
+
+    sent = mock_client.messages.create.call_args.kwargs["messages"][0]["content"][0]["text"]
+    assert sent.split("Transcript:\n", 1)[1].strip() == (
+        "SPEAKER_00: the plan is to ship Friday. we still need QA sign-off.\n"
+        "SPEAKER_01: Thank you. I can run QA tomorrow. I can run QA tomorrow."
+    )
+    assert usage["transcript_tokens_estimate"] > 2 * usage["compacted_tokens_estimate"]
+
+
+@patch("meetingctl.summary_client.anthropic.Anthropic")
+def test_generate_summary_requests_tool_output_and_skips_repair(
+    mock_anthropic_class: MagicMock,
+    monkeypatch,
+) -> None:
+    mock_client = MagicMock()
+    mock_anthropic_class.return_value = mock_client
+    mock_client.messages.create.return_value = SimpleNamespace(
+        content=[
+            SimpleNamespace(
+                type="tool_use",
+                name="record_meeting_summary",
+                input={
+                    "minutes": "- Shipped the release",
+                    "decisions": ["Ship Friday"],
+                    "action_items": ["Owner: Alice; Task: Run QA; Due: TBD"],
+                },
+            )
+        ]
+    )
+    usage: dict[str, int] = {}
+
+    result = generate_summary("Alice: ship it", api_key="test-key", usage=usage)
+
+    assert result == {
+        "minutes": "- Shipped the release",
+        "decisions": ["Ship Friday"],
+        "action_items": ["Owner: Alice; Task: Run QA; Due: TBD"],
+    }
+    call_kwargs = mock_client.messages.create.call_args.kwargs
+    assert call_kwargs["tools"][0]["name"] == "record_meeting_summary"
+    assert call_kwargs["tool_choice"] == {"type": "tool", "name": "record_meeting_summary"}
+    assert mock_client.messages.create.call_count == 1
+    assert usage.get("repairs", 0) == 0
+
+    monkeypatch.setenv("MEETINGCTL_SUMMARY_OUTPUT_MODE", "text")
+    mock_client.messages.create.return_value = SimpleNamespace(
+        content=[SimpleNamespace(text='{"minutes":"ok","decisions":[],"action_items":[]}')]
+    )
+    generate_summary("Alice: ship it", api_key="test-key")
+    assert "tools" not in mock_client.messages.create.call_args.kwargs
+
+
+@patch("meetingctl.summary_client.anthropic.Anthropic")
+def test_generate_draft_summary_uses_draft_model_and_token_cap(
+    mock_anthropic_class: MagicMock, monkeypatch
+) -> None:
+    mock_client = MagicMock()
+    mock_anthropic_class.return_value = mock_client
+    response = MagicMock()
+    response.content = [SimpleNamespace(text='{"minutes":"draft","decisions":[],"action_items":[]}')]
+    mock_client.messages.create.return_value = response
+    monkeypatch.setenv("MEETINGCTL_SUMMARY_DRAFT_MODEL", "claude-small")
+    monkeypatch.setenv("MEETINGCTL_SUMMARY_DRAFT_MAX_TOKENS", "600")
+    # Draft requests skip map-reduce even for transcripts above the chunk budget.
+    monkeypatch.setenv("MEETINGCTL_SUMMARY_CHUNK_TOKENS", "5")
+
+    result = generate_draft_summary("A long enough transcript to exceed the chunk budget.", api_key="test-key")
+
+    assert result["minutes"] == "draft"
+    assert mock_client.messages.create.call_count == 1
+    kwargs = mock_client.messages.create.call_args.kwargs
+    assert kwargs["model"] == "claude-small"
+    assert kwargs["max_tokens"] == 600
+    assert "quick first draft" in kwargs["system"][0]["text"]
+
+
+@patch("meetingctl.summary_client.anthropic.Anthropic")
+def test_stream_summary_reports_partial_minutes_from_tool_input(mock_anthropic_class: MagicMock) -> None:
+    mock_client = MagicMock()
+    mock_anthropic_class.return_value = mock_client
+    fragments = ['{"minutes": "- Kick', 'off\\n- Budget', '", "decisions": ["Ship"], ', '"action_items": []}']
+    events = [
+        SimpleNamespace(type="content_block_delta", delta=SimpleNamespace(type="input_json_delta", partial_json=part))
+        for part in fragments
+    ]
+    final = MagicMock()
+    final.content = [
+        SimpleNamespace(
+            type="tool_use",
+            name="record_meeting_summary",
+            input={"minutes": "- Kickoff\n- Budget", "decisions": ["Ship"], "action_items": []},
+        )
+    ]
+    stream = MagicMock()
+    stream.__iter__.return_value = iter(events)
+    stream.get_final_message.return_value = final
+    mock_client.messages.stream.return_value.__enter__.return_value = stream
+    seen: list[str] = []
+
+    result = stream_summary("Transcript", api_key="test-key", on_minutes=seen.append)
+
+    assert seen == ["- Kick", "- Kickoff\n- Budget"]
+    assert result["minutes"] == "- Kickoff\n- Budget"
+    assert result["decisions"] == ["Ship"]
+    assert mock_client.messages.stream.call_args.kwargs["tool_choice"]["name"] == "record_meeting_summary"
+
+
+@patch("meetingctl.summary_client.time.sleep")
+@patch("meetingctl.summary_client.anthropic.Anthropic")
+def test_stream_summary_retries_transient_errors_and_decodes_escapes(
+    mock_anthropic_class: MagicMock, mock_sleep: MagicMock
+) -> None:
+    mock_client = MagicMock()
+    mock_anthropic_class.return_value = mock_client
+    encoded = json.dumps({"minutes": 'Path C:\\tmp\tcaf\u00e9 "ok"', "decisions": [], "action_items": []})
+    # Split inside the \\u escape and between the backslash and its escaped character.
+    cut = encoded.index("\\u00e9") + 3
+    fragments = [encoded[:20], encoded[20:cut], encoded[cut:]]
+    stream = MagicMock()
+    stream.__iter__.return_value = iter(
+        SimpleNamespace(type="content_block_delta", delta=SimpleNamespace(type="text_delta", text=part))
+        for part in fragments
+    )
+    stream.get_final_message.return_value = SimpleNamespace(content=[SimpleNamespace(text=encoded)])
+    overloaded = MagicMock()
+    overloaded.__enter__.side_effect = RuntimeError(
+        "Error code: 529 - {'type':'error','error':{'type':'overloaded_error','message':'Overloaded'}}"
+    )
+    succeeded = MagicMock()
+    succeeded.__enter__.return_value = stream
+    mock_client.messages.stream.side_effect = [overloaded, succeeded]
+    seen: list[str] = []
+
+    result = stream_summary("Transcript", api_key="test-key", on_minutes=seen.append)
+
+    assert mock_client.messages.stream.call_count == 2
+    mock_sleep.assert_called_once()
+    assert seen[-1] == 'Path C:\\tmp\tcaf\u00e9 "ok"'
+    assert all("\\u" not in partial for partial in seen)
+    assert result["minutes"] == 'Path C:\\tmp\tcaf\u00e9 "ok"'
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from meetingctl.transcript_compaction import collapse_repetition_loops, compact_transcript, strip_filler
+
+
+def test_collapse_repetition_loops_keeps_one_copy_of_looping_phrases() -> None:
+    assert collapse_repetition_loops("Thank you. Thank you. Thank you. Thank you.") == "Thank you."
+    assert collapse_repetition_loops("I'm going to I'm going to I'm going to check") == "I'm going to check"
+    # Two repeats are normal speech and survive.
+    assert collapse_repetition_loops("no, no, we ship Friday") == "no, no, we ship Friday"
+
+
+def test_strip_filler_removes_disfluencies_but_not_content_words() -> None:
+    assert strip_filler("Um, so we, uh, like the hmm design.") == "so we, like the design."
+    assert strip_filler("The humming umbrella is 5 mm wide.") == "The humming umbrella is 5 mm wide."
+
+
+def test_compact_transcript_drops_repeated_baseline_lines() -> None:
+    baseline = "We reviewed the budget.\nThanks for watching!\nThanks for watching!\n\nNext item is hiring."
+
+    assert compact_transcript(baseline) == "We reviewed the budget.\nThanks for watching!\nNext item is hiring."
+
+
+def test_compact_transcript_keeps_short_replies_and_collapses_loops_across_turns() -> None:
+    transcript = "\n".join(
+        [
+            "[00:00:01-00:00:04] SPEAKER_00: So we agreed, okay.",
+            "[00:00:05-00:00:05] SPEAKER_00: Okay.",
+            "[00:00:06-00:00:06] SPEAKER_00: Okay.",
+            "[00:00:07-00:00:08] SPEAKER_01: Thank you. Thank you.",
+            "[00:00:09-00:00:09] SPEAKER_01: Thank you.",
+            "[00:00:10-00:00:10] SPEAKER_01: Um, bye.",
+        ]
+    )
+
+    assert compact_transcript(transcript) == (
+        "SPEAKER_00: So we agreed, okay. Okay.\nSPEAKER_01: Thank you. bye."
+    )
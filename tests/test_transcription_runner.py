@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import gzip
 import json
+import os
 from pathlib import Path
 import shutil
 import subprocess
@@ -16,6 +18,8 @@ from meetingctl.transcription import (
     WhisperTranscriptionRunner,
     WhisperXTranscriptionRunner,
     create_transcription_runner,
+    load_transcript_json,
+    promote_artifact,
 )
 
 
@@ -227,6 +231,49 @@ def test_sidecar_runner_promotes_diarized_outputs(tmp_path: Path) -> None:
     assert transcript_path.with_name("m-abc123.diarized.json").exists()
 
 
+def test_load_transcript_json_accepts_pretty_compact_ndjson_and_gzip(tmp_path: Path) -> None:
+    payload = {"language": "en", "segments": [{"start": 0.0, "end": 1.0, "text": "hi"}, {"text": "there"}]}
+    ndjson = "\n".join(
+        [
+            json.dumps({"format": "meetingctl-transcript-ndjson/1", "language": "en"}),
+            *(json.dumps(segment) for segment in payload["segments"]),
+        ]
+    )
+    variants = {
+        "pretty.json": json.dumps(payload, indent=2).encode("utf-8"),
+        "compact.json": json.dumps(payload, separators=(",", ":")).encode("utf-8"),
+        "ndjson.json": ndjson.encode("utf-8"),
+        "ndjson-gzip.json": gzip.compress(ndjson.encode("utf-8")),
+        "compact-gzip.json": gzip.compress(json.dumps(payload).encode("utf-8")),
+    }
+    for name, data in variants.items():
+        path = tmp_path / name
+        path.write_bytes(data)
+        assert load_transcript_json(path) == payload, name
+
+    bad = tmp_path / "list.json"
+    bad.write_text("[1, 2]")
+    with pytest.raises(ValueError):
+        load_transcript_json(bad)
+
+
+def test_sidecar_runner_rejects_existing_transcript_json_without_segments(tmp_path: Path) -> None:
+    wav = tmp_path / "audio.wav"
+    wav.write_text("dummy")
+    transcript_path = tmp_path / "out" / "m-abc123.txt"
+    transcript_path.parent.mkdir(parents=True, exist_ok=True)
+    transcript_path.with_suffix(".json").write_text('{"segments": []}')
+    calls: list[list[str]] = []
+    runner = SidecarDiarizationTranscriptionRunner(
+        script_path="/tmp/diarize_sidecar.sh",
+        runner=lambda args, check=True: calls.append(args),
+    )
+
+    with pytest.raises(TranscriptionError, match="without JSON segments"):
+        runner.diarize_existing_transcript(wav_path=wav, transcript_path=transcript_path)
+    assert calls == []
+
+
 def test_sidecar_runner_can_diarize_existing_transcript_json(tmp_path: Path) -> None:
     wav = tmp_path / "audio.wav"
     wav.write_text("dummy")
@@ -414,3 +461,31 @@ def test_create_transcription_runner_selects_sidecar_backend(monkeypatch) -> Non
     runner = create_transcription_runner()
 
     assert isinstance(runner, PreferDiarizedTranscriptionRunner)
+
+
+def test_promote_artifact_links_or_copies_atomically(tmp_path: Path) -> None:
+    source = tmp_path / "job" / "transcript.json"
+    source.parent.mkdir()
+    source.write_text('{"segments": []}')
+
+    copied = tmp_path / "out" / "m-1.json"
+    assert promote_artifact(source, copied, link_mode="copy") == "copy"
+    assert copied.read_text() == source.read_text()
+    assert not os.path.samefile(source, copied)
+
+    linked = tmp_path / "out" / "m-1.diarized.json"
+    linked.write_text("stale")
+    assert promote_artifact(source, linked, link_mode="hardlink") in {"reflink", "hardlink"}
+    assert linked.read_text() == source.read_text()
+
+    auto = tmp_path / "out" / "m-2.json"
+    assert promote_artifact(source, auto, link_mode="auto") in {"reflink", "copy"}
+    assert not os.path.samefile(source, auto)
+
+    with pytest.raises(FileNotFoundError):
+        promote_artifact(tmp_path / "missing.json", tmp_path / "out" / "m-3.json")
+    assert sorted(path.name for path in (tmp_path / "out").iterdir()) == [
+        "m-1.diarized.json",
+        "m-1.json",
+        "m-2.json",
+    ]